@@ -0,0 +1,213 @@
+"""Batched text annotations of table-like plots."""
+
+from __future__ import annotations
+
+import typing as ty
+
+import numpy as np
+from matplotlib.artist import Artist
+from matplotlib.backends.backend_agg import RendererAgg
+from matplotlib.colors import to_rgba, to_rgba_array
+from matplotlib.font_manager import FontProperties
+from matplotlib.text import Text
+from matplotlib.transforms import Bbox, IdentityTransform
+
+CELL_TEXT_SHAPE_ERROR = "Cell text must be a two-dimensional array."
+CELL_COLOR_SHAPE_ERROR = "Cell text colors must be a single color or match the shape of the text."
+
+# coefficients of the perceived brightness, see `koyo.visuals.find_text_color`
+BRIGHTNESS_COEFFICIENTS = np.array((0.241, 0.691, 0.068))
+BRIGHTNESS_THRESHOLD = 130
+
+
+def find_text_colors(
+    base_colors: np.ndarray,
+    dark_color: str = "black",
+    light_color: str = "white",
+) -> np.ndarray:
+    """Return light or dark RGBA text color for each of the (..., 4) background colors."""
+    base_colors = np.asarray(base_colors, dtype=float)
+    brightness = np.sqrt(np.dot((base_colors[..., :3] * 255) ** 2, BRIGHTNESS_COEFFICIENTS))
+    return np.where(
+        (brightness > BRIGHTNESS_THRESHOLD)[..., None],
+        to_rgba(dark_color),
+        to_rgba(light_color),
+    )
+
+
+def format_cell_text(values: np.ndarray, fmt: str) -> np.ndarray:
+    """Format each value of the array using format specification, e.g. `.3f`, `d` or `.2%`."""
+    values = np.asarray(values)
+    text = [format(value, fmt) for value in values.ravel().tolist()]
+    return np.asarray(text, dtype=object).reshape(values.shape)
+
+
+class CellTextArtist(Artist):
+    """Text of every cell of a regular grid, drawn by a single artist.
+
+    Cell ``(row, column)`` is centered at ``(column + 0.5, row + 0.5)`` in data coordinates. By default, the text is
+    rasterized once into an image that is reused until the data, size of the cells, dpi or font change, so that
+    repaints do not lay out thousands of text objects. Set ``vector`` to draw the text as glyphs instead, e.g. when
+    exporting to vector formats. Cells that are too small to fit a line of text are left empty when
+    ``hide_overlapping`` is enabled.
+    """
+
+    zorder = 3
+
+    def __init__(
+        self,
+        text: np.ndarray,
+        colors: ty.Any = "k",
+        fontsize: ty.Any = "medium",
+        vector: bool = False,
+        hide_overlapping: bool = True,
+        **kwargs: ty.Any,
+    ):
+        super().__init__()
+        self._text: np.ndarray = np.empty((0, 0), dtype=object)
+        self._colors: np.ndarray = np.empty((0, 0, 4))
+        self._version = 0
+        self._cache_key: tuple | None = None
+        self._cache: tuple[int, int, np.ndarray] | None = None
+        self._offscreen: RendererAgg | None = None
+        self.vector = vector
+        self.hide_overlapping = hide_overlapping
+        self.set_in_layout(False)
+        self._stamp = Text(0, 0, "", fontproperties=FontProperties(size=fontsize), ha="center", va="center", **kwargs)
+        self._stamp.set_transform(IdentityTransform())
+        self.set_data(text, colors)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Return number of rows and columns."""
+        return self._text.shape
+
+    def get_text(self) -> np.ndarray:
+        """Return text of each cell."""
+        return self._text
+
+    def get_colors(self) -> np.ndarray:
+        """Return RGBA color of the text of each cell."""
+        return self._colors
+
+    def set_data(self, text: np.ndarray, colors: ty.Any = None) -> None:
+        """Set text and optionally the colors of each cell."""
+        text = np.asarray(text, dtype=object)
+        if text.ndim != 2:
+            raise ValueError(CELL_TEXT_SHAPE_ERROR)
+        self._text = text
+        if colors is None:
+            colors = self._colors if self._colors.shape[:2] == text.shape else "k"
+        self.set_colors(colors)
+
+    def set_colors(self, colors: ty.Any) -> None:
+        """Set text color of each cell from a single color or (rows, columns, 4) array."""
+        if isinstance(colors, np.ndarray) and colors.ndim == 3:
+            if colors.shape[:2] != self._text.shape:
+                raise ValueError(CELL_COLOR_SHAPE_ERROR)
+            colors = np.asarray(colors, dtype=float)
+        else:
+            colors = to_rgba_array(colors)
+            if len(colors) != 1:
+                raise ValueError(CELL_COLOR_SHAPE_ERROR)
+            colors = np.broadcast_to(colors[0], (*self._text.shape, 4))
+        self._colors = colors
+        self.invalidate()
+
+    def set_fontsize(self, fontsize: ty.Any) -> None:
+        """Set font size of the text."""
+        self._stamp.set_fontsize(fontsize)
+        self.invalidate()
+
+    def set_vector(self, vector: bool) -> None:
+        """Set whether text is drawn as glyphs rather than as a cached image."""
+        self.vector = vector
+        self.stale = True
+
+    def invalidate(self) -> None:
+        """Discard the cached image."""
+        self._version += 1
+        self._cache_key = self._cache = None
+        self.stale = True
+
+    def get_window_extent(self, renderer: ty.Any = None) -> Bbox:
+        """Return extent of the grid in display coordinates."""
+        n_rows, n_cols = self.shape
+        return Bbox(self.get_transform().transform([[0, 0], [n_cols, n_rows]]))
+
+    def _get_visible_cells(self, renderer: ty.Any) -> tuple[np.ndarray, np.ndarray]:
+        """Return flat indices and display positions of cells that should be drawn."""
+        n_rows, n_cols = self.shape
+        if n_rows == 0 or n_cols == 0:
+            return np.empty(0, dtype=np.intp), np.empty((0, 2))
+        extent = self.get_window_extent(renderer)
+        if self.hide_overlapping:
+            font_size = renderer.points_to_pixels(self._stamp.get_fontsize())
+            if abs(extent.height) / n_rows < font_size:
+                return np.empty(0, dtype=np.intp), np.empty((0, 2))
+        rows, cols = np.indices((n_rows, n_cols)).reshape(2, -1)
+        positions = self.get_transform().transform(np.c_[cols + 0.5, rows + 0.5])
+        mask = np.ones(len(positions), dtype=bool)
+        if self.axes is not None:
+            (x0, y0), (x1, y1) = self.axes.bbox.get_points()
+            mask = (positions[:, 0] >= x0) & (positions[:, 0] <= x1) & (positions[:, 1] >= y0) & (positions[:, 1] <= y1)
+        return np.flatnonzero(mask), positions[mask]
+
+    def _draw_cells(self, renderer: ty.Any, indices: np.ndarray, positions: np.ndarray) -> None:
+        """Draw text of the specified cells by moving a single text object around."""
+        stamp = self._stamp
+        stamp.set_figure(self.figure)
+        text, colors = self._text.ravel(), self._colors.reshape(-1, 4)
+        for index, (x, y) in zip(indices.tolist(), positions.tolist()):
+            stamp.set_position((x, y))
+            stamp.set_text(text[index])
+            stamp.set_color(colors[index])
+            stamp.draw(renderer)
+
+    def _make_image(self, renderer: ty.Any) -> tuple[int, int, np.ndarray] | None:
+        """Return image of the text of visible cells, re-using the cached image when possible."""
+        clip = self.axes.bbox if self.axes is not None else self.figure.bbox
+        region = Bbox.intersection(self.get_window_extent(renderer).frozen(), clip)
+        if region is None or region.width < 1 or region.height < 1:
+            return None
+        x0, y0 = np.floor(region.p0).astype(int)
+        x1, y1 = np.ceil(region.p1).astype(int)
+        key = (
+            self._version,
+            renderer.dpi,
+            self._stamp.get_fontsize(),
+            (x0, y0, x1, y1),
+            tuple(np.round(self.get_window_extent(renderer).get_points().ravel(), 1)),
+        )
+        if key == self._cache_key:
+            return self._cache
+
+        width, height = x1 - x0, y1 - y0
+        offscreen = self._offscreen
+        if offscreen is None or (offscreen.width, offscreen.height, offscreen.dpi) != (width, height, renderer.dpi):
+            offscreen = self._offscreen = RendererAgg(width, height, renderer.dpi)
+        offscreen.clear()
+        indices, positions = self._get_visible_cells(renderer)
+        self._draw_cells(offscreen, indices, positions - (x0, y0))
+        # image rows start at the bottom of the image
+        image = np.asarray(offscreen.buffer_rgba())[::-1].copy()
+        self._cache_key, self._cache = key, (x0, y0, image)
+        return self._cache
+
+    def draw(self, renderer: ty.Any) -> None:
+        """Draw cell text."""
+        if not self.get_visible() or self._text.size == 0:
+            return
+        renderer.open_group("cell_text", self.get_gid())
+        if self.vector:
+            self._draw_cells(renderer, *self._get_visible_cells(renderer))
+        else:
+            cache = self._make_image(renderer)
+            if cache is not None:
+                x0, y0, image = cache
+                gc = renderer.new_gc()
+                gc.set_clip_rectangle(self.axes.bbox if self.axes is not None else None)
+                renderer.draw_image(gc, x0, y0, image)
+                gc.restore()
+        renderer.close_group("cell_text")
+        self.stale = False
@@ -0,0 +1,99 @@
+"""Scatter plots of many points drawn as density images."""
+
+from __future__ import annotations
+
+import typing as ty
+
+import matplotlib as mpl
+import numpy as np
+from matplotlib.artist import Artist
+from matplotlib.collections import PathCollection
+
+from qtextraplot.utils.density import DensityAggregator, density_to_rgba, lookup_table
+
+
+class DensityScatterArtist(Artist):
+    """Scatter points drawn as a density image of the visible region while too many of them are visible.
+
+    Whenever the view limits or size of the axes change, the points are aggregated at the resolution of the axes and
+    drawn as a colormapped image. Once few enough points are visible, the image is hidden and the visible points are
+    drawn by the ``markers`` collection instead, which must have a higher zorder so that it is drawn afterwards.
+    """
+
+    def __init__(self, aggregator: DensityAggregator, markers: PathCollection, cmap: str = "viridis"):
+        super().__init__()
+        self.aggregator = aggregator
+        self.markers = markers
+        self._colors: np.ndarray | None = None
+        self._lut = np.empty((0, 4), dtype=np.uint8)
+        self._cache_key: tuple | None = None
+        self._image: np.ndarray | None = None
+        self.set_in_layout(False)
+        self.set_zorder(markers.get_zorder() - 0.01)
+        self.set_cmap(cmap)
+
+    def set_cmap(self, cmap: str) -> None:
+        """Set colormap of the density image."""
+        self._lut = lookup_table(mpl.colormaps[cmap](np.linspace(0, 1, 256)))
+        self.invalidate()
+
+    def set_colors(self, colors: np.ndarray | None) -> None:
+        """Set (N, 4) color of each point, used when drawing individual markers."""
+        self._colors = colors
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Discard the aggregated image."""
+        self._cache_key = self._image = None
+        self.stale = True
+
+    def is_dense(self) -> bool:
+        """Return whether the points were drawn as a density image the last time."""
+        return self._image is not None
+
+    def _get_view(self) -> tuple[tuple[float, float, float, float], tuple[int, int]]:
+        """Return extent of the view and size of the axes in pixels."""
+        x_min, x_max = sorted(self.axes.get_xlim())
+        y_min, y_max = sorted(self.axes.get_ylim())
+        width, height = max(round(self.axes.bbox.width), 1), max(round(self.axes.bbox.height), 1)
+        return (x_min, x_max, y_min, y_max), (height, width)
+
+    def _update(self) -> None:
+        """Re-aggregate the points when the view changed."""
+        extent, shape = self._get_view()
+        key = (extent, shape, self.axes.xaxis_inverted(), self.axes.yaxis_inverted())
+        if key == self._cache_key:
+            return
+        self._cache_key = key
+        counts = self.aggregator.aggregate(extent, shape)
+        if self.aggregator.is_dense(counts):
+            # image rows start at the bottom of the axes
+            image = density_to_rgba(counts, self._lut)
+            if key[2]:
+                image = image[:, ::-1]
+            if key[3]:
+                image = image[::-1]
+            self._image = np.ascontiguousarray(image)
+            self.markers.set_visible(False)
+        else:
+            self._image = None
+            indices = self.aggregator.visible_indices(extent)
+            self.markers.set_offsets(np.c_[self.aggregator.x[indices], self.aggregator.y[indices]])
+            if self._colors is not None:
+                self.markers.set_color(self._colors[indices])
+            self.markers.set_visible(True)
+
+    def draw(self, renderer: ty.Any) -> None:
+        """Draw density image or update the markers."""
+        if not self.get_visible() or self.axes is None:
+            return
+        self._update()
+        if self._image is not None:
+            renderer.open_group("density_scatter", self.get_gid())
+            x0, y0 = np.round(self.axes.bbox.p0).astype(int)
+            gc = renderer.new_gc()
+            gc.set_clip_rectangle(self.axes.bbox)
+            renderer.draw_image(gc, x0, y0, self._image)
+            gc.restore()
+            renderer.close_group("density_scatter")
+        self.stale = False
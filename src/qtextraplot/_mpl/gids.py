@@ -27,3 +27,6 @@ class PlotIds:
     PLOT_2D_OUTLINE = get_short_hash()
 
     PLOT_1D_CENTROID_GID = get_short_hash()
+
+    # table plots
+    PLOT_CELL_TEXT_GID = get_short_hash()
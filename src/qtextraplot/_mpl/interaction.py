@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import typing as ty
 from contextlib import suppress
 
 import matplotlib.pyplot as plt
@@ -886,17 +887,28 @@ class ImageMPLInteraction(MPLInteraction):
             self._aspect_ratio = shape[0] / shape[1]
         else:
             self._aspect_ratio = 1.0
-
-    def get_motion_msg(self, evt) -> str:
-        """Parse motion event."""
-        x, y = int(evt.xdata), int(evt.ydata)
+        # last sampled pixel, reused while the cursor stays within the same pixel
+        self._sample_key: tuple[int, int] | None = None
+        self._sample_value: ty.Any = ""
+
+    def _get_value_at(self, x: int, y: int) -> ty.Any:
+        """Return image value at pixel (x, y) or empty string if it is outside of the image."""
+        if self._sample_key == (x, y):
+            return self._sample_value
         try:
-            z = self.arrays[0][y, x]
-        except (IndexError, AttributeError):
+            array = self.arrays[0]
+            z = array[y, x] if 0 <= y < array.shape[0] and 0 <= x < array.shape[1] else np.nan
+        except (IndexError, AttributeError, TypeError):
             z = np.nan
         if not isinstance(z, np.ndarray):
             z = "" if np.isnan(z) else z
-        msg = f"x={x} y={y} {z}"
+        self._sample_key, self._sample_value = (x, y), z
+        return z
+
+    def get_motion_msg(self, evt) -> str:
+        """Parse motion event."""
+        x, y = int(evt.xdata), int(evt.ydata)
+        msg = f"x={x} y={y} {self._get_value_at(x, y)}"
         return msg if not self._ctrl_key else f"[EXTRACT] {msg}"
 
     def parse_motion_evt(self, evt):
@@ -916,6 +928,7 @@ class ImageMPLInteraction(MPLInteraction):
         self.set_data_limits(data_limits)
         self.data_object = obj
         self.arrays = arrays
+        self._sample_key = None
 
     def calculate_new_limits(self, evt):
         """Calculate new limits."""
@@ -931,20 +944,14 @@ class ImageMPLInteraction(MPLInteraction):
         _aspect_ratio = get_aspect_ratio(_shape)
 
         # adjust the width of the plot if the aspect ratio is too high
-        if _aspect_ratio > self._aspect_ratio:
+        if _aspect_ratio > self._aspect_ratio > 0:
             x_center = get_center(_xmin, _xmax)
-            width = _shape[1]
-            while get_aspect_ratio([_shape[0], width]) > self._aspect_ratio:
-                width += 1
-            width /= 2
+            width = get_min_width_for_aspect_ratio(_shape[0], self._aspect_ratio) / 2
             xmin, xmax = x_center - width, x_center + width
         # adjust the height of the plot if the aspect ratio is too small
         elif _aspect_ratio < self._aspect_ratio:
             y_center = get_center(_ymin, _ymax)
-            height = _shape[0]
-            while get_aspect_ratio([height, _shape[1]]) < self._aspect_ratio:
-                height += 1
-            height /= 2
+            height = get_min_height_for_aspect_ratio(_shape[1], self._aspect_ratio) / 2
             ymin, ymax = y_center - height, y_center + height
         # ensures that we have square, rounded edges
         xmin, xmax, ymin, ymax = np.round([xmin, xmax, ymin, ymax]).astype(int)
@@ -962,6 +969,28 @@ def get_aspect_ratio(shape) -> float:
     return shape[0] / shape[1]
 
 
+def get_min_width_for_aspect_ratio(height: float, aspect_ratio: float) -> int:
+    """Return the smallest integer width for which `height / width` does not exceed the aspect ratio."""
+    width = max(int(np.ceil(height / aspect_ratio)), 1)
+    # correct for floating point error in the division
+    if width > 1 and get_aspect_ratio([height, width - 1]) <= aspect_ratio:
+        width -= 1
+    elif get_aspect_ratio([height, width]) > aspect_ratio:
+        width += 1
+    return width
+
+
+def get_min_height_for_aspect_ratio(width: float, aspect_ratio: float) -> int:
+    """Return the smallest integer height for which `height / width` is not below the aspect ratio."""
+    height = max(int(np.ceil(width * aspect_ratio)), 0)
+    # correct for floating point error in the multiplication
+    if height > 0 and get_aspect_ratio([height - 1, width]) >= aspect_ratio:
+        height -= 1
+    elif get_aspect_ratio([height, width]) < aspect_ratio:
+        height += 1
+    return height
+
+
 def round_values(*vals):
     """Round values to integers."""
     return np.round(vals).astype(np.int32)
@@ -5,40 +5,85 @@ from __future__ import annotations
 import typing as ty
 import warnings
 from contextlib import contextmanager, suppress
+from functools import lru_cache
 
 import matplotlib as mpl
-import matplotlib.cm as cm
 import matplotlib.patches as mpatches
 import matplotlib.pyplot as plt
 import numpy as np
 from koyo.utilities import get_min_max
-from koyo.visuals import find_text_color, get_intensity_formatter
+from koyo.visuals import get_intensity_formatter
+from matplotlib.artist import Artist
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
-from matplotlib.collections import LineCollection
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.colors import to_rgba_array
 from matplotlib.figure import Figure
 from qtextra.helpers import add_flash_animation, connect, make_h_layout
-from qtpy.QtCore import Qt, Signal
+from qtpy.QtCore import Qt, QTimer, Signal
+from qtpy.QtGui import QCloseEvent
 from qtpy.QtWidgets import QApplication, QSizePolicy, QWidget
 
+from qtextraplot._mpl.cell_text import CellTextArtist, find_text_colors, format_cell_text
+from qtextraplot._mpl.density import DensityScatterArtist
 from qtextraplot._mpl.gids import PlotIds
 from qtextraplot._mpl.interaction import ImageMPLInteraction, MPLInteraction
-
-try:
-    import seaborn as sns
-except ImportError:
-    sns = None
+from qtextraplot.utils.classification import ScoreHistogram, downsample_curve
+from qtextraplot.utils.density import DENSITY_THRESHOLD, DensityAggregator
+from qtextraplot.utils.distributions import GroupDistribution, summarize_distributions
+from qtextraplot.utils.patches import PatchGroup, coerce_rectangles, rectangle_vertices
 
 if ty.TYPE_CHECKING:
     import pandas as pd
 
 from loguru import logger
 
-try:
-    mpl.use("Qt5Agg")
-except Exception:  # noqa: BLE001
-    with suppress(Exception):
-        mpl.use("QtAgg")
-mpl.rcParams["agg.path.chunksize"] = 10000
+# maximum number of cached `tight_layout` results per figure
+TIGHT_LAYOUT_CACHE_SIZE = 32
+SUBPLOT_PARAMS = ("left", "right", "bottom", "top", "wspace", "hspace")
+# export formats where text is drawn as glyphs rather than as cached images
+VECTOR_FORMATS = ("eps", "pdf", "ps", "svg", "svgz")
+# number of uniform bins of calibration curves
+CALIBRATION_BINS = 10
+# arguments of distribution plots that are supported without seaborn
+AGGREGATE_DISTRIBUTION_KWARGS = ("x", "y", "order", "color")
+# width of each group of distribution plots and horizontal jitter of strip plots
+DISTRIBUTION_WIDTH = 0.8
+STRIP_JITTER = 0.1
+# arguments of seaborn heatmaps that have no effect on confusion matrices, since their cells are always annotated,
+# labelled and square
+IGNORED_HEATMAP_KWARGS = ("annot", "annot_kws", "fmt", "square", "xticklabels", "yticklabels")
+# percentiles used as color limits of `robust` heatmaps
+ROBUST_PERCENTILES = (2, 98)
+
+
+@lru_cache  # only call once
+def init_backend() -> None:
+    """Select the Qt backend and set global matplotlib options.
+
+    This is deferred until the first figure is created so that importing this module does not modify global
+    matplotlib state.
+    """
+    try:
+        mpl.use("Qt5Agg")
+    except Exception:  # noqa: BLE001
+        with suppress(Exception):
+            mpl.use("QtAgg")
+    mpl.rcParams["agg.path.chunksize"] = 10000
+
+
+def get_seaborn():
+    """Return the seaborn module, importing it on first use since it is slow to import."""
+    try:
+        import seaborn as sns
+    except ImportError:
+        raise ImportError("Seaborn is required for this function") from None  # noqa: TRY003
+    return sns
+
+
+def get_color_cycle(n: int) -> list:
+    """Return `n` colors from the current property cycle."""
+    colors = mpl.rcParams["axes.prop_cycle"].by_key().get("color", ["k"])
+    return [colors[i % len(colors)] for i in range(n)]
 
 
 def make_centroid_lines(x: np.ndarray, y: np.ndarray):
@@ -50,6 +95,71 @@ def make_centroid_lines(x: np.ndarray, y: np.ndarray):
     return lines
 
 
+def make_under_curve_vertices(
+    x: np.ndarray,
+    y: np.ndarray,
+    baseline: float = 0.0,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Make vertices of the polygon filling the area between the curve and the baseline.
+
+    The polygon starts on the baseline below the first point, follows the curve and returns to the baseline below the
+    last point. Non-finite values are placed on the baseline. When `out` is provided, vertices are written into it.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n == 0:
+        return np.empty((0, 2))
+    vertices = np.empty((n + 2, 2)) if out is None else out
+    vertices[1 : n + 1, 0] = x
+    vertices[1 : n + 1, 1] = np.where(np.isfinite(y), y, baseline)
+    vertices[0] = x[0], baseline
+    vertices[n + 1] = x[-1], baseline
+    return vertices
+
+
+def get_heatmap_limits(
+    values: np.ndarray,
+    vmin: float | None = None,
+    vmax: float | None = None,
+    center: float | None = None,
+    robust: bool = False,
+) -> tuple[float, float]:
+    """Return color limits of a heatmap, following the `vmin`, `vmax`, `center` and `robust` arguments of seaborn."""
+    values = np.ma.masked_invalid(values).compressed()
+    if vmin is None:
+        vmin = np.percentile(values, ROBUST_PERCENTILES[0]) if robust else values.min()
+    if vmax is None:
+        vmax = np.percentile(values, ROBUST_PERCENTILES[1]) if robust else values.max()
+    if center is not None:
+        # make the colormap symmetric around the center
+        vrange = max(vmax - center, center - vmin)
+        vmin, vmax = center - vrange, center + vrange
+    return float(vmin), float(vmax)
+
+
+class UnderCurveCollection(PolyCollection):
+    """Area under a curve that can be updated without re-creating the artist."""
+
+    def __init__(self, x: np.ndarray, y: np.ndarray, baseline: float = 0.0, **kwargs: ty.Any):
+        self.baseline = baseline
+        super().__init__([make_under_curve_vertices(x, y, baseline)], **kwargs)
+
+    def set_data(self, x: np.ndarray, y: np.ndarray) -> None:
+        """Update the curve, rewriting the existing vertex array when the number of points did not change."""
+        paths = self.get_paths()
+        n = len(x)
+        # closed polygon paths repeat the first vertex at the end
+        if n and len(paths) == 1 and len(paths[0].vertices) == n + 3:
+            vertices = paths[0].vertices
+            make_under_curve_vertices(x, y, self.baseline, out=vertices[:-1])
+            vertices[-1] = vertices[0]
+            self.stale = True
+        else:
+            self.set_verts([make_under_curve_vertices(x, y, self.baseline)])
+
+
 class PlotBase(QWidget):
     """Generic plot base."""
 
@@ -69,6 +179,7 @@ class PlotBase(QWidget):
     MPL_STYLE = "seaborn-v0_8-ticks"
 
     def __init__(self, parent, *_args: ty.Any, **kwargs: ty.Any) -> None:
+        init_backend()
         super().__init__(parent=parent)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
 
@@ -103,13 +214,26 @@ class PlotBase(QWidget):
         # Prepare for zoom
         self.zoom = None
         self._disable_repaint = False
+        # dirty flag, cleared whenever the canvas is actually drawn
         self._repaint = True
+        # deferred redraw; the timer is owned by the widget, so pending redraws are dropped when it is deleted
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setInterval(0)
+        self._repaint_timer.timeout.connect(self.flush_repaint)
         self._legend_visible = True
+        self._tight_layout_cache: dict[tuple, dict[str, float]] = {}
+        # artists excluded from full redraws and blitted on top of the cached background instead
+        self._animated_artists: list[Artist] = []
+        self._animated_background = None
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+        self.canvas.mpl_connect("resize_event", self._invalidate_animated_background)
 
         # obj containers
         self.text = []
         self.lines = []
         self.patch = []
+        self.patch_groups: dict[str, PatchGroup] = {}
         self.markers = []
         self.arrows = []
 
@@ -131,6 +255,46 @@ class PlotBase(QWidget):
         self.setup_new_zoom(ax, data_limits=extent, allow_extraction=False)
         self.store_plot_limits(extent, ax)
 
+    def plot_add_cell_text(
+        self,
+        text: np.ndarray,
+        colors: ty.Any = "k",
+        fontsize: ty.Any = "medium",
+        gid: str = PlotIds.PLOT_CELL_TEXT_GID,
+        ax: plt.Axes | None = None,
+    ) -> CellTextArtist:
+        """Annotate each cell of a (rows, columns) grid using a single cached artist."""
+        if ax is None:
+            ax = self.ax
+        artist = CellTextArtist(text, colors, fontsize=fontsize)
+        artist.set_gid(gid)
+        ax.add_artist(artist)
+        return artist
+
+    def get_cell_text(self, gid: str = PlotIds.PLOT_CELL_TEXT_GID) -> list[CellTextArtist]:
+        """Return cell text artists with the specified `gid`."""
+        return [artist for artist in self.figure.findobj(CellTextArtist, include_self=False) if artist.get_gid() == gid]
+
+    def get_density_scatter(self, gid: str = PlotIds.PLOT_1D_LINE_GID) -> list[DensityScatterArtist]:
+        """Return density scatter artists with the specified `gid`."""
+        return [
+            artist
+            for artist in self.figure.findobj(DensityScatterArtist, include_self=False)
+            if artist.get_gid() == gid
+        ]
+
+    @contextmanager
+    def _cell_text_as_vector(self, vector: bool = True) -> ty.Iterator[None]:
+        """Temporarily draw cell text as glyphs, e.g. when exporting to vector formats."""
+        artists = [artist for artist in self.figure.findobj(CellTextArtist) if not artist.vector] if vector else []
+        for artist in artists:
+            artist.set_vector(True)
+        try:
+            yield
+        finally:
+            for artist in artists:
+                artist.set_vector(False)
+
     def plot_precision_recall_fscore_support(
         self,
         scores: dict,
@@ -144,17 +308,11 @@ class PlotBase(QWidget):
         **kwargs,
     ):
         """Renders the classification report across each axis."""
-        cmap = cm.get_cmap(cmap).copy()
-        cmap.set_over(color=cmap_overcolor)
-        cmap.set_under(color=cmap_undercolor)
+        cmap = mpl.colormaps[cmap].with_extremes(over=cmap_overcolor, under=cmap_undercolor)
 
-        # Create display grid
-        cr_display = np.zeros((len(labels), len(scores)))
-
-        # For each class row, append columns for precision, recall, f1, and support
-        for idx, cls in enumerate(labels):
-            for jdx, metric in enumerate(scores):
-                cr_display[idx, jdx] = scores[metric][cls]
+        # Create display grid, where each class is a row and each metric is a column
+        cr_display = np.array([[scores[metric][cls] for metric in scores] for cls in labels], dtype=float)
+        cr_display = cr_display.reshape(len(labels), len(scores))
 
         # Set up the dimensions of the pcolormesh
         # NOTE: pcolormesh accepts grids that are (N+1,M+1)
@@ -173,21 +331,8 @@ class PlotBase(QWidget):
         self.ax.set_xticklabels(x_tick_labels, fontsize=text_fontsize)
         self.ax.set_yticklabels(y_tick_labels, fontsize=text_fontsize)
 
-        # Set data labels in the grid, enumerating over class, metric pairs
-        # NOTE: X and Y are one element longer than the classification report
-        # so skip the last element to label the grid correctly.
-        for x in X[:-1]:
-            for y in Y[:-1]:
-                # Extract the value and the text label
-                value = cr_display[x, y]
-
-                # Determine the grid and text colors
-                base_color = cmap(value)
-                text_color = find_text_color(base_color)
-
-                # Add the label to the middle of the grid
-                cx, cy = x + 0.5, y + 0.5
-                self.ax.text(cy, cx, f"{value:0.3f}", va="center", ha="center", color=text_color)
+        # Set data labels in the grid, with text color depending on the color of the cell
+        self.plot_add_cell_text(format_cell_text(cr_display, "0.3f"), find_text_colors(cmap(cr_display)))
 
         # Draw the heatmap with colors bounded by the min and max of the grid
         # NOTE: I do not understand why this is Y, X instead of X, Y it works
@@ -203,24 +348,69 @@ class PlotBase(QWidget):
         title: str = "Confusion Matrix",
         title_fontsize="large",
         text_fontsize="medium",
+        cmap: str = "Blues",
+        colorbar: bool = True,
         **kwargs,
     ):
-        """Plot confusion matrix."""
-        if not sns:
-            raise ImportError("Seaborn is required for this function")  # noqa: TRY003
+        """Plot confusion matrix as an image, with the true class in rows and the predicted class in columns.
+
+        Arguments of seaborn heatmaps are still accepted: `cbar` and `cbar_kws` control the colorbar, `linewidths` and
+        `linecolor` draw lines between cells, `mask` hides cells and `vmin`, `vmax`, `center` and `robust` set the color
+        limits. Other arguments are passed to `imshow`.
+        """
         ax = self.ax
+        colorbar = kwargs.pop("cbar", colorbar)
+        colorbar_kws = kwargs.pop("cbar_kws", None) or {}
+        linewidths = kwargs.pop("linewidths", 0)
+        linecolor = kwargs.pop("linecolor", "white")
+        mask = kwargs.pop("mask", None)
+        center, robust = kwargs.pop("center", None), kwargs.pop("robust", False)
+        for key in IGNORED_HEATMAP_KWARGS:
+            kwargs.pop(key, None)
+
+        matrix = np.asarray(matrix)
+        fraction = matrix / max(np.sum(matrix), 1)
         if which == "counts":
-            sns.heatmap(data=matrix, ax=ax, square=True, annot=True, fmt="d", **kwargs)
+            values, cell_text = matrix, format_cell_text(matrix, "d")
         elif which == "percentage":
-            sns.heatmap(data=matrix / np.sum(matrix), ax=ax, square=True, annot=True, fmt=".2%", **kwargs)
+            values, cell_text = fraction, format_cell_text(fraction, ".2%")
         else:
-            group_counts = [f"{value:0.0f}" for value in matrix.flatten()]
-            group_percentages = [f"{value:.2%}" for value in matrix.flatten() / np.sum(matrix)]
-            matrix_labels = [f"{v1}\n{v2}\n" for v1, v2 in zip(group_counts, group_percentages)]
-            matrix_labels = np.asarray(matrix_labels).reshape(matrix.shape)
-            sns.heatmap(matrix, ax=ax, square=True, annot=matrix_labels, fmt="")
+            values = matrix
+            cell_text = format_cell_text(matrix, "0.0f") + "\n" + format_cell_text(fraction, ".2%")
+        if mask is not None:
+            mask = np.asarray(mask, dtype=bool)
+            values = np.ma.masked_where(mask, values)
+            cell_text[mask] = ""
+        if center is not None or robust:
+            kwargs["vmin"], kwargs["vmax"] = get_heatmap_limits(
+                values,
+                kwargs.get("vmin"),
+                kwargs.get("vmax"),
+                center=center,
+                robust=robust,
+            )
+
+        n_rows, n_cols = matrix.shape
+        image = ax.imshow(
+            values,
+            cmap=cmap,
+            aspect="equal",
+            interpolation="nearest",
+            extent=(0, n_cols, n_rows, 0),
+            **kwargs,
+        )
+        if linewidths:
+            # lines between cells, drawn by a single collection
+            x, y = np.arange(n_cols + 1), np.arange(n_rows + 1)
+            segments = [[(value, 0), (value, n_rows)] for value in x] + [[(0, value), (n_cols, value)] for value in y]
+            ax.add_collection(LineCollection(segments, colors=linecolor, linewidths=linewidths), autolim=False)
+        if colorbar:
+            self.figure.colorbar(image, ax=ax, **colorbar_kws)
+        # annotate cells with a single artist rather than one text object per cell
+        self.plot_add_cell_text(cell_text, find_text_colors(image.to_rgba(values)), fontsize=text_fontsize)
 
         ax.set_title(title, fontsize=title_fontsize)
+        ax.set(xticks=np.arange(n_cols) + 0.5, yticks=np.arange(n_rows) + 0.5)
         ax.xaxis.set_ticklabels(labels)
         ax.yaxis.set_ticklabels(labels)
         ax.tick_params(labelsize=text_fontsize)
@@ -231,6 +421,10 @@ class PlotBase(QWidget):
         self.setup_new_zoom([self.ax], data_limits=[extent], allow_extraction=False)
         self.store_plot_limits([extent], [self.ax])
 
+    def _get_curve_resolution(self, ax: plt.Axes) -> float:
+        """Return size of the axes in pixels, used to limit the number of vertices of curves in the unit square."""
+        return max(ax.bbox.width, ax.bbox.height, 1)
+
     def plot_roc(
         self,
         fpr: dict[str, np.ndarray],
@@ -244,18 +438,20 @@ class PlotBase(QWidget):
         **kwargs,
     ):
         """Plot ROC."""
-        if not sns:
-            raise ImportError("Seaborn is required for this function")  # noqa: TRY003
         ax = self.get_ax(height=0.8)
+        resolution = self._get_curve_resolution(ax)
+        colors = get_color_cycle(len(fpr))
         i = 0
-        colors = sns.color_palette(n_colors=len(fpr))
-        for key in fpr:
-            if key == "micro" and plot_micro:
-                ax.plot(fpr[key], tpr[key], color="deeppink", linestyle=":", linewidth=4, label=labels[key])
-            elif key == "macro" and plot_macro:
-                ax.plot(fpr[key], tpr[key], color="navy", linestyle=":", linewidth=4, label=labels[key])
+        for key, fpr_ in fpr.items():
+            x, y = downsample_curve(fpr_, tpr[key], resolution)
+            if key == "micro":
+                if plot_micro:
+                    ax.plot(x, y, color="deeppink", linestyle=":", linewidth=4, label=labels[key])
+            elif key == "macro":
+                if plot_macro:
+                    ax.plot(x, y, color="navy", linestyle=":", linewidth=4, label=labels[key])
             else:
-                ax.plot(fpr[key], tpr[key], lw=2, color=colors[i], label=labels[key])
+                ax.plot(x, y, lw=2, color=colors[i], label=labels[key])
                 i += 1
 
         ax.set_title(title, fontsize=title_fontsize)
@@ -271,6 +467,11 @@ class PlotBase(QWidget):
         self.setup_new_zoom([self.ax], data_limits=[extent], allow_extraction=False)
         self.store_plot_limits([extent], [self.ax])
 
+    def plot_roc_histogram(self, histogram: ScoreHistogram, classes: list[str], **kwargs):
+        """Plot ROC curves of each class computed from binned scores."""
+        fpr, tpr, labels = histogram.roc_curves(classes)
+        self.plot_roc(fpr, tpr, labels, **kwargs)
+
     def plot_precision_recall(
         self,
         precision: dict[str, np.ndarray],
@@ -283,16 +484,17 @@ class PlotBase(QWidget):
         **kwargs,
     ):
         """Plot Precision-Recall."""
-        if not sns:
-            raise ImportError("Seaborn is required for this function")  # noqa: TRY003
         ax = self.ax
+        resolution = self._get_curve_resolution(ax)
+        colors = get_color_cycle(len(precision))
         i = 0
-        colors = sns.color_palette(n_colors=len(precision))
-        for key in precision:
-            if key == "micro" and plot_micro:
-                ax.plot(recall[key], precision[key], lw=4, linestyle=":", color="navy", label=labels[key])
+        for key, precision_ in precision.items():
+            x, y = downsample_curve(recall[key], precision_, resolution)
+            if key == "micro":
+                if plot_micro:
+                    ax.plot(x, y, lw=4, linestyle=":", color="navy", label=labels[key])
             else:
-                ax.plot(recall[key], precision[key], lw=2, color=colors[i], label=labels[key])
+                ax.plot(x, y, lw=2, color=colors[i], label=labels[key])
                 i += 1
 
         ax.set_title(title, fontsize=title_fontsize)
@@ -307,6 +509,11 @@ class PlotBase(QWidget):
         self.setup_new_zoom([self.ax], data_limits=[extent], allow_extraction=False)
         self.store_plot_limits([extent], [self.ax])
 
+    def plot_precision_recall_histogram(self, histogram: ScoreHistogram, classes: list[str], **kwargs):
+        """Plot precision-recall curves of each class computed from binned scores."""
+        precision, recall, labels = histogram.precision_recall_curves(classes)
+        self.plot_precision_recall(precision, recall, labels, **kwargs)
+
     def plot_calibration(
         self,
         y_true: np.ndarray,
@@ -318,16 +525,30 @@ class PlotBase(QWidget):
         **kwargs,
     ):
         """Plot calibration curve."""
-        try:
-            from sklearn.calibration import calibration_curve
-        except ImportError:
-            raise ImportError("sklearn is required for this function") from None  # noqa: TRY003
+        histogram = ScoreHistogram.from_scores(y_true, y_probas)
+        self.plot_calibration_histogram(
+            histogram,
+            classes,
+            title=title,
+            title_fontsize=title_fontsize,
+            text_fontsize=text_fontsize,
+            **kwargs,
+        )
 
+    def plot_calibration_histogram(
+        self,
+        histogram: ScoreHistogram,
+        classes: list[str],
+        n_bins: int = CALIBRATION_BINS,
+        title: str = "Calibration Curve",
+        title_fontsize="large",
+        text_fontsize="medium",
+        **kwargs,
+    ):
+        """Plot calibration curve of each class computed from binned scores."""
         ax = self.ax
-        for i, cls_name in enumerate(classes):
-            y_bin = (y_true == i).astype(int)
-            prob_cls = y_probas[:, i] if y_probas.ndim == 2 else y_probas
-            fraction_pos, mean_pred = calibration_curve(y_bin, prob_cls, n_bins=10, strategy="uniform")
+        for i, cls_name in enumerate(histogram.class_labels(classes)):
+            fraction_pos, mean_pred = histogram.calibration_curve(i, n_bins=n_bins)
             ax.plot(mean_pred, fraction_pos, label=cls_name)
         ax.set_xlim([0.0, 1.05])
         ax.set_ylim([0.0, 1.05])
@@ -340,36 +561,151 @@ class PlotBase(QWidget):
         self.setup_new_zoom([self.ax], data_limits=[extent], allow_extraction=False)
         self.store_plot_limits([extent], [self.ax])
 
-    def plot_violin(self, df: pd.DataFrame, **kwargs):
-        """Plot violin plot."""
-        if not sns:
-            raise ImportError("Seaborn is required for this function")  # noqa: TRY003
+    def _can_aggregate(self, aggregate: bool, kwargs: dict) -> bool:
+        """Return whether distribution plot can be drawn from per-group summaries rather than by seaborn."""
+        return aggregate and set(kwargs).issubset(AGGREGATE_DISTRIBUTION_KWARGS)
 
-        g = sns.violinplot(data=df, ax=self.ax, **kwargs)
+    def _setup_distribution_axes(self, distributions: list[GroupDistribution], x: str | None, y: str | None) -> None:
+        """Set categorical x-axis of distribution plots."""
+        ax = self.ax
+        ax.set_xticks(np.arange(len(distributions)), [distribution.name for distribution in distributions])
+        if distributions:
+            ax.set_xlim(-0.5, len(distributions) - 0.5)
+        ax.set_xlabel(x or "")
+        ax.set_ylabel(y or "")
+
+    def _plot_aggregated_distributions(
+        self,
+        df: pd.DataFrame,
+        kind: str,
+        x: str | None = None,
+        y: str | None = None,
+        order: ty.Sequence | None = None,
+        color: ty.Any = None,
+    ) -> None:
+        """Draw distribution plot from cached per-group summaries, using a few collections for all groups."""
+        ax = self.ax
+        distributions = summarize_distributions(df, kind, x=x, y=y, order=order)
+        if not distributions:
+            self._setup_distribution_axes(distributions, x, y)
+            return
+        color = to_rgba_array(get_color_cycle(1)[0] if color is None else color)[0]
+        positions = np.arange(len(distributions), dtype=float)
+        width = DISTRIBUTION_WIDTH
+
+        if kind == "box":
+            ax.bxp(
+                [distribution.to_bxp() for distribution in distributions],
+                positions=positions,
+                widths=width,
+                patch_artist=True,
+                boxprops={"facecolor": color, "edgecolor": "0.25"},
+                medianprops={"color": "0.25"},
+                whiskerprops={"color": "0.25"},
+                capprops={"color": "0.25"},
+                flierprops={"marker": "d", "markersize": 4, "markerfacecolor": "0.25", "markeredgecolor": "none"},
+            )
+        elif kind == "violin":
+            # scale densities so that the widest violin has the full width
+            scale = 0.5 * width / max(distribution.density.max() for distribution in distributions)
+            polygons = [
+                np.r_[
+                    np.c_[position - distribution.density * scale, distribution.grid],
+                    np.c_[position + distribution.density * scale, distribution.grid][::-1],
+                ]
+                for position, distribution in zip(positions, distributions)
+            ]
+            ax.add_collection(PolyCollection(polygons, facecolors=color, edgecolors="0.25", linewidths=1))
+            # inner box with whiskers, inter-quartile range and median
+            whiskers = [[(pos, dist.whislo), (pos, dist.whishi)] for pos, dist in zip(positions, distributions)]
+            quartiles = [[(pos, dist.q1), (pos, dist.q3)] for pos, dist in zip(positions, distributions)]
+            ax.add_collection(
+                LineCollection(
+                    whiskers + quartiles,
+                    colors="0.25",
+                    linewidths=[1] * len(whiskers) + [5] * len(quartiles),
+                ),
+            )
+            medians = [distribution.median for distribution in distributions]
+            ax.scatter(positions, medians, s=12, color="w", zorder=3)
+        elif kind == "boxen":
+            rectangles, colors = [], []
+            for position, distribution in zip(positions, distributions):
+                n_levels = len(distribution.letter_values)
+                # outer boxes are narrower and lighter, and are drawn first so that inner boxes stay visible
+                for level in reversed(range(n_levels)):
+                    lower, upper = distribution.letter_values[level]
+                    box_width = width * (1 - level / (n_levels + 1))
+                    rectangles.append((position - box_width / 2, lower, box_width, upper - lower))
+                    fraction = 1 - level / n_levels
+                    colors.append(np.r_[color[:3] * fraction + (1 - fraction), 1])
+            vertices = rectangle_vertices(np.asarray(rectangles).reshape(-1, 4))
+            ax.add_collection(PolyCollection(vertices, facecolors=colors, edgecolors="0.25", linewidths=0.5))
+            medians = [
+                [(pos - width / 2, dist.median), (pos + width / 2, dist.median)]
+                for pos, dist in zip(positions, distributions)
+            ]
+            ax.add_collection(LineCollection(medians, colors="0.25", linewidths=1.5))
+            fliers = [(np.full(len(dist.fliers), pos), dist.fliers) for pos, dist in zip(positions, distributions)]
+            if fliers:
+                ax.scatter(*np.concatenate(fliers, axis=1), s=8, marker="d", color="0.25", linewidths=0)
+        else:
+            rng = np.random.default_rng(0)
+            samples = [distribution.sample for distribution in distributions]
+            offsets = np.repeat(positions, [len(sample) for sample in samples])
+            offsets += rng.uniform(-STRIP_JITTER, STRIP_JITTER, len(offsets))
+            values = np.concatenate(samples) if samples else np.empty(0)
+            ax.scatter(offsets, values, s=25, color=color, linewidths=0)
+
+        ax.autoscale_view(scalex=False)
+        self._setup_distribution_axes(distributions, x, y)
+
+    def _plot_seaborn_distribution(self, function: str, df: pd.DataFrame, **kwargs) -> None:
+        """Draw distribution plot using seaborn."""
+        sns = get_seaborn()
+        g = getattr(sns, function)(data=df, ax=self.ax, **kwargs)
         g.legend().set_frame_on(False)
 
+    def plot_violin(self, df: pd.DataFrame, aggregate: bool = True, **kwargs):
+        """Plot violin plot.
+
+        When `aggregate` is enabled and only the `x`, `y`, `order` and `color` arguments are specified, violins are
+        computed from binned kernel density estimates rather than by seaborn.
+        """
+        if self._can_aggregate(aggregate, kwargs):
+            self._plot_aggregated_distributions(df, "violin", **kwargs)
+        else:
+            self._plot_seaborn_distribution("violinplot", df, **kwargs)
+
         extent = get_extent(self.ax)
         self.setup_new_zoom([self.ax], data_limits=[extent], allow_extraction=False)
         self.store_plot_limits([extent], [self.ax])
 
-    def plot_boxplot(self, df: pd.DataFrame, **kwargs):
-        """Plot box plot."""
-        if not sns:
-            raise ImportError("Seaborn is required for this function")  # noqa: TRY003
-        g = sns.boxplot(data=df, ax=self.ax, **kwargs)
-        g.legend().set_frame_on(False)
+    def plot_boxplot(self, df: pd.DataFrame, aggregate: bool = True, **kwargs):
+        """Plot box plot.
+
+        When `aggregate` is enabled and only the `x`, `y`, `order` and `color` arguments are specified, boxes are
+        drawn from precomputed quantiles rather than by seaborn.
+        """
+        if self._can_aggregate(aggregate, kwargs):
+            self._plot_aggregated_distributions(df, "box", **kwargs)
+        else:
+            self._plot_seaborn_distribution("boxplot", df, **kwargs)
 
         extent = get_extent(self.ax)
         self.setup_new_zoom([self.ax], data_limits=[extent], allow_extraction=False)
         self.store_plot_limits([extent], [self.ax])
 
-    def plot_boxenplot(self, df: pd.DataFrame, **kwargs):
-        """Plot boxenplot plot."""
-        if not sns:
-            raise ImportError("Seaborn is required for this function")  # noqa: TRY003
+    def plot_boxenplot(self, df: pd.DataFrame, aggregate: bool = True, **kwargs):
+        """Plot boxenplot plot.
 
-        g = sns.boxenplot(data=df, ax=self.ax, **kwargs)
-        g.legend().set_frame_on(False)
+        When `aggregate` is enabled and only the `x`, `y`, `order` and `color` arguments are specified, boxes are
+        drawn from precomputed letter values rather than by seaborn.
+        """
+        if self._can_aggregate(aggregate, kwargs):
+            self._plot_aggregated_distributions(df, "boxen", **kwargs)
+        else:
+            self._plot_seaborn_distribution("boxenplot", df, **kwargs)
 
         extent = get_extent(self.ax)
         self.setup_new_zoom([self.ax], data_limits=[extent], allow_extraction=False)
@@ -377,12 +713,16 @@ class PlotBase(QWidget):
         # Setup extents
         self.store_plot_limits([extent], [self.ax])
 
-    def plot_stripplot(self, df: pd.DataFrame, **kwargs):
-        """Plot stripplot plot."""
-        if not sns:
-            raise ImportError("Seaborn is required for this function")  # noqa: TRY003
-        g = sns.stripplot(data=df, ax=self.ax, **kwargs)
-        g.legend().set_frame_on(False)
+    def plot_stripplot(self, df: pd.DataFrame, aggregate: bool = True, **kwargs):
+        """Plot stripplot plot.
+
+        When `aggregate` is enabled and only the `x`, `y`, `order` and `color` arguments are specified, a
+        density-capped subsample of each group is drawn as a single collection rather than by seaborn.
+        """
+        if self._can_aggregate(aggregate, kwargs):
+            self._plot_aggregated_distributions(df, "strip", **kwargs)
+        else:
+            self._plot_seaborn_distribution("stripplot", df, **kwargs)
 
         extent = get_extent(self.ax)
         self.setup_new_zoom([self.ax], data_limits=[extent], allow_extraction=False)
@@ -589,6 +929,7 @@ class PlotBase(QWidget):
 
     def copy_to_clipboard(self):
         """Copy canvas to clipboard."""
+        self.flush_repaint()
         pixmap = self.canvas.grab()
         QApplication.clipboard().setPixmap(pixmap)
         add_flash_animation(self)
@@ -637,9 +978,14 @@ class PlotBase(QWidget):
         obj_name: str = "",
         pickable: bool = True,
         edgecolor="k",
+        animated: bool = False,
         **kwargs,
     ):
-        """Add patch to the plot area."""
+        """Add patch to the plot area.
+
+        When `animated` is set, the patch is excluded from the cached background and can be moved cheaply by calling
+        `update_animated` rather than `repaint`.
+        """
         if obj_name not in [None, ""]:
             self._remove_existing_patch(obj_name)
 
@@ -668,6 +1014,8 @@ class PlotBase(QWidget):
         patch.obj_name = obj_name
         patch.y_divider = self.y_divider
         self.patch.append(patch)
+        if animated:
+            self.add_animated_artist(patch)
         return patch
 
     def plot_remove_patches(self, start_with: str | None = None, repaint: bool = True):
@@ -681,8 +1029,105 @@ class PlotBase(QWidget):
                 patch.remove()
 
         self.patch = patches
+        for gid in list(self.patch_groups):
+            if start_with is None or gid.startswith(start_with):
+                self.plot_remove_patch_group(gid)
         self.repaint(repaint)
 
+    def plot_add_patches(
+        self,
+        x: ty.Any,
+        y: ty.Any,
+        width: ty.Any,
+        height: ty.Any = None,
+        color: ty.Any = "r",
+        alpha: float = 0.5,
+        linewidth: float = 0,
+        edgecolor: ty.Any = "k",
+        gid: str = "patches",
+        pickable: bool = False,
+    ) -> PatchGroup | None:
+        """Add many rectangular patches to the plot area, rendered by a single collection.
+
+        Parameters
+        ----------
+        x, y, width, height : array-like
+            Position and size of each patch. Scalars are broadcast to all patches. When `height` is not specified, the
+            patches span up to the top of the y-axis.
+        color : color or list of colors
+            Single color or one color per patch.
+        alpha : float
+            Transparency applied to all patches.
+        linewidth : float
+            Width of the patch edges.
+        edgecolor : color
+            Color of the patch edges.
+        gid : str
+            Identifier of the group, which replaces any existing group with the same identifier.
+        pickable : bool
+            Flag to emit pick events for the patches.
+        """
+        if height is None:
+            height = self.get_ylim()[-1]
+        rectangles = coerce_rectangles(x, y, width, height)
+        self.plot_remove_patch_group(gid)
+        try:
+            collection = self.ax.add_collection(
+                PolyCollection(rectangle_vertices(rectangles), linewidths=linewidth, picker=pickable, gid=gid),
+            )
+        except AttributeError:
+            logger.warning("Please plot something first")
+            return None
+        collection.obj_name = gid
+        collection.edge_rgba = to_rgba_array(edgecolor)
+        group = PatchGroup(gid, rectangles, to_rgba_array(color, alpha), item=collection)
+        self._set_patch_group_colors(group)
+        self.patch_groups[gid] = group
+        return group
+
+    def plot_update_patches(
+        self,
+        gid: str = "patches",
+        indices: ty.Any = None,
+        x: ty.Any = None,
+        y: ty.Any = None,
+        width: ty.Any = None,
+        height: ty.Any = None,
+        color: ty.Any = None,
+        visible: ty.Any = None,
+        alpha: float | None = None,
+    ) -> PatchGroup | None:
+        """Update position, size, color and/or visibility of patches at `indices` (or all patches) of a group."""
+        group = self.patch_groups.get(gid)
+        if group is None:
+            return None
+        colors = None if color is None else to_rgba_array(color)
+        group.update(indices, x=x, y=y, width=width, height=height, colors=colors, visible=visible, alpha=alpha)
+        if x is not None or y is not None or width is not None or height is not None:
+            group.item.set_verts(rectangle_vertices(group.rectangles))
+        self._set_patch_group_colors(group)
+        return group
+
+    @staticmethod
+    def _set_patch_group_colors(group: PatchGroup) -> None:
+        """Set face and edge colors of the collection, hiding invisible patches."""
+        collection = group.item
+        edgecolors = np.repeat(collection.edge_rgba, len(group), axis=0)
+        edgecolors[~group.visible, 3] = 0
+        collection.set_facecolor(group.display_colors)
+        collection.set_edgecolor(edgecolors)
+
+    def get_patch_group(self, gid: str) -> PatchGroup | None:
+        """Get an existing group of patches."""
+        return self.patch_groups.get(gid)
+
+    def plot_remove_patch_group(self, gid: str) -> None:
+        """Remove group of patches."""
+        group = self.patch_groups.pop(gid, None)
+        if group is not None:
+            with suppress(ValueError, NotImplementedError):
+                group.item.remove()
+
     def plot_add_hline(
         self,
         xmin: float = 0,
@@ -725,16 +1170,26 @@ class PlotBase(QWidget):
         color: str = "k",
         alpha: float = 0.5,
         gid: str = "ax_vline",
+        animated: bool = False,
     ):
-        """Add vertical line to the axes."""
+        """Add vertical line to the axes.
+
+        When `animated` is set, the line is excluded from the cached background and moving it (by calling this method
+        again with the same `gid`) only blits the line rather than redrawing the whole figure.
+        """
         line = self.get_line(gid)
         if line is not None:
             line.set_xdata([xpos, xpos])
             line.set_ydata([ymin, ymax])
+            if line.get_animated():
+                self.update_animated()
         else:
             line = self.ax.axvline(xpos, ymin, ymax, color=color, alpha=alpha, gid=gid)
             line.obj_name = gid
             self.lines.append(line)
+            if animated:
+                self.add_animated_artist(line)
+        return line
 
     def plot_add_varrow(self, xpos: float, yoffset=-0.05, gid: str = "ax_varrow") -> None:
         """Add arrow below the x-axis line, indicating location."""
@@ -892,13 +1347,101 @@ class PlotBase(QWidget):
         self.repaint()
 
     def repaint(self, repaint: bool = True):
-        """Redraw and refresh the plot."""
-        if self._disable_repaint:
-            return
+        """Mark the plot as dirty and schedule a redraw.
 
+        The redraw is deferred to the next iteration of the event loop, so any number of consecutive calls result in
+        a single render. Use `flush_repaint` when the rendered figure is needed immediately.
+        """
         if repaint:
+            self._repaint = True
+        if self._disable_repaint or not self._repaint:
+            return
+        self._repaint_timer.start()
+
+    def flush_repaint(self) -> None:
+        """Render the plot immediately if it has pending changes."""
+        self._repaint_timer.stop()
+        if self._repaint:
             self.canvas.draw()
+
+    def closeEvent(self, event: QCloseEvent) -> None:
+        """Drop any pending redraw before closing."""
+        self._repaint_timer.stop()
+        super().closeEvent(event)
+
+    def _on_draw(self, _event=None) -> None:
+        """Clear the dirty flag and cache the background whenever the canvas was drawn."""
         self._repaint = False
+        if self._animated_artists:
+            self._animated_background = self.canvas.copy_from_bbox(self.figure.bbox)
+            self._draw_animated()
+
+    def add_animated_artist(self, artist: Artist) -> Artist:
+        """Exclude artist from full redraws and draw it on top of the cached background instead.
+
+        The background is cached after every full draw and invalidated when the canvas is resized or the limits of the
+        artist's axes change, so that changes to the artist only require `update_animated`.
+        """
+        if artist not in self._animated_artists:
+            artist.set_animated(True)
+            self._animated_artists.append(artist)
+        axes = artist.axes
+        if axes is not None:
+            # the callback registry ignores repeated connections of the same method
+            axes.callbacks.connect("xlim_changed", self._invalidate_animated_background)
+            axes.callbacks.connect("ylim_changed", self._invalidate_animated_background)
+        return artist
+
+    def remove_animated_artist(self, artist: Artist) -> None:
+        """Return artist to the regular layer that is rendered by full redraws."""
+        if artist in self._animated_artists:
+            self._animated_artists.remove(artist)
+            artist.set_animated(False)
+
+    def _invalidate_animated_background(self, *_args: ty.Any) -> None:
+        """Drop the cached background so that the next update triggers a full redraw."""
+        self._animated_background = None
+
+    def _draw_animated(self) -> None:
+        """Draw animated artists that are still part of the figure."""
+        self._animated_artists = [artist for artist in self._animated_artists if artist.get_figure() is not None]
+        for artist in self._animated_artists:
+            if artist.get_visible():
+                self.figure.draw_artist(artist)
+
+    def update_animated(self) -> None:
+        """Redraw animated artists without re-rendering the rest of the figure.
+
+        Falls back to a full redraw when there is no valid background, e.g. after a resize or a change of the axes
+        limits, or when the figure has other pending changes.
+        """
+        if self._disable_repaint:
+            return
+        if self._animated_background is None:
+            self._repaint = True
+        if self._repaint:
+            self.repaint(False)
+            return
+        self.canvas.restore_region(self._animated_background)
+        self._draw_animated()
+        self.canvas.blit(self.figure.bbox)
+        # the interaction restores its own copy of the canvas when drawing the rubberband
+        if self.zoom is not None:
+            self.zoom.update_background(None)
+
+    @contextmanager
+    def _animated_as_static(self) -> ty.Iterator[None]:
+        """Temporarily render animated artists as part of the figure, e.g. when exporting it."""
+        artists, self._animated_artists = self._animated_artists, []
+        for artist in artists:
+            artist.set_animated(False)
+        try:
+            yield
+        finally:
+            for artist in artists:
+                artist.set_animated(True)
+            self._animated_artists = artists
+            self._animated_background = None
 
     @property
     def legend_visible(self) -> bool:
@@ -915,12 +1458,51 @@ class PlotBase(QWidget):
                 legend.set_visible(self._legend_visible)
         self.repaint(repaint)
 
+    def _get_tight_layout_key(self) -> tuple:
+        """Return key describing everything that affects the result of `tight_layout`."""
+        figure = self.figure
+        suptitle = figure._suptitle.get_text() if figure._suptitle is not None else ""
+        axes_keys = tuple(
+            (
+                # gridspec geometry rather than position, which is what `tight_layout` changes
+                spec.get_geometry() if (spec := ax.get_subplotspec()) is not None else tuple(ax.get_position().bounds),
+                ax.get_visible(),
+                ax.get_title(),
+                ax.get_xlabel(),
+                ax.get_ylabel(),
+                ax.xaxis.label.get_fontsize(),
+                ax.yaxis.label.get_fontsize(),
+                tuple(label.get_text() for label in ax.get_xticklabels()),
+                tuple(label.get_text() for label in ax.get_yticklabels()),
+            )
+            for ax in figure.axes
+        )
+        return tuple(figure.get_size_inches()), figure.dpi, suptitle, axes_keys
+
     def tight(self, tight: bool = True):
-        """Tighten layout."""
-        if tight:
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore", category=UserWarning)
-                self.figure.tight_layout()
+        """Tighten layout.
+
+        The resulting subplot parameters are cached by figure size and label extents, so the layout is only computed
+        again when either changes.
+        """
+        if not tight:
+            return
+        try:
+            key = self._get_tight_layout_key()
+        except (AttributeError, TypeError, ValueError):
+            key = None
+        cached = self._tight_layout_cache.get(key) if key is not None else None
+        if cached is not None:
+            self.figure.subplots_adjust(**cached)
+            return
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=UserWarning)
+            self.figure.tight_layout()
+        if key is not None:
+            if len(self._tight_layout_cache) >= TIGHT_LAYOUT_CACHE_SIZE:
+                self._tight_layout_cache.pop(next(iter(self._tight_layout_cache)))
+            params = self.figure.subplotpars
+            self._tight_layout_cache[key] = {name: getattr(params, name) for name in SUBPLOT_PARAMS}
 
     tight_layout = tight
 
@@ -934,8 +1516,11 @@ class PlotBase(QWidget):
         self.text = []
         self.lines = []
         self.patch = []
+        self.patch_groups = {}
         self.markers = []
         self.arrows = []
+        self._animated_artists = []
+        self._animated_background = None
 
         # clear plots
         self._ax = None
@@ -960,14 +1545,15 @@ class PlotBase(QWidget):
         if not hasattr(self, "_ax"):
             logger.warning("Cannot save a plot that has not been plotted yet")
             return
-        self.figure.savefig(
-            path,
-            transparent=transparent,
-            dpi=dpi,
-            format=image_fmt,
-            bbox_inches="tight" if tight else None,
-            facecolor=facecolor,
-        )
+        with self._animated_as_static(), self._cell_text_as_vector(image_fmt in VECTOR_FORMATS):
+            self.figure.savefig(
+                path,
+                transparent=transparent,
+                dpi=dpi,
+                format=image_fmt,
+                bbox_inches="tight" if tight else None,
+                facecolor=facecolor,
+            )
 
     def reset_limits(self, reset_x: bool = True, reset_y: bool = True, repaint: bool = True):
         """Reset x/y-axis limits."""
@@ -1083,8 +1669,11 @@ class PlotBase(QWidget):
         self.setup_new_zoom([self.ax], data_limits=[extent], allow_extraction=False)
         self.store_plot_limits([extent], [self.ax])
 
-    def plot_1d_add_under_curve(self, xvals, yvals, gid=None, ax=None, **kwargs):
-        """Fill data under the line."""
+    def plot_1d_add_under_curve(self, xvals, yvals, gid=None, ax=None, **kwargs) -> UnderCurveCollection:
+        """Fill data under the line.
+
+        The fill can be updated in-place using `plot_1d_update_under_curve`.
+        """
         color = kwargs.get("spectrum_fill_color", "k")
 
         shade_kws = {
@@ -1098,7 +1687,34 @@ class PlotBase(QWidget):
             ax = self.ax
         if gid is None:
             gid = PlotIds.PLOT_1D_PATCH_GID
-        ax.fill_between(xvals, 0, yvals, gid=gid, **shade_kws)
+        fill = UnderCurveCollection(xvals, yvals, gid=gid, **shade_kws)
+        ax.add_collection(fill)
+        return fill
+
+    def plot_1d_update_under_curve(self, xvals, yvals, gid=None, ax=None, **kwargs) -> None:
+        """Update data under the line, re-using the existing fill whenever possible.
+
+        Style is only changed when the corresponding keyword is specified.
+        """
+        if ax is None:
+            ax = self.ax
+        if gid is None:
+            gid = PlotIds.PLOT_1D_PATCH_GID
+        for fill in list(ax.collections):
+            if fill.get_gid() != gid:
+                continue
+            if not isinstance(fill, UnderCurveCollection):
+                with suppress(ValueError):
+                    fill.remove()
+                self.plot_1d_add_under_curve(xvals, yvals, gid=gid, ax=ax, **kwargs)
+                continue
+            fill.set_data(xvals, yvals)
+            if "spectrum_fill_color" in kwargs:
+                fill.set_facecolor(kwargs["spectrum_fill_color"])
+            if "spectrum_fill_transparency" in kwargs:
+                fill.set_alpha(kwargs["spectrum_fill_transparency"])
+            if "spectrum_fill_hatch" in kwargs:
+                fill.set_hatch(kwargs["spectrum_fill_hatch"])
 
     def plot_1d_update_data(
         self,
@@ -1140,11 +1756,8 @@ class PlotBase(QWidget):
         # line.set_color(kwargs["spectrum_line_color"])
         # line.set_label(kwargs.get("label", ""))
 
-        for patch in ax.collections:
-            if patch.get_gid() == PlotIds.PLOT_1D_PATCH_GID:
-                with suppress(ValueError):
-                    patch.remove()
-                self.plot_1d_add_under_curve(x, y, ax=ax, **kwargs)
+        # use the points of the line so that the fill matches what is actually drawn
+        self.plot_1d_update_under_curve(line.get_xdata(), line.get_ydata(), ax=ax, **kwargs)
 
         # general plot updates
         self.set_plot_xlabel(x_label, **kwargs)
@@ -1255,6 +1868,7 @@ class PlotBase(QWidget):
                 for patch in self.patch:
                     if patch.obj_name == gid:
                         patch.remove()
+                self.patch_groups.pop(gid, None)
             if kind in ["any", "arrow"]:
                 for patch in self.arrows:
                     if patch.obj_name == gid:
@@ -1308,25 +1922,45 @@ class PlotBase(QWidget):
         gid=PlotIds.PLOT_1D_LINE_GID,
         color="k",
         zorder: int = 5,
+        density: bool | None = None,
+        density_threshold: int = DENSITY_THRESHOLD,
+        cmap: str = "viridis",
         # line_width: int = 1,
         # line_alpha: float = 1.0,
         # line_style: str = "solid",
         **kwargs,
     ):
-        """Standard 1d plot."""
+        """Standard 1d plot.
+
+        When `density` is enabled, or left as None and there are more than `density_threshold` points, the points are
+        drawn as a density image of the visible region using `cmap`, which is re-aggregated whenever the view changes.
+        Once no more than `density_threshold` points are visible, they are drawn as individual markers instead.
+        """
         xlimits, ylimits, extent = self._compute_xy_limits(x, y, y_lower_start, y_upper_multiplier)
+        if density is None:
+            density = len(x) > density_threshold
+        # per-point colors are kept by the density artist, which assigns them to the visible points
+        colors = to_rgba_array(color) if density else None
+        per_point_colors = colors is not None and len(colors) == len(x) > 1
 
         # add 1d plot
-        self.ax.scatter(
-            x,
-            y,
-            color=color,
+        markers = self.ax.scatter(
+            [] if density else x,
+            [] if density else y,
+            color=colors[:1] if per_point_colors else color,
             label=label,
             gid=gid,
             zorder=zorder,
             marker=kwargs.get("marker", "o"),
             s=kwargs.get("size", 5),
         )
+        if density:
+            artist = DensityScatterArtist(DensityAggregator(x, y, threshold=density_threshold), markers, cmap=cmap)
+            if per_point_colors:
+                artist.set_colors(colors)
+            artist.set_gid(gid)
+            self.ax.add_artist(artist)
+            self.ax.update_datalim([(extent[0], extent[1]), (extent[2], extent[3])])
         if kwargs.get("spectrum_line_fill_under", False):
             self.plot_1d_add_under_curve(x, y, **kwargs)
 
@@ -16,6 +16,8 @@ from qtextraplot.utils.views_base import MUTEX, ViewBase
 if ty.TYPE_CHECKING:
     import pandas as pd
 
+    from qtextraplot.utils.classification import ScoreHistogram
+
 
 class ViewMplLine(ViewBase):
     """View."""
@@ -239,6 +241,36 @@ class ViewMplLine(ViewBase):
             self.figure.tight(tight)
             self.figure.repaint(repaint)
 
+    def plot_roc_histogram(
+        self,
+        histogram: ScoreHistogram,
+        classes: list[str],
+        repaint: bool = True,
+        tight: bool = True,
+        **kwargs,
+    ):
+        """Plot ROC curves computed from binned scores."""
+        with QMutexLocker(MUTEX):
+            self.figure.clear()
+            self.figure.plot_roc_histogram(histogram, classes, **kwargs)
+            self.figure.tight(tight)
+            self.figure.repaint(repaint)
+
+    def plot_precision_recall_histogram(
+        self,
+        histogram: ScoreHistogram,
+        classes: list[str],
+        repaint: bool = True,
+        tight: bool = True,
+        **kwargs,
+    ):
+        """Plot precision-recall curves computed from binned scores."""
+        with QMutexLocker(MUTEX):
+            self.figure.clear()
+            self.figure.plot_precision_recall_histogram(histogram, classes, **kwargs)
+            self.figure.tight(tight)
+            self.figure.repaint(repaint)
+
     def plot_precision_recall_f1_support(
         self,
         scores: dict[str, np.ndarray],
@@ -270,6 +302,21 @@ class ViewMplLine(ViewBase):
             self.figure.tight(tight)
             self.figure.repaint(repaint)
 
+    def plot_calibration_histogram(
+        self,
+        histogram: ScoreHistogram,
+        classes: list[str],
+        repaint: bool = True,
+        tight: bool = True,
+        **kwargs,
+    ):
+        """Plot calibration curves computed from binned scores."""
+        with QMutexLocker(MUTEX):
+            self.figure.clear()
+            self.figure.plot_calibration_histogram(histogram, classes, **kwargs)
+            self.figure.tight(tight)
+            self.figure.repaint(repaint)
+
     def plot_violin(self, df: pd.DataFrame, repaint: bool = True, tight: bool = True, **kwargs):
         """Plot violin plot."""
         with QMutexLocker(MUTEX):
@@ -24,6 +24,7 @@ import napari.resources._icons
 
 from qtextraplot._napari._compat import install_mode_enum_compatibility
 from qtextraplot.assets import ICONS
+from qtextraplot.utils.utilities import lazy_module_attributes
 
 install_mode_enum_compatibility()
 
@@ -32,7 +33,11 @@ install_mode_enum_compatibility()
 napari.resources._icons.ICONS.update(ICONS)
 
 
-from qtextraplot._napari.image.wrapper import NapariImageView  # noqa: E402
-
-with contextlib.suppress(ImportError):
-    from qtextraplot._napari.line.wrapper import NapariLineView
+# Views are resolved on first access so that using only one of the image/line backends does not import the other.
+__getattr__, __dir__ = lazy_module_attributes(
+    __name__,
+    {
+        "NapariImageView": "qtextraplot._napari.image.wrapper",
+        "NapariLineView": "qtextraplot._napari.line.wrapper",
+    },
+)
@@ -4,8 +4,10 @@ from qtextraplot._napari._vispy.overlays.color_bar_mpl import ColorBarOverlay, V
 from qtextraplot._napari._vispy.overlays.crosshair import CrossHairOverlay, VispyCrosshairOverlay
 from qtextraplot._napari._vispy.overlays.legend import VispyLegendOverlay
 from qtextraplot._napari._vispy.overlays.object_outlines import VispyObjectOutlinesOverlay
+from qtextraplot._napari._vispy.overlays.text_labels import VispyTextLabelsOverlay
 from qtextraplot._napari.components.overlays.legend import LegendOverlay
 from qtextraplot._napari.components.overlays.object_outlines import ObjectOutlinesOverlay
+from qtextraplot._napari.components.overlays.text_labels import TextLabelsOverlay
 
 
 def register_vispy_overlays():
@@ -16,6 +18,7 @@ def register_vispy_overlays():
             CrossHairOverlay: VispyCrosshairOverlay,
             LegendOverlay: VispyLegendOverlay,
             ObjectOutlinesOverlay: VispyObjectOutlinesOverlay,
+            TextLabelsOverlay: VispyTextLabelsOverlay,
         },
     )
 
@@ -25,6 +28,7 @@ __all__ = [
     "VispyCrosshairOverlay",
     "VispyLegendOverlay",
     "VispyObjectOutlinesOverlay",
+    "VispyTextLabelsOverlay",
     "create_vispy_overlay",
     "overlay_to_visual",
     "register_vispy_overlays",
@@ -5,41 +5,62 @@ from __future__ import annotations
 import numpy as np
 from napari._vispy.overlays.base import ViewerOverlayMixin, VispySceneOverlay
 from napari._vispy.utils.qt_font import FontInfo
+from qtpy.QtCore import QTimer
 from vispy.scene.visuals import Line
 
 from qtextraplot._napari.components.overlays.crosshair import CrossHairOverlay, Shape
 
 MAX = np.finfo(np.float16).max
 
+# vertex offsets relative to the (rounded) cursor position, scaled by the half-size of the marker
+_CROSS_OFFSETS = np.asarray([[-1, 0, 0], [1, 0, 0], [0, -1, 0], [0, 1, 0], [0, 0, -1], [0, 0, 1]], dtype=float)
+_BOX_OFFSETS = np.asarray(
+    [
+        [-1, -1, 0],
+        [1, -1, 0],
+        [1, -1, 0],
+        [1, 1, 0],
+        [1, 1, 0],
+        [-1, 1, 0],
+        [-1, 1, 0],
+        [-1, -1, 0],
+    ],
+    dtype=float,
+)
+# the box is followed by a cross spanning the entire canvas
+_BOX_CROSS_OFFSETS = np.asarray([[-MAX, 0, 0], [MAX, 0, 0], [0, -MAX, 0], [0, MAX, 0]], dtype=float)
+N_CROSS_VERTICES = len(_CROSS_OFFSETS)
+N_BOX_VERTICES = len(_BOX_OFFSETS) + len(_BOX_CROSS_OFFSETS)
 
-def position_to_cross(position: tuple[float, float], size: float = 3.0) -> np.ndarray:
-    """Convert position specified by the user to crosshair."""
-    size = size / 2
+
+def position_to_cross(position: tuple[float, float], size: float = 3.0, out: np.ndarray | None = None) -> np.ndarray:
+    """Convert position specified by the user to crosshair.
+
+    If `out` is provided, vertices are written to it in-place instead of allocating a new array.
+    """
+    if out is None:
+        out = np.empty((N_CROSS_VERTICES, 3))
     y, x = np.round(position)
-    data = [[x - size, y, 0], [x + size, y, 0], [x, y - size, 0], [x, y + size, 0], [x, y, -size], [x, y, size]]
-    return np.asarray(data)
+    np.multiply(_CROSS_OFFSETS, size / 2, out=out)
+    out[:, 0] += x
+    out[:, 1] += y
+    return out
+
 
+def position_to_box(position: tuple[float, float], size: float = 1.0, out: np.ndarray | None = None) -> np.ndarray:
+    """Convert position specified by the user to box.
 
-def position_to_box(position: tuple[float, float], size: float = 1.0) -> np.ndarray:
-    """Convert position specified by the user to box."""
-    size = size / 2
+    If `out` is provided, vertices are written to it in-place instead of allocating a new array.
+    """
+    if out is None:
+        out = np.empty((N_BOX_VERTICES, 3))
     y, x = np.round(position)
-    data = [
-        [x - size, y - size, 0],
-        [x + size, y - size, 0],
-        [x + size, y - size, 0],
-        [x + size, y + size, 0],
-        [x + size, y + size, 0],
-        [x - size, y + size, 0],
-        [x - size, y + size, 0],
-        [x - size, y - size, 0],
-        # from here onwards this is cross
-        [x - MAX, y, 0],
-        [x + MAX, y, 0],
-        [x, y - MAX, 0],
-        [x, y + MAX, 0],
-    ]
-    return np.asarray(data)
+    n_box = len(_BOX_OFFSETS)
+    np.multiply(_BOX_OFFSETS, size / 2, out=out[:n_box])
+    out[n_box:] = _BOX_CROSS_OFFSETS
+    out[:, 0] += x
+    out[:, 1] += y
+    return out
 
 
 class VispyCrosshairOverlay(ViewerOverlayMixin, VispySceneOverlay):
@@ -54,23 +75,52 @@ class VispyCrosshairOverlay(ViewerOverlayMixin, VispySceneOverlay):
             parent=parent,
         )
 
+        # persistent vertex buffers which are updated in-place whenever the crosshair moves
+        self._buffers = {
+            Shape.BOX: np.zeros((N_BOX_VERTICES, 3)),
+            Shape.CROSSHAIR: np.zeros((N_CROSS_VERTICES, 3)),
+        }
+        self._last_state: tuple | None = None
+        # cursor updates can arrive much faster than the display refreshes so they are coalesced
+        self._position_timer = QTimer()
+        self._position_timer.setSingleShot(True)
+        self._position_timer.setInterval(0)
+        self._position_timer.timeout.connect(self._on_data_change)
+
         self.overlay.events.width.connect(self._on_data_change)
         self.overlay.events.color.connect(self._on_data_change)
-        self.overlay.events.position.connect(self._on_data_change)
+        self.overlay.events.position.connect(self._on_position_change)
         self.overlay.events.shape.connect(self._on_data_change)
         self.overlay.events.window.connect(self._on_data_change)
 
         self._on_visible_change()
         self._on_data_change(None)
 
+    def _on_position_change(self, _evt=None):
+        """Schedule position update, coalescing multiple cursor events into a single update."""
+        if not self._position_timer.isActive():
+            self._position_timer.start()
+
     def _on_data_change(self, _evt=None):
         """Change position."""
-        if self.viewer.cross_hair.shape == Shape.BOX:
-            data = position_to_box(self.viewer.cross_hair.position, self.viewer.cross_hair.window)
+        self._position_timer.stop()
+        cross_hair = self.viewer.cross_hair
+        shape = Shape(cross_hair.shape)
+        y, x = np.round(cross_hair.position)
+        state = (shape, y, x, cross_hair.window, cross_hair.width, tuple(np.asarray(cross_hair.color).tolist()))
+        # nothing changed at pixel resolution so there is no need to upload new vertices
+        if state == self._last_state:
+            return
+        self._last_state = state
+
+        buffer = self._buffers[shape]
+        if shape == Shape.BOX:
+            position_to_box((y, x), cross_hair.window, out=buffer)
         else:
-            data = position_to_cross(self.viewer.cross_hair.position, self.viewer.cross_hair.window)
-        self.node.set_data(data, color=self.viewer.cross_hair.color, width=self.viewer.cross_hair.width)
+            position_to_cross((y, x), cross_hair.window, out=buffer)
+        self.node.set_data(buffer, color=cross_hair.color, width=cross_hair.width)
 
     def reset(self):
         super().reset()
+        self._last_state = None
         self._on_data_change()
@@ -11,12 +11,16 @@ from napari._vispy.utils.qt_font import FontInfo
 from napari.utils.events import disconnect_events
 from vispy.scene.visuals import Compound, Line
 
-from qtextraplot._napari.components.overlays.object_outlines import ObjectOutline, ObjectOutlinesOverlay
+from qtextraplot._napari.components.overlays.object_outlines import ObjectOutlinesOverlay
 
 if ty.TYPE_CHECKING:
     from napari.layers import Layer
 
 TARGET_LAYER_EVENTS = ("data", "set_data", "scale", "translate", "rotate", "shear", "affine")
+# distance in canvas pixels below which consecutive outline vertices are merged
+LOD_TOLERANCE = 1.0
+# fraction of the view added on each side of the drawn region so that small pans reuse the uploaded geometry
+CULL_PADDING = 0.5
 
 
 def outline_data_to_scene(data: np.ndarray, layer: Layer, displayed: ty.Sequence[int]) -> np.ndarray:
@@ -24,7 +28,13 @@ def outline_data_to_scene(data: np.ndarray, layer: Layer, displayed: ty.Sequence
     if data.size == 0:
         return np.empty((0, 3), dtype=float)
 
-    world = np.asarray([layer.data_to_world(point) for point in data], dtype=float)
+    # vectorized equivalent of calling `layer.data_to_world` on each point
+    data = np.asarray(data, dtype=float)
+    if data.shape[1] >= layer.ndim:
+        coords = data[:, data.shape[1] - layer.ndim :]
+    else:
+        coords = np.pad(data, ((0, 0), (layer.ndim - data.shape[1], 0)), mode="constant")
+    world = np.asarray(layer._transforms[1:].simplified(coords), dtype=float)
     displayed_axes = tuple(displayed)
     if not displayed_axes:
         return np.empty((0, 3), dtype=float)
@@ -54,6 +64,97 @@ def points_to_segments(points: np.ndarray, closed: bool) -> np.ndarray:
     return segments.reshape(-1, points.shape[1])
 
 
+def outlines_to_segments(
+    vertices: np.ndarray,
+    offsets: np.ndarray,
+    indices: np.ndarray,
+    closed: bool,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Convert selected outlines of a columnar store to flattened line segments.
+
+    Parameters
+    ----------
+    vertices : np.ndarray
+        Vertices of all outlines.
+    offsets : np.ndarray
+        Outline ``i`` spans ``vertices[offsets[i]:offsets[i + 1]]``.
+    indices : np.ndarray
+        Indices of outlines to convert. Outlines with fewer than two vertices are skipped.
+    closed : bool
+        Whether to connect the last vertex of each outline to the first.
+
+    Returns
+    -------
+    positions : np.ndarray
+        Segment start and end points, interleaved.
+    segment_outlines : np.ndarray
+        Index of the outline each segment belongs to.
+    """
+    indices = np.asarray(indices, dtype=np.intp)
+    starts = offsets[indices]
+    lengths = offsets[indices + 1] - starts
+    valid = lengths >= 2
+    indices, starts, lengths = indices[valid], starts[valid], lengths[valid]
+    n_segments = lengths - 1 + int(closed)
+    total = int(n_segments.sum())
+    if total == 0:
+        return np.empty((0, vertices.shape[1]), dtype=vertices.dtype), np.empty(0, dtype=np.intp)
+
+    owner = np.repeat(np.arange(len(indices)), n_segments)
+    local = np.arange(total) - np.repeat(np.cumsum(n_segments) - n_segments, n_segments)
+    first = starts[owner] + local
+    second = first + 1
+    if closed:
+        last = local == lengths[owner] - 1
+        second[last] = starts[owner][last]
+    positions = np.empty((2 * total, vertices.shape[1]), dtype=vertices.dtype)
+    positions[0::2] = vertices[first]
+    positions[1::2] = vertices[second]
+    return positions, indices[owner]
+
+
+def simplify_outlines(vertices: np.ndarray, offsets: np.ndarray, tolerance: float) -> tuple[np.ndarray, np.ndarray]:
+    """Merge consecutive outline vertices that fall into the same cell of a grid with ``tolerance`` spacing.
+
+    The first vertex of each outline is always kept, so outlines smaller than a cell collapse to a single vertex and
+    are skipped by :func:`outlines_to_segments`.
+    """
+    if tolerance <= 0 or len(vertices) == 0:
+        return vertices, offsets
+    cells = np.floor(vertices[:, :2] / tolerance)
+    keep = np.ones(len(vertices), dtype=bool)
+    keep[1:] = np.any(cells[1:] != cells[:-1], axis=1)
+    keep[offsets[:-1]] = True
+    simplified_offsets = np.zeros_like(offsets)
+    np.cumsum(np.add.reduceat(keep, offsets[:-1]), out=simplified_offsets[1:])
+    return vertices[keep], simplified_offsets
+
+
+class OutlineSpatialIndex:
+    """Index of outline bounding boxes for fast rectangle queries.
+
+    Boxes are sorted by their minimum x-coordinate, so a query only tests boxes whose x-range can overlap.
+    """
+
+    def __init__(self, bounds: np.ndarray):
+        # bounds are (n_outlines, 2, n_dims) with the minimum and maximum of each outline in scene (x, y) order
+        self._order = np.argsort(bounds[:, 0, 0], kind="stable")
+        self._bounds = bounds[self._order]
+        self._xmin = self._bounds[:, 0, 0]
+        self._max_width = float(np.max(self._bounds[:, 1, 0] - self._xmin)) if len(bounds) else 0.0
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def query(self, xmin: float, ymin: float, xmax: float, ymax: float) -> np.ndarray:
+        """Return sorted indices of outlines whose bounding box intersects the rectangle."""
+        lo = np.searchsorted(self._xmin, xmin - self._max_width, side="left")
+        hi = np.searchsorted(self._xmin, xmax, side="right")
+        bounds = self._bounds[lo:hi]
+        mask = (bounds[:, 1, 0] >= xmin) & (bounds[:, 0, 1] <= ymax) & (bounds[:, 1, 1] >= ymin)
+        return np.sort(self._order[lo:hi][mask])
+
+
 class VispyObjectOutlinesOverlay(ViewerOverlayMixin, VispySceneOverlay):
     """Object outline visual."""
 
@@ -67,9 +168,14 @@ class VispyObjectOutlinesOverlay(ViewerOverlayMixin, VispySceneOverlay):
         )
         self._line_nodes: list[Line] = []
         self._target_layer: Layer | None = None
-        self._connected_outlines: tuple[ObjectOutline, ...] = ()
-
-        self.overlay.events.outlines.connect(self._on_outlines_change)
+        self._scene_vertices: np.ndarray = np.empty((0, 3))
+        self._spatial_index: OutlineSpatialIndex | None = None
+        self._lod_cache: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+        # level of detail and padded scene region that were last uploaded to the GPU
+        self._drawn_level: int | None = None
+        self._drawn_region: tuple[float, float, float, float] | None = None
+
+        self.overlay.events.outlines.connect(self._on_data_change)
         self.overlay.events.closed.connect(self._on_data_change)
         self.overlay.events.target_layer.connect(self._on_target_layer_change)
         self.viewer.dims.events.displayed.connect(self._on_data_change)
@@ -78,8 +184,13 @@ class VispyObjectOutlinesOverlay(ViewerOverlayMixin, VispySceneOverlay):
         self.viewer.layers.events.removed.connect(self._on_target_layer_change)
         self.viewer.layers.events.changed.connect(self._on_target_layer_change)
         self.viewer.grid.events.enabled.connect(self._on_visible_change)
+        self.viewer.camera.events.center.connect(self._on_view_change)
+        self.viewer.camera.events.zoom.connect(self._on_view_change)
+        # connected last so that the viewer's canvas size is updated before the outlines are culled
+        self._canvas = self.node.canvas
+        if self._canvas is not None:
+            self._canvas.events.resize.connect(self._on_view_change, position="last")
 
-        self._connect_outline_events()
         self._connect_target_layer_events()
         self.reset()
 
@@ -103,24 +214,6 @@ class VispyObjectOutlinesOverlay(ViewerOverlayMixin, VispySceneOverlay):
             with suppress(AttributeError, KeyError):
                 getattr(layer.events, event_name).connect(self._on_data_change)
 
-    def _disconnect_outline_events(self) -> None:
-        for outline in self._connected_outlines:
-            disconnect_events(outline.events, self)
-        self._connected_outlines = ()
-
-    def _connect_outline_events(self) -> None:
-        self._disconnect_outline_events()
-        for outline in self.overlay.outlines:
-            outline.events.data.connect(self._on_data_change)
-            outline.events.color.connect(self._on_data_change)
-            outline.events.width.connect(self._on_data_change)
-        self._connected_outlines = tuple(self.overlay.outlines)
-
-    def _on_outlines_change(self, _evt=None) -> None:
-        """Refresh line event connections and rendered data."""
-        self._connect_outline_events()
-        self._on_data_change()
-
     def _on_target_layer_change(self, _evt=None) -> None:
         """Refresh target layer event connections and rendered data."""
         self._connect_target_layer_events()
@@ -140,33 +233,97 @@ class VispyObjectOutlinesOverlay(ViewerOverlayMixin, VispySceneOverlay):
             self.node.add_subvisual(line)
             self._line_nodes.append(line)
 
-    def _line_groups(self, layer: Layer) -> list[tuple[float, np.ndarray, np.ndarray]]:
-        groups: dict[float, list[tuple[np.ndarray, np.ndarray]]] = {}
-        for outline in self.overlay.outlines:
-            points = outline_data_to_scene(outline.data, layer, self.viewer.dims.displayed)
-            segments = points_to_segments(points, closed=self.overlay.closed)
-            if len(segments) == 0:
-                continue
-            color = np.broadcast_to(np.asarray(outline.color, dtype=float), (len(segments), 4)).copy()
-            groups.setdefault(outline.width, []).append((segments, color))
-
+    def _is_culled(self) -> bool:
+        """Return whether culling and level of detail apply, which is only the case for 2D views."""
+        return self.viewer.dims.ndisplay == 2
+
+    def _view_region(self, padding: float = 0.0) -> tuple[float, float, float, float]:
+        """Return the (xmin, ymin, xmax, ymax) scene region visible on the canvas."""
+        camera = self.viewer.camera
+        y, x = camera.center[-2:]
+        height, width = self.viewer._canvas_size
+        half_width = width / camera.zoom / 2 * (1 + padding)
+        half_height = height / camera.zoom / 2 * (1 + padding)
+        return x - half_width, y - half_height, x + half_width, y + half_height
+
+    def _lod_level(self) -> int:
+        """Return the level of detail, as a power of two of the simplification grid spacing in scene units."""
+        return int(np.floor(np.log2(LOD_TOLERANCE / max(self.viewer.camera.zoom, 1e-12))))
+
+    def _get_lod_geometry(self, level: int) -> tuple[np.ndarray, np.ndarray]:
+        """Return simplified vertices and offsets for the level of detail, caching the result."""
+        if level not in self._lod_cache:
+            self._lod_cache[level] = simplify_outlines(self._scene_vertices, self.overlay.outlines.offsets, 2.0**level)
+        return self._lod_cache[level]
+
+    def _line_groups(self, indices: np.ndarray, level: int | None) -> list[tuple[float, np.ndarray, np.ndarray]]:
+        store = self.overlay.outlines
+        if level is None:
+            vertices, offsets = self._scene_vertices, store.offsets
+        else:
+            vertices, offsets = self._get_lod_geometry(level)
+        positions, segment_outlines = outlines_to_segments(vertices, offsets, indices, closed=self.overlay.closed)
+        if len(segment_outlines) == 0:
+            return []
+
+        widths, segment_groups = np.unique(store.widths[segment_outlines], return_inverse=True)
+        vertex_groups = np.repeat(segment_groups, 2)
+        colors = np.repeat(store.colors[segment_outlines], 2, axis=0)
+        if len(widths) == 1:
+            return [(float(widths[0]), positions, colors)]
         return [
-            (
-                width,
-                np.concatenate([positions for positions, _colors in items]),
-                np.concatenate([colors for _, colors in items]),
-            )
-            for width, items in groups.items()
+            (float(width), positions[vertex_groups == group], colors[vertex_groups == group])
+            for group, width in enumerate(widths)
         ]
 
     def _on_data_change(self, _evt=None) -> None:
         """Change outline data."""
+        self._lod_cache.clear()
+        self._drawn_level = self._drawn_region = None
         layer = self._get_target_layer()
-        if layer is None or not self.overlay.outlines:
+        store = self.overlay.outlines
+        if layer is None or len(store) == 0:
+            self._scene_vertices = np.empty((0, 3))
+            self._spatial_index = None
             self._clear_lines()
             return
 
-        groups = self._line_groups(layer)
+        self._scene_vertices = outline_data_to_scene(store.vertices, layer, self.viewer.dims.displayed)
+        self._spatial_index = None
+        if self._is_culled():
+            starts = store.offsets[:-1]
+            bounds = np.stack(
+                [
+                    np.minimum.reduceat(self._scene_vertices[:, :2], starts),
+                    np.maximum.reduceat(self._scene_vertices[:, :2], starts),
+                ],
+                axis=1,
+            )
+            self._spatial_index = OutlineSpatialIndex(bounds)
+        self._update_lines()
+
+    def _on_view_change(self, _evt=None) -> None:
+        """Update displayed outlines when the view leaves the drawn region or the level of detail changes."""
+        if self._spatial_index is None:
+            return
+        region = self._drawn_region
+        if region is not None and self._lod_level() == self._drawn_level:
+            xmin, ymin, xmax, ymax = self._view_region()
+            if xmin >= region[0] and ymin >= region[1] and xmax <= region[2] and ymax <= region[3]:
+                return
+        self._update_lines()
+
+    def _update_lines(self) -> None:
+        """Upload the outlines in (and around) the current view at the current level of detail."""
+        if self._spatial_index is None:
+            indices, level = np.arange(len(self.overlay.outlines)), None
+        else:
+            level = self._lod_level()
+            region = self._view_region(padding=CULL_PADDING)
+            indices = self._spatial_index.query(*region)
+            self._drawn_level, self._drawn_region = level, region
+
+        groups = self._line_groups(indices, level)
         self._ensure_line_count(len(groups))
         for line, (width, positions, colors) in zip(self._line_nodes, groups, strict=True):
             line.set_data(pos=positions, color=colors, width=width)
@@ -182,18 +339,23 @@ class VispyObjectOutlinesOverlay(ViewerOverlayMixin, VispySceneOverlay):
         self._on_data_change()
 
     def close(self) -> None:
-        self._disconnect_outline_events()
         if self._target_layer is not None:
             disconnect_events(self._target_layer.events, self)
         disconnect_events(self.viewer.dims.events, self)
         disconnect_events(self.viewer.grid.events, self)
         disconnect_events(self.viewer.layers.events, self)
+        disconnect_events(self.viewer.camera.events, self)
+        if self._canvas is not None:
+            self._canvas.events.resize.disconnect(self._on_view_change)
         self._clear_lines()
         super().close()
 
 
 __all__ = [
+    "OutlineSpatialIndex",
     "VispyObjectOutlinesOverlay",
     "outline_data_to_scene",
+    "outlines_to_segments",
     "points_to_segments",
+    "simplify_outlines",
 ]
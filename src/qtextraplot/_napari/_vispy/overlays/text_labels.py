@@ -0,0 +1,157 @@
+"""Text label visuals."""
+
+from __future__ import annotations
+
+import numpy as np
+from napari._vispy.overlays.base import ViewerOverlayMixin, VispySceneOverlay
+from napari._vispy.utils.qt_font import FontInfo
+from napari._vispy.visuals.text import Text
+from napari.utils.events import disconnect_events
+
+from qtextraplot._napari.components.overlays.text_labels import TEXT_ANCHORS, TextLabelsOverlay
+
+# fraction of the view added on each side when culling labels so that labels anchored just outside the view (but
+# whose text is partially visible) are not culled
+CULL_MARGIN = 0.1
+
+
+def get_visible_label_indices(
+    positions: np.ndarray,
+    center: tuple[float, float],
+    zoom: float,
+    canvas_size: tuple[int, int],
+    min_zoom: float = 0.0,
+    max_visible: int | None = None,
+) -> np.ndarray:
+    """Return indices of labels that should be displayed.
+
+    Parameters
+    ----------
+    positions : np.ndarray
+        Array of (row, column) label positions in world coordinates.
+    center : tuple[float, float]
+        Center of the view in world coordinates (row, column).
+    zoom : float
+        Number of canvas pixels per world unit.
+    canvas_size : tuple[int, int]
+        Size of the canvas in pixels (height, width).
+    min_zoom : float
+        Labels are hidden when zoom is below this value.
+    max_visible : int, optional
+        Maximum number of labels to display. When more labels are in view, they are evenly subsampled.
+
+    Returns
+    -------
+    np.ndarray
+        Sorted indices of labels to display.
+    """
+    if len(positions) == 0 or zoom <= 0 or zoom < min_zoom:
+        return np.empty(0, dtype=np.intp)
+    half_extent = np.asarray(canvas_size, dtype=float) / zoom / 2 * (1 + CULL_MARGIN)
+    offset = np.abs(positions - np.asarray(center, dtype=float))
+    indices = np.flatnonzero((offset[:, 0] <= half_extent[0]) & (offset[:, 1] <= half_extent[1]))
+    if max_visible is not None and len(indices) > max_visible:
+        indices = indices[:: int(np.ceil(len(indices) / max_visible))]
+    return indices
+
+
+class VispyTextLabelsOverlay(ViewerOverlayMixin, VispySceneOverlay):
+    """Text labels visual."""
+
+    def __init__(self, viewer, overlay: TextLabelsOverlay, font_info: FontInfo, parent=None):
+        super().__init__(
+            node=Text(pos=np.zeros((1, 2)), text=[""], font_info=font_info, parent=parent),
+            viewer=viewer,
+            overlay=overlay,
+            font_info=font_info,
+            parent=parent,
+        )
+        self._indices: np.ndarray | None = None
+
+        self.overlay.events.text.connect(self._on_data_change)
+        self.overlay.events.positions.connect(self._on_data_change)
+        self.overlay.events.translation.connect(self._on_data_change)
+        self.overlay.events.min_zoom.connect(self._on_view_change)
+        self.overlay.events.max_visible.connect(self._on_view_change)
+        self.overlay.events.color.connect(self._on_color_change)
+        self.overlay.events.font_size.connect(self._on_font_size_change)
+        self.overlay.events.anchor.connect(self._on_anchor_change)
+        self.viewer.camera.events.center.connect(self._on_view_change)
+        self.viewer.camera.events.zoom.connect(self._on_view_change)
+        # connected last so that the viewer's canvas size is updated before the labels are culled
+        self._canvas = self.node.canvas
+        if self._canvas is not None:
+            self._canvas.events.resize.connect(self._on_view_change, position="last")
+
+        self.reset()
+
+    def _get_visible_indices(self) -> np.ndarray:
+        camera = self.viewer.camera
+        positions = self.overlay.positions[: len(self.overlay.text)]
+        return get_visible_label_indices(
+            positions + np.asarray(self.overlay.translation, dtype=float),
+            camera.center[-2:],
+            camera.zoom,
+            self.viewer._canvas_size,
+            self.overlay.min_zoom,
+            self.overlay.max_visible,
+        )
+
+    def _on_visible_change(self, _evt=None) -> None:
+        """Cull labels for the current view when they are shown."""
+        self._on_data_change()
+
+    def _on_view_change(self, _evt=None) -> None:
+        """Update the displayed subset of labels if it changed."""
+        if not self.overlay.visible:
+            # labels are culled again once they are shown
+            return
+        indices = self._get_visible_indices()
+        if self._indices is not None and np.array_equal(indices, self._indices):
+            return
+        self._set_labels(indices)
+
+    def _on_data_change(self, _evt=None) -> None:
+        """Change label data."""
+        self._set_labels(self._get_visible_indices())
+
+    def _set_labels(self, indices: np.ndarray) -> None:
+        self._indices = indices
+        if len(indices) == 0:
+            # vispy does not handle empty text well so the visual is hidden instead
+            self.node.visible = False
+            return
+        positions = self.overlay.positions[indices] + np.asarray(self.overlay.translation, dtype=float)
+        text = self.overlay.text
+        self.node.text = [text[index] for index in indices.tolist()]
+        # switch from NumPy (row, column) to VisPy (x, y) ordering
+        self.node.pos = positions[:, ::-1]
+        self.node.visible = self._should_be_visible()
+
+    def _should_be_visible(self) -> bool:
+        """Return whether labels can be shown in the current view mode."""
+        return self.overlay.visible and self._indices is not None and len(self._indices) > 0
+
+    def _on_color_change(self, _evt=None) -> None:
+        self.node.color = self.overlay.color
+
+    def _on_font_size_change(self, _evt=None) -> None:
+        self.node.font_size = self.overlay.font_size
+
+    def _on_anchor_change(self, _evt=None) -> None:
+        self.node.anchors = TEXT_ANCHORS[self.overlay.anchor]
+
+    def reset(self) -> None:
+        super().reset()
+        self._on_color_change()
+        self._on_font_size_change()
+        self._on_anchor_change()
+
+    def close(self) -> None:
+        disconnect_events(self.viewer.camera.events, self)
+        if self._canvas is not None:
+            self._canvas.events.resize.disconnect(self._on_view_change)
+        super().close()
+
+
+__all__ = ["VispyTextLabelsOverlay", "get_visible_label_indices"]
@@ -2,12 +2,173 @@
 
 from __future__ import annotations
 
+import inspect
 import typing as ty
 from abc import ABC
-from contextlib import suppress
+from bisect import bisect_left
+from contextlib import contextmanager, suppress
 
 from napari.components.layerlist import LayerList
 from napari.layers import Image, Layer
+from qtpy.QtCore import QTimer
+
+# viewer model callbacks that recompute the extent/dims of the scene and are deferred during batched updates
+DEFERRED_VIEWER_CALLBACKS = ("_on_layers_change", "_on_update_extent")
+
+
+class LayerIndex:
+    """Index of layers by name and type, kept in sync with a :class:`LayerList`.
+
+    The index listens to the ``inserted``, ``removed``, ``changed``, ``renamed`` and ``reordered`` events of the layer
+    list so that name lookups are O(1) and type lookups only touch layers of the requested type. Layers are always
+    returned in the same order as they appear in the layer list.
+    """
+
+    def __init__(self, layers: LayerList):
+        self._layers = layers
+        self._by_name: dict[str, Layer] = {}
+        self._by_type: dict[type, dict[int, Layer]] = {}
+        self._name_of: dict[int, str] = {}
+        self._rank: dict[int, int] = {}
+        self._next_rank = 0
+        self._sorted_names: list[str] | None = None
+        self.rebuild()
+
+        layers.events.inserted.connect(self._on_inserted)
+        layers.events.removed.connect(self._on_removed)
+        layers.events.changed.connect(self.rebuild)
+        layers.events.reordered.connect(self.rebuild)
+        layers.events.renamed.connect(self._on_renamed)
+
+    def __len__(self) -> int:
+        return len(self._by_name)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._by_name
+
+    def __iter__(self) -> ty.Iterator[Layer]:
+        return iter(self._by_name.values())
+
+    def rebuild(self, _evt: ty.Any = None) -> None:
+        """Rebuild the index from the current state of the layer list."""
+        self._by_name.clear()
+        self._by_type.clear()
+        self._name_of.clear()
+        self._rank.clear()
+        self._next_rank = 0
+        for layer in self._layers:
+            self._add(layer)
+        self._sorted_names = None
+
+    def _add(self, layer: Layer) -> None:
+        key = id(layer)
+        self._by_name[layer.name] = layer
+        self._by_type.setdefault(type(layer), {})[key] = layer
+        self._name_of[key] = layer.name
+        self._rank[key] = self._next_rank
+        self._next_rank += 1
+        self._sorted_names = None
+
+    def _discard(self, layer: Layer) -> None:
+        key = id(layer)
+        name = self._name_of.pop(key, None)
+        if name is not None and self._by_name.get(name) is layer:
+            del self._by_name[name]
+        bucket = self._by_type.get(type(layer))
+        if bucket is not None:
+            bucket.pop(key, None)
+            if not bucket:
+                del self._by_type[type(layer)]
+        self._rank.pop(key, None)
+        self._sorted_names = None
+
+    def _on_inserted(self, evt: ty.Any) -> None:
+        """Add layer to the index, rebuilding if it was not appended to the end of the list."""
+        if evt.index != len(self._layers) - 1:
+            self.rebuild()
+        else:
+            self._add(evt.value)
+
+    def _on_removed(self, evt: ty.Any) -> None:
+        """Remove layer from the index."""
+        self._discard(evt.value)
+
+    def _on_renamed(self, evt: ty.Any) -> None:
+        """Re-key layer after its name has changed."""
+        layer = self._layers[evt.index]
+        key = id(layer)
+        old_name = self._name_of.get(key)
+        if old_name is None:
+            self.rebuild()
+            return
+        if self._by_name.get(old_name) is layer:
+            del self._by_name[old_name]
+        self._by_name[layer.name] = layer
+        self._name_of[key] = layer.name
+        self._sorted_names = None
+
+    def get(self, name: str) -> Layer | None:
+        """Get layer by name."""
+        return self._by_name.get(name)
+
+    def of_type(self, cls: type[Layer] | tuple[type[Layer], ...]) -> list[Layer]:
+        """Get all layers that are instances of `cls`, in layer list order."""
+        buckets = [bucket for layer_type, bucket in self._by_type.items() if issubclass(layer_type, cls)]
+        if not buckets:
+            return []
+        if len(buckets) == 1:
+            return list(buckets[0].values())
+        layers = [layer for bucket in buckets for layer in bucket.values()]
+        layers.sort(key=lambda layer: self._rank[id(layer)])
+        return layers
+
+    def with_prefix(self, prefix: str, cls: type[Layer] | tuple[type[Layer], ...] | None = None) -> list[Layer]:
+        """Get all layers whose name starts with `prefix`, in layer list order."""
+        if self._sorted_names is None:
+            self._sorted_names = sorted(self._by_name)
+        names = self._sorted_names
+        layers = []
+        for index in range(bisect_left(names, prefix), len(names)):
+            name = names[index]
+            if not name.startswith(prefix):
+                break
+            layer = self._by_name[name]
+            if cls is None or isinstance(layer, cls):
+                layers.append(layer)
+        layers.sort(key=lambda layer: self._rank[id(layer)])
+        return layers
+
+
+class CanvasRefreshManager:
+    """Coalesce canvas refresh requests from many views into a single pass on the next event-loop iteration.
+
+    Only views whose canvas is exposed on screen and which changed while hidden are re-rendered; the remaining views
+    keep their dirty flag and are refreshed the next time they are requested while exposed.
+    """
+
+    def __init__(self):
+        self._pending: dict[int, ViewerBase] = {}
+        self._scheduled = False
+
+    def request(self, *views: ViewerBase) -> None:
+        """Request refresh of the specified views."""
+        for view in views:
+            self._pending[id(view)] = view
+        if self._pending and not self._scheduled:
+            self._scheduled = True
+            QTimer.singleShot(0, self.flush)
+
+    def flush(self) -> None:
+        """Refresh all pending views."""
+        self._scheduled = False
+        pending, self._pending = self._pending, {}
+        for view in pending.values():
+            # the widget might have been deleted in the meantime
+            with suppress(RuntimeError):
+                view.refresh_if_needed()
+
+
+REFRESH_MANAGER = CanvasRefreshManager()
 
 
 class ViewerBase(ABC):
@@ -18,6 +179,9 @@ class ViewerBase(ABC):
     viewer: ty.Any
     widget: ty.Any
     _callbacks = None
+    _batch_depth = 0
+    # flag to indicate that the canvas changed while it was not visible and must be re-rendered once it's exposed
+    _needs_refresh = True
 
     @property
     def is_vispy(self) -> bool:
@@ -39,6 +203,50 @@ class ViewerBase(ABC):
         """Get camera."""
         return self.widget.canvas.camera._view.camera
 
+    @property
+    def layer_index(self) -> LayerIndex | None:
+        """Index of layers by name and type, or ``None`` if the layer list does not emit events."""
+        index = self.__dict__.get("_layer_index")
+        if index is None or index._layers is not self.viewer.layers:
+            layers = self.viewer.layers
+            if not isinstance(layers, LayerList):
+                return None
+            index = self.__dict__["_layer_index"] = LayerIndex(layers)
+        return index
+
+    @property
+    def is_exposed(self) -> bool:
+        """Flag to indicate whether the canvas is currently visible on screen."""
+        native = self.widget.canvas.native
+        return native.isVisible() and not native.visibleRegion().isEmpty()
+
+    def _connect_refresh_events(self) -> None:
+        """Track changes to the canvas that happen while it is hidden."""
+        self.viewer.layers.events.connect(self._on_canvas_changed)
+        self.viewer.camera.events.connect(self._on_canvas_changed)
+        self.viewer.dims.events.connect(self._on_canvas_changed)
+
+    def _on_canvas_changed(self, _evt: ty.Any = None) -> None:
+        """Mark canvas as requiring refresh if it changed while hidden."""
+        if not self._needs_refresh and not self.is_exposed:
+            self._needs_refresh = True
+
+    def refresh(self) -> None:
+        """Re-render the canvas."""
+        self.widget.canvas.native.update()
+        self._needs_refresh = False
+
+    def refresh_if_needed(self) -> bool:
+        """Re-render the canvas if it's exposed and changed while it was hidden."""
+        if self._needs_refresh and self.is_exposed:
+            self.refresh()
+            return True
+        return False
+
+    def request_refresh(self) -> None:
+        """Request refresh of the canvas on the next event-loop iteration."""
+        REFRESH_MANAGER.request(self)
+
     def _clear(self, _evt=None) -> None:  # noqa: B027
         """Clear canvas."""
 
@@ -73,11 +281,76 @@ class ViewerBase(ABC):
                 exclude_names.add(item)
             elif isinstance(item, Layer) and item.name:
                 exclude_names.add(item.name)
-        for layer in list(self.viewer.layers):
-            if layer.name not in exclude_names:
-                self.viewer.layers.remove(layer)
+        index = self.layer_index
+        with self.batched_update():
+            for layer in list(index if index is not None else self.viewer.layers):
+                if layer.name not in exclude_names:
+                    self.viewer.layers.remove(layer)
         self._reset_text_overlay()
 
+    @contextmanager
+    def batched_update(self, reset_view: bool = False) -> ty.Iterator[None]:
+        """Update many layers while deferring extent and dims recomputation until the end of the block.
+
+        Normally, every change to layer data, transforms or visibility makes the viewer model recompute the extent of
+        all layers and update the dims, which in turn re-slices the layers. Inside this context, those viewer callbacks
+        are blocked on all layers (including layers added within the block), the recomputation triggered by inserting
+        or removing layers is skipped, and the callbacks are called exactly once on exit.
+
+        Parameters
+        ----------
+        reset_view : bool
+            If True, the view is reset once all updates have been applied.
+        """
+        if self._batch_depth or not isinstance(self.viewer.layers, LayerList):
+            self._batch_depth += 1
+            try:
+                yield
+            finally:
+                self._batch_depth -= 1
+            return
+
+        viewer = self.viewer
+        callbacks = [getattr(viewer, name) for name in DEFERRED_VIEWER_CALLBACKS if hasattr(viewer, name)]
+        blocked = []
+
+        def _block(group: ty.Any) -> None:
+            for emitter in (group, *group.emitters.values()):
+                for callback in callbacks:
+                    emitter.block(callback)
+                blocked.append(emitter)
+
+        def _on_inserted(evt: ty.Any) -> None:
+            _block(evt.value.events)
+
+        _block(viewer.layers.events)
+        for layer in viewer.layers:
+            _block(layer.events)
+        viewer.layers.events.inserted.connect(_on_inserted)
+        # viewer models call `_on_layers_change` directly when layers are inserted or removed, which blocking the
+        # events does not prevent, so models that support it skip the recomputation while the flag is set
+        deferrable = hasattr(viewer, "_layers_change_deferred")
+        if deferrable:
+            viewer._layers_change_deferred = True
+        self._batch_depth = 1
+        try:
+            yield
+        finally:
+            self._batch_depth = 0
+            if deferrable:
+                viewer._layers_change_deferred = False
+            viewer.layers.events.inserted.disconnect(_on_inserted)
+            for emitter in blocked:
+                for callback in callbacks:
+                    emitter.unblock(callback)
+            for callback in callbacks:
+                if inspect.signature(callback).parameters:
+                    callback(None)
+                else:
+                    callback()
+            if reset_view:
+                viewer.reset_view()
+
     def close(self) -> None:
         """Close the view instance."""
         self.viewer.layers.clear()
@@ -90,6 +363,9 @@ class ViewerBase(ABC):
 
     def get_layer(self, name: str) -> Layer | None:
         """Get layer."""
+        index = self.layer_index
+        if index is not None:
+            return index.get(name)
         try:
             return self.viewer.layers[name]
         except KeyError:
@@ -109,14 +385,19 @@ class ViewerBase(ABC):
 
     def remove_layers(self, names: ty.Iterable[str]) -> None:
         """Remove multiple layers."""
-        for name in names:
-            self.remove_layer(name)
+        with self.batched_update():
+            for name in names:
+                self.remove_layer(name)
 
     def try_reuse(self, name: str, cls: ty.Type[Layer], reuse: bool = True) -> Layer | None:
         """Try retrieving layer from the layer list."""
         if not reuse:
             self.remove_layer(name, silent=True)
             return None
+        index = self.layer_index
+        if index is not None:
+            layer = index.get(name)
+            return layer if isinstance(layer, cls) else None
         try:
             layer = self.viewer.layers[name]
             return layer if isinstance(layer, cls) else None
@@ -135,19 +416,29 @@ class ViewerBase(ABC):
 
     def get_layers_of_type(self, cls: Layer) -> ty.List[Layer]:
         """Get all layers of type."""
+        index = self.layer_index
+        if index is not None:
+            return index.of_type(cls)
         layers = []
         for layer in self.viewer.layers:
             if isinstance(layer, cls):
                 layers.append(layer)
         return layers
 
+    def get_layers_with_prefix(self, prefix: str, cls: Layer | None = None) -> ty.List[Layer]:
+        """Get all layers whose name starts with `prefix`, optionally restricted to layers of type `cls`."""
+        index = self.layer_index
+        if index is not None:
+            return index.with_prefix(prefix, cls)
+        return [
+            layer
+            for layer in self.viewer.layers
+            if layer.name.startswith(prefix) and (cls is None or isinstance(layer, cls))
+        ]
+
     def get_layers_of_type_with_attr_value(self, cls: Layer, attr: str, value: ty.Any) -> ty.List[Layer]:
         """Get all layers of type."""
-        layers = []
-        for layer in self.viewer.layers:
-            if isinstance(layer, cls) and getattr(layer, attr) == value:
-                layers.append(layer)
-        return layers
+        return [layer for layer in self.get_layers_of_type(cls) if getattr(layer, attr) == value]
 
     def update_attribute(self, name: str, **kwargs: ty.Any) -> None:
         """Update attribute."""
@@ -105,17 +105,12 @@ class QtObjectOutlineControls(QtFramelessPopup):
             events.visible.disconnect(self._on_visible_change)
             events.closed.disconnect(self._on_closed_change)
             events.outlines.disconnect(self._on_outlines_change)
-            for outline in self._selected_overlay.outlines:
-                disconnect_events(outline.events, self)
         self._selected_overlay = overlay
         if overlay is None:
             return
         overlay.events.visible.connect(self._on_visible_change)
         overlay.events.closed.connect(self._on_closed_change)
         overlay.events.outlines.connect(self._on_outlines_change)
-        for outline in overlay.outlines:
-            outline.events.width.connect(self._on_width_change)
-            outline.events.color.connect(self._on_color_change)
 
     def _set_controls_enabled(self, enabled: bool) -> None:
         self.visible_checkbox.setEnabled(enabled)
@@ -195,9 +190,7 @@ class QtObjectOutlineControls(QtFramelessPopup):
         overlay = self._selected_overlay
         if overlay is None:
             return
-        width = self.width_spinbox.value()
-        for outline in overlay.outlines:
-            outline.width = width
+        overlay.set_style(width=self.width_spinbox.value())
 
     def _on_width_change(self, _event=None) -> None:
         """Update width control."""
@@ -205,7 +198,7 @@ class QtObjectOutlineControls(QtFramelessPopup):
         if overlay is None or not overlay.outlines:
             return
         with hp.qt_signals_blocked(self.width_spinbox):
-            self.width_spinbox.setValue(overlay.outlines[0].width)
+            self.width_spinbox.setValue(float(overlay.outlines.widths[0]))
 
     @Slot(np.ndarray)  # type: ignore[misc]
     def on_change_color(self, color: np.ndarray) -> None:
@@ -213,8 +206,7 @@ class QtObjectOutlineControls(QtFramelessPopup):
         overlay = self._selected_overlay
         if overlay is None:
             return
-        for outline in overlay.outlines:
-            outline.color = color
+        overlay.set_style(color=color)
 
     def _on_color_change(self, _event=None) -> None:
         """Update color control."""
@@ -222,11 +214,10 @@ class QtObjectOutlineControls(QtFramelessPopup):
         if overlay is None or not overlay.outlines:
             return
         with hp.qt_signals_blocked(self.color_swatch):
-            self.color_swatch.setColor(overlay.outlines[0].color)
+            self.color_swatch.setColor(overlay.outlines.colors[0])
 
     def _on_outlines_change(self, _event=None) -> None:
-        """Reconnect outline events and refresh controls."""
-        self._connect_selected_overlay(self._selected_overlay)
+        """Refresh controls when outlines or their style change."""
         self._refresh_controls()
 
     def on_clear_selected_overlay(self) -> None:
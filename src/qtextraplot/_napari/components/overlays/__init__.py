@@ -1,11 +1,20 @@
 """Overlay component models."""
 
 from qtextraplot._napari.components.overlays.legend import LegendEntry, LegendOverlay
-from qtextraplot._napari.components.overlays.object_outlines import ObjectOutline, ObjectOutlinesOverlay
+from qtextraplot._napari.components.overlays.object_outlines import (
+    FrozenObjectOutline,
+    ObjectOutline,
+    ObjectOutlinesOverlay,
+    OutlineStore,
+)
+from qtextraplot._napari.components.overlays.text_labels import TextLabelsOverlay
 
 __all__ = [
+    "FrozenObjectOutline",
     "LegendEntry",
     "LegendOverlay",
     "ObjectOutline",
     "ObjectOutlinesOverlay",
+    "OutlineStore",
+    "TextLabelsOverlay",
 ]
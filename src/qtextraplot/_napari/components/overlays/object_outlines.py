@@ -10,7 +10,7 @@ from napari.components.overlays import SceneOverlay
 from napari.utils.colormaps.standardize_color import transform_color
 from napari.utils.events import EventedModel
 from napari.utils.events.custom_types import Array
-from pydantic import ConfigDict, field_validator
+from pydantic import ConfigDict, Field, field_validator
 
 ColorLike = ty.Any
 OutlineData = np.ndarray
@@ -29,6 +29,7 @@ WIDTH_COUNT_ERROR = "Width count must be one or match the number of outlines."
 OUTLINE_WIDTHS_ERROR = "Outline widths must be positive."
 OBJECT_COLOR_ERROR = "Object outline color must be a single color."
 OBJECT_WIDTH_ERROR = "Object outline width must be positive."
+OUTLINE_COLUMNS_ERROR = "All outlines must have the same number of columns."
 MISSING = object()
 
 
@@ -67,31 +68,167 @@ def _coerce_outline_arrays(value: OutlineInput | ObjectOutline | ty.Sequence[Obj
     raise TypeError(OUTLINE_INPUT_ERROR)
 
 
-def _coerce_colors(color: ColorLike, n_outlines: int) -> tuple[np.ndarray, ...]:
+def _coerce_color_array(color: ColorLike, n_outlines: int) -> np.ndarray:
     colors = transform_color(color)
     if len(colors) == 1:
-        return tuple(colors[0].copy() for _ in range(n_outlines))
+        return np.repeat(colors, n_outlines, axis=0)
     if n_outlines == 1:
         raise ValueError(SINGLE_COLOR_ERROR)
     if len(colors) != n_outlines:
         raise ValueError(COLOR_COUNT_ERROR)
-    return tuple(np.asarray(color_, dtype=float) for color_ in colors)
+    return np.asarray(colors, dtype=float)
 
 
-def _coerce_widths(width: WidthLike, n_outlines: int) -> tuple[float, ...]:
+def _coerce_colors(color: ColorLike, n_outlines: int) -> tuple[np.ndarray, ...]:
+    return tuple(_coerce_color_array(color, n_outlines))
+
+
+def _coerce_width_array(width: WidthLike, n_outlines: int) -> np.ndarray:
     widths = np.asarray(width, dtype=float)
     if widths.ndim == 0 or widths.size == 1:
         width_value = float(widths.reshape(-1)[0])
         if width_value <= 0:
             raise ValueError(OUTLINE_WIDTH_ERROR)
-        return (width_value,) * n_outlines
+        return np.full(n_outlines, width_value)
     if n_outlines == 1:
         raise ValueError(SINGLE_WIDTH_ERROR)
     if widths.ndim != 1 or widths.size != n_outlines:
         raise ValueError(WIDTH_COUNT_ERROR)
     if np.any(widths <= 0):
         raise ValueError(OUTLINE_WIDTHS_ERROR)
-    return tuple(float(width_value) for width_value in widths)
+    return widths
+
+
+def _coerce_widths(width: WidthLike, n_outlines: int) -> tuple[float, ...]:
+    return tuple(_coerce_width_array(width, n_outlines).tolist())
+
+
+def _pack_outline_arrays(value: ty.Any) -> tuple[np.ndarray, np.ndarray]:
+    """Pack outline data into a single vertex array and outline offsets, validating all outlines at once."""
+    if isinstance(value, np.ndarray) and value.ndim == 3:
+        n_outlines, n_points, n_columns = value.shape
+        if n_outlines and (n_points < 2 or n_columns < 2):
+            raise ValueError(OUTLINE_DATA_ERROR)
+        return value.reshape(-1, n_columns).astype(float), np.arange(n_outlines + 1, dtype=np.intp) * n_points
+
+    if isinstance(value, cabc.Sequence) and value and all(isinstance(outline, np.ndarray) for outline in value):
+        arrays: ty.Sequence[np.ndarray] = value
+    else:
+        arrays = _coerce_outline_arrays(value)
+    if not arrays:
+        return np.empty((0, 2), dtype=float), np.zeros(1, dtype=np.intp)
+    if any(outline.ndim != 2 for outline in arrays):
+        raise ValueError(OUTLINE_DATA_ERROR)
+    lengths = np.fromiter((len(outline) for outline in arrays), dtype=np.intp, count=len(arrays))
+    try:
+        vertices = np.concatenate(arrays).astype(float, copy=False)
+    except ValueError:
+        raise ValueError(OUTLINE_COLUMNS_ERROR) from None
+    if lengths.min() < 2 or vertices.shape[1] < 2:
+        raise ValueError(OUTLINE_DATA_ERROR)
+    offsets = np.zeros(len(lengths) + 1, dtype=np.intp)
+    np.cumsum(lengths, out=offsets[1:])
+    return vertices, offsets
+
+
+class OutlineStore:
+    """Columnar storage of many object outlines.
+
+    All vertices are held in a single array and outline ``i`` is ``vertices[offsets[i]:offsets[i + 1]]``, so large
+    outline sets can be set, restyled and rendered without creating a model for each object. Indexing returns a
+    read-only :class:`FrozenObjectOutline` snapshot of a single outline; use :meth:`ObjectOutlinesOverlay.set_outlines`
+    or :meth:`ObjectOutlinesOverlay.set_style` to change outlines.
+    """
+
+    __slots__ = ("_bounds", "colors", "offsets", "vertices", "widths")
+
+    def __init__(self, vertices: np.ndarray, offsets: np.ndarray, colors: np.ndarray, widths: np.ndarray):
+        self.vertices = vertices
+        self.offsets = offsets
+        self.colors = colors
+        self.widths = widths
+        self._bounds: np.ndarray | None = None
+
+    @classmethod
+    def empty(cls) -> OutlineStore:
+        """Return a store without any outlines."""
+        return cls(np.empty((0, 2)), np.zeros(1, dtype=np.intp), np.empty((0, 4)), np.empty(0))
+
+    @classmethod
+    def from_outlines(
+        cls,
+        outlines: OutlineInput | ObjectOutline | ty.Sequence[ObjectOutline] | OutlineStore,
+        color: ColorLike = MISSING,
+        width: WidthLike = MISSING,
+    ) -> OutlineStore:
+        """Build a store from outline data, object outline models or another store.
+
+        Style taken from models or another store is kept unless ``color`` or ``width`` are specified, otherwise
+        outlines default to red lines of unit width.
+        """
+        if isinstance(outlines, OutlineStore):
+            return outlines.with_style(color=color, width=width)
+        if isinstance(outlines, ObjectOutline):
+            outlines = (outlines,)
+        if isinstance(outlines, cabc.Sequence) and outlines and all(isinstance(o, ObjectOutline) for o in outlines):
+            models = ty.cast(ty.Sequence[ObjectOutline], outlines)
+            outlines = [outline.data for outline in models]
+            if color is MISSING:
+                color = [outline.color for outline in models]
+            if width is MISSING:
+                width = [outline.width for outline in models]
+        vertices, offsets = _pack_outline_arrays(outlines)
+        n_outlines = len(offsets) - 1
+        colors = _coerce_color_array("red" if color is MISSING else color, n_outlines)
+        widths = _coerce_width_array(1.0 if width is MISSING else width, n_outlines)
+        return cls(vertices, offsets, colors, widths)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> FrozenObjectOutline:
+        index = range(len(self))[index]
+        # read-only view, so that the shared vertices cannot be modified through the snapshot
+        data = self.outline_data(index).view()
+        data.flags.writeable = False
+        return FrozenObjectOutline(data=data, color=self.colors[index], width=self.widths[index])
+
+    def __iter__(self) -> ty.Iterator[FrozenObjectOutline]:
+        return (self[index] for index in range(len(self)))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}<n_outlines={len(self)}, n_vertices={len(self.vertices)}>"
+
+    @property
+    def lengths(self) -> np.ndarray:
+        """Number of vertices in each outline."""
+        return np.diff(self.offsets)
+
+    @property
+    def bounds(self) -> np.ndarray:
+        """Per-outline bounding boxes with shape ``(n_outlines, 2, n_columns)`` holding the minimum and maximum."""
+        if self._bounds is None:
+            if len(self) == 0:
+                self._bounds = np.empty((0, 2, self.vertices.shape[1]))
+            else:
+                starts = self.offsets[:-1]
+                self._bounds = np.stack(
+                    [np.minimum.reduceat(self.vertices, starts), np.maximum.reduceat(self.vertices, starts)],
+                    axis=1,
+                )
+        return self._bounds
+
+    def outline_data(self, index: int) -> np.ndarray:
+        """Return vertices of a single outline."""
+        return self.vertices[self.offsets[index] : self.offsets[index + 1]]
+
+    def with_style(self, color: ColorLike = MISSING, width: WidthLike = MISSING) -> OutlineStore:
+        """Return a store sharing the outline geometry with a new color and/or width."""
+        colors = self.colors if color is MISSING else _coerce_color_array(color, len(self))
+        widths = self.widths if width is MISSING else _coerce_width_array(width, len(self))
+        store = type(self)(self.vertices, self.offsets, colors, widths)
+        store._bounds = self._bounds
+        return store
 
 
 def normalize_object_outlines(
@@ -140,53 +277,64 @@ class ObjectOutline(EventedModel):
         return width
 
 
+class FrozenObjectOutline(ObjectOutline):
+    """Read-only snapshot of an outline held in an :class:`OutlineStore`; assigning to its fields raises an error."""
+
+    model_config = ObjectOutline.model_config | ConfigDict(frozen=True)
+
+
 class ObjectOutlinesOverlay(SceneOverlay):
-    """Object outlines rendered over image data."""
+    """Object outlines rendered over image data.
+
+    Outlines are held in an :class:`OutlineStore` so that tens of thousands of outlines can be set at once.
+    """
+
+    model_config = SceneOverlay.model_config | ConfigDict(arbitrary_types_allowed=True)
 
     gridded: ty.ClassVar[bool] = False
-    outlines: tuple[ObjectOutline, ...] = ()
+    outlines: OutlineStore = Field(default_factory=OutlineStore.empty)
     target_layer: str | None = None
     closed: bool = True
 
     def __init__(self, **data: ty.Any):
         color = data.pop("color", MISSING)
         width = data.pop("width", MISSING)
-        if "outlines" in data and (color is not MISSING or width is not MISSING):
-            data["outlines"] = normalize_object_outlines(
-                data["outlines"],
-                color="red" if color is MISSING else color,
-                width=1.0 if width is MISSING else width,
-            )
+        if data.get("outlines") is not None:
+            data["outlines"] = OutlineStore.from_outlines(data["outlines"], color=color, width=width)
         super().__init__(**data)
 
     @field_validator("outlines", mode="before")
     @classmethod
-    def _coerce_outlines(cls, value: ty.Any) -> tuple[ObjectOutline, ...]:
+    def _coerce_outlines(cls, value: ty.Any) -> OutlineStore:
         if value is None:
-            return ()
-        if isinstance(value, ObjectOutline):
-            return (value,)
-        if isinstance(value, cabc.Sequence) and all(isinstance(outline, ObjectOutline) for outline in value):
-            return tuple(value)
-        return normalize_object_outlines(value)
+            return OutlineStore.empty()
+        if isinstance(value, OutlineStore):
+            return value
+        return OutlineStore.from_outlines(value)
 
     def set_outlines(
         self,
-        outlines: OutlineInput | ObjectOutline | ty.Sequence[ObjectOutline],
+        outlines: OutlineInput | ObjectOutline | ty.Sequence[ObjectOutline] | OutlineStore,
         color: ColorLike = "red",
         width: WidthLike = 1.0,
     ) -> None:
         """Set outline coordinate data and drawing style."""
-        self.outlines = normalize_object_outlines(outlines, color=color, width=width)
+        self.outlines = OutlineStore.from_outlines(outlines, color=color, width=width)
+
+    def set_style(self, color: ColorLike = MISSING, width: WidthLike = MISSING) -> None:
+        """Change color and/or width of all outlines without touching their coordinates."""
+        self.outlines = self.outlines.with_style(color=color, width=width)
 
 
 __all__ = [
     "ColorLike",
+    "FrozenObjectOutline",
     "ObjectOutline",
     "ObjectOutlinesOverlay",
     "OutlineData",
     "OutlineDataLike",
     "OutlineInput",
+    "OutlineStore",
     "WidthLike",
     "normalize_object_outlines",
 ]
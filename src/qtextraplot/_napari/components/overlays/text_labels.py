@@ -0,0 +1,124 @@
+"""Text label overlays."""
+
+from __future__ import annotations
+
+import typing as ty
+
+import numpy as np
+from napari.components.overlays import SceneOverlay
+from napari.utils.colormaps.standardize_color import transform_color
+from napari.utils.events.custom_types import Array
+from pydantic import ConfigDict, field_validator
+
+ColorLike = ty.Any
+
+TEXT_LABEL_POSITION_ERROR = "Text label positions must be a two-dimensional array with two columns."
+TEXT_LABEL_COUNT_ERROR = "The number of text labels must match the number of positions."
+TEXT_LABEL_COLOR_ERROR = "Text label color must be a single color."
+TEXT_LABEL_SIZE_ERROR = "Text label font size must be positive."
+TEXT_LABEL_MAX_ERROR = "Maximum number of visible text labels must be positive."
+TEXT_LABEL_ANCHOR_ERROR = "Text label anchor must be one of: {}."
+
+# napari text anchor -> (vispy anchor_x, vispy anchor_y)
+TEXT_ANCHORS = {
+    "center": ("center", "center"),
+    "upper_left": ("left", "top"),
+    "upper_right": ("right", "top"),
+    "lower_left": ("left", "bottom"),
+    "lower_right": ("right", "bottom"),
+}
+
+
+def _coerce_positions(value: ty.Any) -> np.ndarray:
+    if value is None:
+        return np.empty((0, 2), dtype=float)
+    data = np.asarray(value, dtype=float)
+    if data.size == 0:
+        return np.empty((0, 2), dtype=float)
+    if data.ndim == 1 and data.size == 2:
+        data = data.reshape(1, 2)
+    if data.ndim != 2 or data.shape[1] != 2:
+        raise ValueError(TEXT_LABEL_POSITION_ERROR)
+    return data
+
+
+class TextLabelsOverlay(SceneOverlay):
+    """Text annotations rendered by a single visual, without the overhead of a Points layer.
+
+    Labels outside of the current view are culled and, when zoomed out, labels are hidden (``min_zoom``) or
+    subsampled (``max_visible``) so that dense label sets remain responsive.
+    """
+
+    model_config = SceneOverlay.model_config | ConfigDict(arbitrary_types_allowed=True)
+
+    gridded: ty.ClassVar[bool] = False
+    text: tuple[str, ...] = ()
+    positions: np.ndarray = np.empty((0, 2), dtype=float)
+    color: Array[float, (4,)] = (1.0, 1.0, 1.0, 1.0)
+    font_size: float = 12.0
+    anchor: str = "upper_left"
+    translation: tuple[float, float] = (0.0, 0.0)
+    min_zoom: float = 0.0
+    max_visible: int = 1000
+
+    @field_validator("text", mode="before")
+    @classmethod
+    def _coerce_text(cls, value: ty.Any) -> tuple[str, ...]:
+        if value is None:
+            return ()
+        if isinstance(value, str):
+            return (value,)
+        return tuple(str(text) for text in value)
+
+    @field_validator("positions", mode="before")
+    @classmethod
+    def _coerce_positions(cls, value: ty.Any) -> np.ndarray:
+        return _coerce_positions(value)
+
+    @field_validator("color", mode="before")
+    @classmethod
+    def _coerce_color(cls, value: ColorLike) -> np.ndarray:
+        colors = transform_color(value)
+        if len(colors) != 1:
+            raise ValueError(TEXT_LABEL_COLOR_ERROR)
+        return colors[0]
+
+    @field_validator("font_size", mode="before")
+    @classmethod
+    def _coerce_font_size(cls, value: float) -> float:
+        font_size = float(value)
+        if font_size <= 0:
+            raise ValueError(TEXT_LABEL_SIZE_ERROR)
+        return font_size
+
+    @field_validator("anchor", mode="before")
+    @classmethod
+    def _coerce_anchor(cls, value: ty.Any) -> str:
+        if hasattr(value, "value"):
+            value = value.value
+        anchor = str(value)
+        if anchor not in TEXT_ANCHORS:
+            raise ValueError(TEXT_LABEL_ANCHOR_ERROR.format(", ".join(TEXT_ANCHORS)))
+        return anchor
+
+    @field_validator("max_visible", mode="before")
+    @classmethod
+    def _coerce_max_visible(cls, value: int) -> int:
+        max_visible = int(value)
+        if max_visible <= 0:
+            raise ValueError(TEXT_LABEL_MAX_ERROR)
+        return max_visible
+
+    def set_labels(self, text: ty.Sequence[str], positions: ty.Any) -> None:
+        """Set label text and positions, emitting a single update."""
+        text = self._coerce_text(text)
+        positions = _coerce_positions(positions)
+        if len(text) != len(positions):
+            raise ValueError(TEXT_LABEL_COUNT_ERROR)
+        with self.events.text.blocked(), self.events.positions.blocked():
+            self.text = text
+            self.positions = positions
+        self.events.positions.emit(self.positions)
+
+
+__all__ = ["TEXT_ANCHORS", "TextLabelsOverlay"]
@@ -68,6 +68,8 @@ class ViewerModelBase(KeymapProvider, MousemapProviderPydantic, EventedModel):
     # Need to use default factory because slicer is not copyable which
     # is required for default values.
     _layer_slicer: _LayerSlicer = PrivateAttr(default_factory=_LayerSlicer)
+    # set while layers are updated in a batch, see `ViewerBase.batched_update`
+    _layers_change_deferred: bool = PrivateAttr(default=False)
 
     def __init__(
         self,
@@ -274,6 +276,8 @@ class ViewerModelBase(KeymapProvider, MousemapProviderPydantic, EventedModel):
             self.reset_view()
 
     def _on_layers_change(self, event):
+        if self._layers_change_deferred:
+            return
         if len(self.layers) == 0:
             self.dims.ndim = 2
             self.dims.reset()
@@ -1,5 +1,7 @@
 """Camera model."""
 
+from time import perf_counter
+
 import numpy as np
 from vispy.scene import ArcballCamera, PanZoomCamera
 
@@ -34,12 +36,25 @@ class VispyCamera:
         napari camera model.
     dims : napari.components.Dims
         napari dims model.
+    sync_tolerance : float
+        Absolute and relative tolerance used to decide whether the vispy camera has moved since the last time its
+        state was synced back to the camera model.
+    sync_interval : float
+        Minimum time (in seconds) between two syncs of the camera model. Changes that occur more frequently are
+        coalesced and synced once the interval has elapsed. Set to 0 to sync on every draw where the camera moved.
     """
 
-    def __init__(self, view, camera, dims):
+    def __init__(self, view, camera, dims, sync_tolerance: float = 1e-6, sync_interval: float = 0.0):
         self._view = view
         self._camera = camera
         self._dims = dims
+        self.sync_tolerance = sync_tolerance
+        self.sync_interval = sync_interval
+
+        # state of the vispy camera when it was last synced with the model
+        self._last_synced: np.ndarray | None = None
+        self._last_sync_time = 0.0
+        self._sync_timer = None
 
         # Create 2D camera
         self._2D_camera = PanZoomCamera(aspect=1)
@@ -135,6 +150,7 @@ class VispyCamera:
             self._view.camera = self._3D_camera
         else:
             self._view.camera = self._2D_camera
+        self._last_synced = None
         self._on_center_change(None)
         self._on_zoom_change(None)
         self._on_angles_change(None)
@@ -148,17 +164,62 @@ class VispyCamera:
     def _on_angles_change(self, event):
         self.angles = self._camera.angles
 
+    def _get_state(self) -> tuple[tuple, tuple, float]:
+        """Return current angles, center and zoom of the vispy camera."""
+        return self.angles, self.center, self.zoom
+
+    def _has_changed(self, state: tuple[tuple, tuple, float]) -> bool:
+        """Check whether the camera state differs from the last synced state."""
+        if self._last_synced is None:
+            return True
+        angles, center, zoom = state
+        values = np.array([*angles, *center, zoom], dtype=float)
+        if values.shape != self._last_synced.shape:
+            return True
+        return not np.allclose(values, self._last_synced, rtol=self.sync_tolerance, atol=self.sync_tolerance)
+
+    def _sync(self, state: tuple[tuple, tuple, float]) -> None:
+        """Update camera model with the state of the vispy camera."""
+        angles, center, zoom = state
+        with self._camera.events.angles.blocker(self._on_angles_change):
+            self._camera.angles = angles
+        with self._camera.events.center.blocker(self._on_center_change):
+            self._camera.center = center
+        with self._camera.events.zoom.blocker(self._on_zoom_change):
+            self._camera.zoom = zoom
+        self._last_synced = np.array([*angles, *center, zoom], dtype=float)
+        self._last_sync_time = perf_counter()
+
+    def _schedule_sync(self, delay: float) -> None:
+        """Sync the camera model once `delay` has elapsed, unless a sync is already scheduled."""
+        if self._sync_timer is not None:
+            return
+        from vispy.app import Timer
+
+        self._sync_timer = Timer(interval=max(delay, 0.0), connect=self._on_sync_timer, iterations=1, start=True)
+
+    def _on_sync_timer(self, _event=None) -> None:
+        """Perform the sync that was deferred by the rate limit."""
+        self._sync_timer = None
+        state = self._get_state()
+        if self._has_changed(state):
+            self._sync(state)
+
     def on_draw(self, event):
         """Called whenever the canvas is drawn.
 
-        Update camera model angles, center, and zoom.
+        Update camera model angles, center, and zoom, but only if the camera moved since the last sync and, if
+        ``sync_interval`` is set, the last sync happened long enough ago.
         """
-        with self._camera.events.angles.blocker(self._on_angles_change):
-            self._camera.angles = self.angles
-        with self._camera.events.center.blocker(self._on_center_change):
-            self._camera.center = self.center
-        with self._camera.events.zoom.blocker(self._on_zoom_change):
-            self._camera.zoom = self.zoom
+        state = self._get_state()
+        if not self._has_changed(state):
+            return
+        if self.sync_interval > 0:
+            elapsed = perf_counter() - self._last_sync_time
+            if elapsed < self.sync_interval:
+                self._schedule_sync(self.sync_interval - elapsed)
+                return
+        self._sync(state)
 
 
 def viewbox_key_event(event):
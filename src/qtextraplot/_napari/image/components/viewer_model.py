@@ -27,6 +27,7 @@ from qtextraplot._napari.components.overlays.object_outlines import (
     OutlineInput,
     WidthLike,
 )
+from qtextraplot._napari.components.overlays.text_labels import TextLabelsOverlay
 from qtextraplot._napari.image.components._viewer_mouse_bindings import crosshair, double_click_to_zoom_reset
 
 if ty.TYPE_CHECKING:
@@ -40,6 +41,7 @@ LEGEND_OVERLAY_NAME = "Legend"
 POINTS_LAYER_ERROR = "Legend source layer must be a Points layer."
 LEGEND_SOURCE_EVENTS = ("data", "face_color", "border_color", "symbol", "properties", "features")
 OBJECT_OUTLINES_OVERLAY_NAME = "Object outlines"
+TEXT_LABELS_OVERLAY_NAME = "Text labels"
 
 
 class Viewer(_ViewerModel):
@@ -47,6 +49,8 @@ class Viewer(_ViewerModel):
 
     _instances: ty.ClassVar[WeakSet[Viewer]] = WeakSet()
     _legend_source_layers: list[Points] = PrivateAttr(default_factory=list)
+    # set while layers are updated in a batch, see `ViewerBase.batched_update`
+    _layers_change_deferred: bool = PrivateAttr(default=False)
 
     def __init__(self, title: str = "qtextraplot", **kwargs: ty.Any):
         super().__init__(title=title)
@@ -66,6 +70,12 @@ class Viewer(_ViewerModel):
         self.layers.events.changed.connect(self._refresh_legend_source_connections)
         self._instances.add(self)
 
+    def _on_layers_change(self, _event: ty.Any = None) -> None:
+        """Update dims from the extent of all layers, unless layers are being updated in a batch."""
+        if self._layers_change_deferred:
+            return
+        super()._on_layers_change()
+
     @property
     def cross_hair(self) -> CrossHairOverlay:
         """Crosshair overlay."""
@@ -333,11 +343,56 @@ class Viewer(_ViewerModel):
             if isinstance(overlay, ObjectOutlinesOverlay):
                 del self._overlays[overlay_name]
 
+    def text_label_overlays(self) -> dict[str, TextLabelsOverlay]:
+        """Return text label overlays keyed by overlay name."""
+        return {name: overlay for name, overlay in self._overlays.items() if isinstance(overlay, TextLabelsOverlay)}
+
+    def set_text_labels(
+        self,
+        text: ty.Sequence[str],
+        positions: ty.Any,
+        *,
+        name: str = TEXT_LABELS_OVERLAY_NAME,
+        color: LegendColorLike = "white",
+        font_size: float = 12.0,
+        anchor: str = "upper_left",
+        translation: tuple[float, float] = (0.0, 0.0),
+        min_zoom: float = 0.0,
+        max_visible: int = 1000,
+        visible: bool = True,
+    ) -> TextLabelsOverlay:
+        """Set a named text label overlay."""
+        overlay = self._overlays.get(name)
+        if not isinstance(overlay, TextLabelsOverlay):
+            overlay = TextLabelsOverlay(visible=visible)
+            self._overlays[name] = overlay
+
+        overlay.update(
+            {
+                "color": color,
+                "font_size": font_size,
+                "anchor": anchor,
+                "translation": translation,
+                "min_zoom": min_zoom,
+                "max_visible": max_visible,
+                "visible": visible,
+            },
+        )
+        overlay.set_labels(text, positions)
+        return overlay
+
+    def clear_text_labels(self, name: str | None = None) -> None:
+        """Clear one or all text label overlays."""
+        for overlay_name, overlay in list(self._overlays.items()):
+            if isinstance(overlay, TextLabelsOverlay) and (name is None or overlay_name == name):
+                del self._overlays[overlay_name]
+
     def clear_canvas(self) -> None:
         """Remove all layers from the canvas."""
         self.layers.select_all()
         self.layers.remove_selected()
         self.clear_object_outlines()
+        self.clear_text_labels()
         self.events.clear_canvas()
 
     def new_labels_for_image(self, image: Image, name: str) -> Labels:
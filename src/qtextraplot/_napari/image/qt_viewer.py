@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import typing as ty
 from contextlib import suppress
+from functools import lru_cache
 
 import numpy as np
 import qtextra.helpers as hp
@@ -38,9 +39,20 @@ from qtextraplot._napari.image.component_controls.qt_view_toolbar import QtViewT
 if ty.TYPE_CHECKING:
     pass
 
-reset_default_keymap()
-register_vispy_overlays()
-register_image_vispy_overlays()
+
+@lru_cache  # only call once
+def init_backend() -> None:
+    """Initialize the global napari state used by the image viewer.
+
+    This is deferred until the first viewer is created so that importing the module does not reset the keymap or
+    register vispy overlays for applications that never show an image view.
+    """
+    reset_default_keymap()
+    register_vispy_overlays()
+    register_image_vispy_overlays()
+    # this is the line that initializes any Qt-based app-model Actions that
+    # were defined somewhere in the `_qt` module and imported in init_qactions
+    init_qactions()
 
 
 class QtViewer(QtViewerInstanceTracker, QWidget):
@@ -57,6 +69,8 @@ class QtViewer(QtViewerInstanceTracker, QWidget):
         add_toolbars: bool = True,
         **kwargs: ty.Any,
     ):
+        init_backend()
+
         # set attributes
         self._disable_controls = disable_controls
 
@@ -99,10 +113,6 @@ class QtViewer(QtViewerInstanceTracker, QWidget):
 
         self.viewer._layer_slicer.events.ready.connect(self._on_slice_ready)
 
-        # this is the line that initializes any Qt-based app-model Actions that
-        # were defined somewhere in the `_qt` module and imported in init_qactions
-        init_qactions()
-
         with suppress(IndexError):
             viewer.cursor.events.position.disconnect(viewer.update_status_from_cursor)
         viewer.cursor.events.position.connect(self.update_status_and_tooltip)
@@ -27,6 +27,7 @@ from qtextraplot._napari.components.overlays.object_outlines import (
     OutlineInput,
     WidthLike,
 )
+from qtextraplot._napari.components.overlays.text_labels import TextLabelsOverlay
 from qtextraplot._napari.image.components.viewer_model import Viewer
 from qtextraplot._napari.image.qt_viewer import QtViewer
 
@@ -40,6 +41,22 @@ IMAGE_NAME, PAINT_NAME, MASK_NAME, LABELS_NAME, SHAPES_NAME = (
 )
 
 
+def _is_rgb(array: np.ndarray) -> bool:
+    """Check whether array should be displayed as an RGB(A) image."""
+    return array.ndim == 3 and array.shape[2] in (3, 4)
+
+
+def _pool_name(name: str, rgb: bool) -> str:
+    """Name under which hidden image layer is kept in the layer pool."""
+    return f"{name} ({'rgb' if rgb else 'scalar'})"
+
+
+def _placeholder_data(layer: Image) -> np.ndarray:
+    """Single pixel array with the same dimensionality and dtype as the data of the image layer."""
+    shape = (1,) * layer.ndim + ((layer.data.shape[-1],) if layer.rgb else ())
+    return np.zeros(shape, dtype=layer.dtype)
+
+
 class NapariImageView(ViewerBase):
     """Napari-based image viewer."""
 
@@ -71,10 +88,14 @@ class NapariImageView(ViewerBase):
         self.extract_layer = None
         self.shape_layer = None
         self.mask_layer = None
+        # RGB/scalar image layers removed from the viewer that can be swapped back in when display mode changes,
+        # keyed by (name, rgb)
+        self._image_pool: dict[tuple[str, bool], Image] = {}
 
         # connect events
         # self.viewer.events.clear_canvas.connect(self._clear)
         self.viewer.layers.events.removed.connect(self._on_remove_layer)
+        self._connect_refresh_events()
 
     def move_to_front(self, layer: Layer) -> None:
         """Move layer to the front."""
@@ -90,6 +111,10 @@ class NapariImageView(ViewerBase):
 
     def _on_remove_layer(self, _evt=None):
         """Indicate if layer has been deleted."""
+        if _evt.value is self.image_layer:
+            # pooled layers only exist to be swapped in place of the image layer
+            for key in [key for key in self._image_pool if key[0] == _evt.value.name]:
+                del self._image_pool[key]
         self._clear_tracked_layer_on_remove(
             _evt.value,
             "image_layer",
@@ -106,7 +131,9 @@ class NapariImageView(ViewerBase):
     def _clear(self, _evt=None):
         """Clear canvas."""
         self._clear_tracked_layers("image_layer", "paint_layer", "extract_layer", "shape_layer", "mask_layer")
+        self._image_pool.clear()
         self.clear_object_outlines()
+        self.clear_text_labels()
 
     @Slot(np.ndarray)  # type: ignore[misc]
     def plot(
@@ -124,7 +151,7 @@ class NapariImageView(ViewerBase):
 
         if self.image_layer is None:
             if "rgb" not in kwargs:
-                kwargs["rgb"] = array.ndim == 3 and array.shape[2] in (3, 4)
+                kwargs["rgb"] = _is_rgb(array)
 
             self.image_layer: Image = self.viewer.add_image(  # type: ignore[no-untyped-call]
                 array,
@@ -135,18 +162,14 @@ class NapariImageView(ViewerBase):
             self.image_layer.interpolation2d = interpolation  # type: ignore[attr-defined]
             self.image_layer._keep_auto_contrast = True  # type: ignore[attr-defined]
         else:
-            if self.image_layer.rgb and array.ndim == 2:
-                self.remove_layer(self.image_layer)
-                return self.plot(array, name=name, colormap=colormap, interpolation=interpolation, clip=False, **kwargs)
-            if not self.image_layer.rgb and array.ndim == 3 and array.shape[2] in (3, 4):
-                self.remove_layer(self.image_layer)
-                return self.plot(
+            rgb = _is_rgb(array)
+            if self.image_layer.rgb != rgb:
+                return self._swap_image_layer(
                     array,
+                    rgb,
                     name=name,
                     colormap=colormap,
                     interpolation=interpolation,
-                    clip=False,
-                    rgb=True,
                     **kwargs,
                 )
 
@@ -158,10 +181,62 @@ class NapariImageView(ViewerBase):
             self.update_image_contrast_limits(self.image_layer)
         return self.image_layer
 
+    def _swap_image_layer(
+        self,
+        array: np.ndarray,
+        rgb: bool,
+        name: str = IMAGE_NAME,
+        colormap: str | None = None,
+        interpolation: str = "nearest",
+        **kwargs: ty.Any,
+    ) -> Image:
+        """Switch between RGB and scalar image layers.
+
+        The current layer is taken out of the viewer and kept in a pool (with its data released) so that switching back
+        to the same display mode only requires updating its data rather than re-creating the layer.
+        """
+        current = self.image_layer
+        layer = self._image_pool.pop((name, rgb), None)
+        with self.batched_update():
+            # the replacement is added before the current layer is removed so that the view is not reset
+            current.name = _pool_name(name, current.rgb)
+            if layer is None:
+                self.image_layer = None
+                kwargs["rgb"] = rgb
+                layer = self.plot(
+                    array,
+                    name=name,
+                    colormap=colormap,
+                    interpolation=interpolation,
+                    clip=False,
+                    **kwargs,
+                )
+                self.viewer.layers.move(self.viewer.layers.index(layer), self.viewer.layers.index(current))
+            else:
+                layer.name = name
+                layer.data = array
+                layer.interpolation2d = interpolation
+                if colormap is not None and not rgb:
+                    layer.colormap = colormap
+                for attr, value in kwargs.items():
+                    if attr != "rgb" and hasattr(layer, attr):
+                        setattr(layer, attr, value)
+                self.update_image_contrast_limits(layer)
+                self.viewer.layers.insert(self.viewer.layers.index(current), layer)
+                self.image_layer = layer
+            self.viewer.layers.remove(current)
+            current.data = _placeholder_data(current)
+            self._image_pool[(name, current.rgb)] = current
+        return layer
+
     def plot_rgb(self, array: np.ndarray, name: str = IMAGE_NAME, **kwargs: ty.Any) -> Image:
         """Full replot of the data."""
         # array = np.nan_to_num(array)
-        if self.image_layer is not None and array.ndim != self.image_layer.data.ndim:
+        if (
+            self.image_layer is not None
+            and array.ndim != self.image_layer.data.ndim
+            and _is_rgb(array) == self.image_layer.rgb
+        ):
             self.remove_layer(self.image_layer)
         return self.plot(array, name=name, **kwargs)
 
@@ -257,6 +332,42 @@ class NapariImageView(ViewerBase):
         """Clear one or all object outline overlays."""
         self.viewer.clear_object_outlines(name=name)
 
+    def set_text_labels(
+        self,
+        text: ty.Sequence[str],
+        positions: ty.Any,
+        *,
+        name: str = "Text labels",
+        color: ColorLike = "white",
+        font_size: float = 12.0,
+        anchor: str = "upper_left",
+        translation: tuple[float, float] = (0.0, 0.0),
+        min_zoom: float = 0.0,
+        max_visible: int = 1000,
+        visible: bool = True,
+    ) -> TextLabelsOverlay:
+        """Set many text labels without creating a Points layer.
+
+        Labels outside of the view are culled and, when zoomed out, hidden below ``min_zoom`` or subsampled to at
+        most ``max_visible`` labels.
+        """
+        return self.viewer.set_text_labels(
+            text,
+            positions,
+            name=name,
+            color=color,
+            font_size=font_size,
+            anchor=anchor,
+            translation=translation,
+            min_zoom=min_zoom,
+            max_visible=max_visible,
+            visible=visible,
+        )
+
+    def clear_text_labels(self, name: str | None = None) -> None:
+        """Clear one or all text label overlays."""
+        self.viewer.clear_text_labels(name=name)
+
     def set_legend(
         self,
         entries: LegendInput,
@@ -0,0 +1,153 @@
+"""Bulk construction and partial updates of region and infinite line layers.
+
+``napari_plot`` builds ``Region`` and ``InfLine`` data item by item, growing its color and z-index arrays on every
+item, which makes setting thousands of entries quadratic. These helpers build the layer's data view from
+struct-of-arrays input in one pass and emit a single data event.
+"""
+
+from __future__ import annotations
+
+import typing as ty
+
+import numpy as np
+from napari.layers.base import ActionType
+from napari.layers.utils.color_transformations import normalize_and_broadcast_colors, transform_color_with_defaults
+from napari_plot.layers import InfLine, Region
+from napari_plot.layers.infline._infline import infline_classes
+from napari_plot.layers.infline._infline_constants import Orientation as InfLineOrientation
+from napari_plot.layers.infline._infline_list import InfiniteLineList
+from napari_plot.layers.region._region import region_classes
+from napari_plot.layers.region._region_constants import Orientation as RegionOrientation
+from napari_plot.layers.region._region_list import InfiniteRegionList
+
+WINDOWS_ERROR = "Region windows must be a (N, 2) array or be specified as separate `starts` and `ends` arrays."
+POSITIONS_ERROR = "Infinite line positions must be a one-dimensional array."
+ORIENTATION_COUNT_ERROR = "Orientation count must be one or match the number of items."
+INDEX_COUNT_ERROR = "Number of values must match the number of indices."
+
+
+def coerce_windows(starts: ty.Any, ends: ty.Any = None) -> np.ndarray:
+    """Return region windows as a (N, 2) array from either a (N, 2) array or separate start and end arrays."""
+    if ends is None:
+        windows = np.asarray(starts, dtype=float)
+        if windows.ndim == 1 and windows.size == 2:
+            windows = windows.reshape(1, 2)
+    else:
+        windows = np.stack([np.asarray(starts, dtype=float).ravel(), np.asarray(ends, dtype=float).ravel()], axis=1)
+    if windows.size == 0:
+        return np.empty((0, 2))
+    if windows.ndim != 2 or windows.shape[1] != 2:
+        raise ValueError(WINDOWS_ERROR)
+    return windows
+
+
+def coerce_positions(positions: ty.Any) -> np.ndarray:
+    """Return infinite line positions as a one-dimensional array."""
+    positions = np.atleast_1d(np.asarray(positions, dtype=float))
+    if positions.ndim != 1:
+        raise ValueError(POSITIONS_ERROR)
+    return positions
+
+
+def _coerce_orientations(orientation: ty.Any, n: int, enum: type) -> list:
+    if isinstance(orientation, str | enum):
+        return [enum(orientation)] * n
+    orientations = [enum(value) for value in orientation]
+    if len(orientations) != n:
+        raise ValueError(ORIENTATION_COUNT_ERROR)
+    return orientations
+
+
+def _coerce_colors(color: ty.Any, n: int) -> np.ndarray:
+    if n == 0:
+        return np.empty((0, 4))
+    transformed = transform_color_with_defaults(num_entries=n, colors=color, elem_name="color", default="white")
+    return np.array(normalize_and_broadcast_colors(n, transformed), dtype=float)
+
+
+def _coerce_indices(indices: ty.Any, n: int) -> np.ndarray:
+    indices = np.atleast_1d(np.asarray(indices, dtype=np.intp))
+    return np.where(indices < 0, indices + n, indices)
+
+
+def _emit_data(layer: Region | InfLine) -> None:
+    layer._emit_new_data(ActionType.CHANGED)
+    layer.events.color()
+    layer._update_thumbnail()
+
+
+def set_region_data(layer: Region, windows: np.ndarray, orientation: ty.Any = "vertical", color: ty.Any = None) -> None:
+    """Replace all regions of the layer at once."""
+    n = len(windows)
+    orientations = _coerce_orientations(orientation, n, RegionOrientation)
+    data_view = InfiniteRegionList()
+    data_view.regions = [
+        region_classes[orientation_](window, z_index=0)
+        for window, orientation_ in zip(map(tuple, windows.tolist()), orientations, strict=True)
+    ]
+    data_view._z_index = np.zeros(n, dtype=int)
+    data_view._color = _coerce_colors(layer.current_color if color is None else color, n)
+    data_view._update_z_order()
+    layer.selected_data = set()
+    layer._data_view = data_view
+    _emit_data(layer)
+
+
+def update_region_data(
+    layer: Region,
+    indices: ty.Any,
+    windows: np.ndarray | None = None,
+    color: ty.Any = None,
+) -> None:
+    """Update the window and/or color of the regions at `indices` in-place, emitting a single data event."""
+    data_view = layer._data_view
+    indices = _coerce_indices(indices, len(data_view.regions))
+    if windows is not None:
+        if len(windows) != len(indices):
+            raise ValueError(INDEX_COUNT_ERROR)
+        for index, window in zip(indices.tolist(), map(tuple, windows.tolist()), strict=True):
+            data_view.regions[index].data = window
+    if color is not None:
+        data_view._color[indices] = _coerce_colors(color, len(indices))
+    _emit_data(layer)
+
+
+def set_inf_line_data(
+    layer: InfLine,
+    positions: np.ndarray,
+    orientation: ty.Any = "vertical",
+    color: ty.Any = None,
+) -> None:
+    """Replace all infinite lines of the layer at once."""
+    n = len(positions)
+    orientations = _coerce_orientations(orientation, n, InfLineOrientation)
+    data_view = InfiniteLineList()
+    data_view.inflines = [
+        infline_classes[orientation_](position, z_index=0)
+        for position, orientation_ in zip(positions.tolist(), orientations, strict=True)
+    ]
+    data_view._z_index = np.zeros(n, dtype=int)
+    data_view._color = _coerce_colors(layer.current_color if color is None else color, n)
+    data_view._update_z_order()
+    layer.selected_data = set()
+    layer._data_view = data_view
+    _emit_data(layer)
+
+
+def update_inf_line_data(
+    layer: InfLine,
+    indices: ty.Any,
+    positions: np.ndarray | None = None,
+    color: ty.Any = None,
+) -> None:
+    """Update the position and/or color of the infinite lines at `indices` in-place, emitting a single data event."""
+    data_view = layer._data_view
+    indices = _coerce_indices(indices, len(data_view.inflines))
+    if positions is not None:
+        if len(positions) != len(indices):
+            raise ValueError(INDEX_COUNT_ERROR)
+        for index, position in zip(indices.tolist(), positions.tolist(), strict=True):
+            data_view.inflines[index].data = position
+    if color is not None:
+        data_view._color[indices] = _coerce_colors(color, len(indices))
+    _emit_data(layer)
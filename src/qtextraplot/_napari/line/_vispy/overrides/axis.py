@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import math
+from functools import lru_cache
 
 _MIN_SIGNIFICANT_DIGITS = 4
 _MAX_SIGNIFICANT_DIGITS = 15
@@ -56,7 +57,12 @@ def tick_formatter(value: float, *, tick_spacing: float | None = None) -> str:
     str
         Formatted tick label.
     """
-    value = float(value)
+    return _format_tick(float(value), None if tick_spacing is None else float(tick_spacing))
+
+
+@lru_cache(maxsize=4096)
+def _format_tick(value: float, tick_spacing: float | None) -> str:
+    """Format a single tick value. Cached since the same ticks are formatted on every redraw while panning."""
     if value == 0:
         return "0"
     if not math.isfinite(value):
@@ -64,6 +70,6 @@ def tick_formatter(value: float, *, tick_spacing: float | None = None) -> str:
 
     scale, suffix = _scale_for_value(value)
     scaled_value = value / scale
-    scaled_spacing = None if tick_spacing is None else float(tick_spacing) / scale
+    scaled_spacing = None if tick_spacing is None else tick_spacing / scale
     precision = _precision_for_spacing(scaled_value, scaled_spacing)
     return f"{scaled_value:.{precision}g}{suffix}"
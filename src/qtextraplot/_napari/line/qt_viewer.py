@@ -4,20 +4,17 @@ from __future__ import annotations
 
 import typing as ty
 from contextlib import suppress
+from functools import lru_cache
 
 import numpy as np
 import qtextra.helpers as hp
-from napari._qt._qapp_model.qactions import init_qactions as init_napari_qactions
 from napari._qt.containers.qt_layer_list import QtLayerList
 from napari._qt.qt_main_window import _QtMainWindow as _NapariQtMainWindow
 from napari._qt.widgets.qt_dims import QtDims
 from napari._vispy.utils.qt_font import QtFontManager
 from napari.utils.key_bindings import KeymapHandler
-from napari_plot._qt._qapp_model import init_qactions as init_napari_plot_qactions
-from napari_plot._qt._qapp_model import reset_default_keymap
 from napari_plot._qt.qt_main_window import Window, _QtMainWindow
 from napari_plot._qt.qt_viewer import QtViewer as _QtViewer
-from napari_plot._vispy.overlays import register_vispy_overlays as register_napari_plot_vispy_overlays
 from qtpy.QtCore import QCoreApplication, QEvent, Qt
 from qtpy.QtGui import QGuiApplication
 from qtpy.QtWidgets import QWidget
@@ -31,7 +28,6 @@ from qtextraplot._napari._qt_viewer_utils import (
     show_controls_dialog,
     toggle_controls_dialog,
 )
-from qtextraplot._napari._vispy import register_vispy_overlays as register_qtextraplot_vispy_overlays
 from qtextraplot._napari.layer_controls.qt_layer_controls_container import QtLayerControlsContainer
 from qtextraplot._napari.line._vispy.canvas import VispyCanvas
 from qtextraplot._napari.line.component_controls.qt_view_toolbar import QtViewLeftToolbar, QtViewRightToolbar
@@ -41,17 +37,33 @@ from qtextraplot.config import CANVAS, CanvasThemes
 if ty.TYPE_CHECKING:
     from napari_plot.viewer import ViewerModel as Viewer
 
-reset_default_keymap()
-register_napari_plot_vispy_overlays()
-register_qtextraplot_vispy_overlays()
+
+@lru_cache  # only call once
+def init_backend() -> None:
+    """Initialize the global napari and napari-plot state used by the line viewer.
+
+    This is deferred until the first viewer is created so that importing the module does not reset the keymap,
+    register vispy overlays or initialize app-model actions for applications that never show a line view.
+    """
+    from napari._qt._qapp_model.qactions import init_qactions as init_napari_qactions
+    from napari_plot._qt._qapp_model import init_qactions as init_napari_plot_qactions
+    from napari_plot._qt._qapp_model import reset_default_keymap
+    from napari_plot._vispy.overlays import register_vispy_overlays as register_napari_plot_vispy_overlays
+
+    from qtextraplot._napari._vispy import register_vispy_overlays as register_qtextraplot_vispy_overlays
+
+    reset_default_keymap()
+    register_napari_plot_vispy_overlays()
+    register_qtextraplot_vispy_overlays()
+    # this is the line that initializes any Qt-based app-model Actions that
+    # were defined somewhere in the `_qt` module and imported in init_qactions
+    init_napari_qactions()
+    init_napari_plot_qactions()
 
 
 def as_array(name: str, canvas: CanvasThemes) -> np.ndarray:
     """Return color array."""
-    from napari.utils.colormaps.standardize_color import transform_color
-
-    color = getattr(canvas.active, name)
-    return transform_color(color.as_hex())[0]
+    return canvas.as_array(name)
 
 
 class QtViewer(QtViewerInstanceTracker, QWidget):
@@ -71,6 +83,8 @@ class QtViewer(QtViewerInstanceTracker, QWidget):
         connect_theme: bool = True,
         **kwargs: ty.Any,
     ):
+        init_backend()
+
         self._disable_controls = disable_controls
         self._theme_connected: bool = False
 
@@ -111,11 +125,6 @@ class QtViewer(QtViewerInstanceTracker, QWidget):
         )
         self._welcome_widget = self.canvas.native  # we don't need welcome widget
 
-        # this is the line that initializes any Qt-based app-model Actions that
-        # were defined somewhere in the `_qt` module and imported in init_qactions
-        init_napari_qactions()
-        init_napari_plot_qactions()
-
         with suppress(IndexError):
             viewer.cursor.events.position.disconnect(viewer.update_status_from_cursor)
         viewer.cursor.events.position.connect(self.update_status_and_tooltip)
@@ -192,10 +201,11 @@ class QtViewer(QtViewerInstanceTracker, QWidget):
 
     def toggle_theme(self, _=None):
         """Update theme."""
-        self.canvas.bgcolor = as_array("canvas", CANVAS)
-        self.viewer.axis.label_color = as_array("axis", CANVAS)
-        self.viewer.axis.tick_color = as_array("axis", CANVAS)
-        self.viewer.text_overlay.color = as_array("label", CANVAS)
+        colors = CANVAS.as_arrays()
+        self.canvas.bgcolor = colors["canvas"]
+        self.viewer.axis.label_color = colors["axis"]
+        self.viewer.axis.tick_color = colors["axis"]
+        self.viewer.text_overlay.color = colors["label"]
 
     def _disconnect_theme(self) -> None:
         """Disconnect the theme signal when it is connected."""
@@ -15,6 +15,14 @@ from qtpy.QtWidgets import QWidget
 
 from qtextraplot._napari._utilities import get_font_for_os
 from qtextraplot._napari._wrapper import ViewerBase
+from qtextraplot._napari.line._bulk import (
+    coerce_positions,
+    coerce_windows,
+    set_inf_line_data,
+    set_region_data,
+    update_inf_line_data,
+    update_region_data,
+)
 from qtextraplot._napari.line._vispy.overrides.axis import tick_formatter
 from qtextraplot._napari.line.config import Config
 from qtextraplot._napari.line.qt_viewer import QtViewer, as_array
@@ -91,15 +99,21 @@ class NapariLineView(ViewerBase):
         self.viewer.events.clear_canvas.connect(self._clear)
         self.viewer.layers.events.removed.connect(self._on_remove_layer)
         self.viewer.text_overlay.position = "top_right"
+        self._connect_refresh_events()
 
         # own instances
         self._instances.append(self)
 
     def _update_view(self) -> None:
-        self.widget.canvas.native.update()
-        xmin, xmax, ymin, ymax = self.viewer.camera.rect
-        self.viewer.camera.rect = xmin + 1, xmax, ymin, ymax
-        self.viewer.camera.rect = xmin, xmax, ymin, ymax
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Re-render the canvas, including the axes which are not updated while the canvas is hidden."""
+        canvas = self.widget.canvas
+        for axis in (canvas.x_axis, canvas.y_axis):
+            if axis is not None:
+                axis.node._view_changed()
+        super().refresh()
 
     def _on_remove_layer(self, evt: Event) -> None:
         """Indicate if layer has been deleted."""
@@ -280,6 +294,89 @@ class NapariLineView(ViewerBase):
         layer.editable = editable
         return layer
 
+    def set_regions(
+        self,
+        starts: np.ndarray,
+        ends: np.ndarray | None = None,
+        orientation: str | ty.Sequence[str] = "vertical",
+        color: ty.Any = None,
+        name: str = REGION_NAME,
+        editable: bool = True,
+        reuse: bool = True,
+        **kwargs: ty.Any,
+    ) -> Region:
+        """Set many regions of interest at once.
+
+        Regions are specified either as a (N, 2) array of windows in `starts` or as separate `starts` and `ends`
+        arrays, with a single or per-region `orientation` and `color`. All regions are built in a single pass and
+        replace any regions already present in the layer.
+        """
+        windows = coerce_windows(starts, ends)
+        color = as_array("highlight", CANVAS) if color is None else color
+        layer = self.try_reuse(name, Region, reuse=reuse)
+        if layer:
+            update_layer_attributes(layer, False, **kwargs)
+        else:
+            layer = self.viewer.add_region(None, name=name, color=color, **kwargs)
+        set_region_data(layer, windows, orientation=orientation, color=color)
+        layer.editable = editable
+        return layer
+
+    def update_regions(
+        self,
+        indices: ty.Sequence[int] | np.ndarray,
+        starts: np.ndarray | None = None,
+        ends: np.ndarray | None = None,
+        color: ty.Any = None,
+        name: str = REGION_NAME,
+    ) -> Region | None:
+        """Update the window and/or color of existing regions by index, without rebuilding the layer."""
+        layer = self.get_layer(name)
+        if not isinstance(layer, Region):
+            return None
+        windows = None if starts is None else coerce_windows(starts, ends)
+        update_region_data(layer, indices, windows=windows, color=color)
+        return layer
+
+    def set_inf_lines(
+        self,
+        positions: np.ndarray,
+        orientation: str | ty.Sequence[str] = "vertical",
+        color: ty.Any = None,
+        name: str = "InfLine",
+        reuse: bool = True,
+        **kwargs: ty.Any,
+    ) -> InfLine:
+        """Set many infinite lines at once.
+
+        All lines are built in a single pass from the `positions` array, with a single or per-line `orientation`
+        and `color`, and replace any lines already present in the layer.
+        """
+        positions = coerce_positions(positions)
+        color = as_array("line", CANVAS) if color is None else color
+        layer = self.try_reuse(name, InfLine, reuse=reuse)
+        if layer:
+            update_layer_attributes(layer, False, **kwargs)
+        else:
+            layer = self.viewer.add_inf_line(None, name=name, color=color, **kwargs)
+        set_inf_line_data(layer, positions, orientation=orientation, color=color)
+        return layer
+
+    def update_inf_lines(
+        self,
+        indices: ty.Sequence[int] | np.ndarray,
+        positions: np.ndarray | None = None,
+        color: ty.Any = None,
+        name: str = "InfLine",
+    ) -> InfLine | None:
+        """Update the position and/or color of existing infinite lines by index, without rebuilding the layer."""
+        layer = self.get_layer(name)
+        if not isinstance(layer, InfLine):
+            return None
+        positions = None if positions is None else coerce_positions(positions)
+        update_inf_line_data(layer, indices, positions=positions, color=color)
+        return layer
+
     def add_extract_region_layer(self) -> Region | None:
         """Add region of interest layer."""
         if self.region_layer is None:
@@ -297,17 +394,17 @@ class NapariLineView(ViewerBase):
         layers = self.get_layers_of_type(Region)
         self.remove_layers(layers)
 
-    def set_line_x(self, x: np.ndarray) -> None:
+    def set_line_x(self, x: np.ndarray, prefix: str | None = None) -> None:
         """Update x-axis data of all line layers where the dimension of `x` matches that of the currently
-        present data
-        .
+        present data. If `prefix` is specified, only line layers whose name starts with it are updated.
         """
-        layers = self.get_layers_of_type(Line)
-        for layer in layers:
-            data = layer.data
-            if data.shape[0] == len(x):
-                data[:, 0] = x
-                layer.data = data
+        layers = self.get_layers_of_type(Line) if prefix is None else self.get_layers_with_prefix(prefix, Line)
+        with self.batched_update():
+            for layer in layers:
+                data = layer.data
+                if data.shape[0] == len(x):
+                    data[:, 0] = x
+                    layer.data = data
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -10,11 +10,13 @@ from pathlib import Path
 import numpy as np
 from koyo.secret import get_short_hash
 from koyo.system import is_installed
-from qtpy.QtCore import QMutexLocker, QPoint, QRect, QRectF, Qt, Signal
+from qtpy.QtCore import QMutexLocker, QPoint, QRect, QRectF, Qt, QTimer, Signal
 from qtpy.QtGui import QCloseEvent, QColor, QMouseEvent, QWheelEvent
 from qtpy.QtWidgets import QApplication, QGraphicsItem, QGraphicsRectItem, QRubberBand, QWidget
 
 from qtextraplot.config import CANVAS
+from qtextraplot.utils.density import DENSITY_THRESHOLD, DensityAggregator, density_to_rgba
+from qtextraplot.utils.patches import PatchGroup, coerce_rectangles
 from qtextraplot.utils.views_base import MUTEX, ViewBase
 
 if ty.TYPE_CHECKING:
@@ -24,6 +26,9 @@ if not is_installed("pyqtgraph"):
     raise ImportError("please install pyqtgraph using 'pip install pyqtgraph'")  # noqa: TRY003
 import pyqtgraph as pg
 
+# delay in milliseconds between a change of the view and re-aggregation of density scatter plots
+DENSITY_UPDATE_DELAY = 30
+
 
 def _mk_pen(color: ty.Any = "w", width: float = 1.0, style: str | None = None) -> QPen:
     """Create a pyqtgraph pen with optional line style."""
@@ -73,6 +78,12 @@ def _expand_colors(color: ty.Any, size: int) -> list[ty.Any]:
     return colors
 
 
+def _colors_to_rgba(color: ty.Any) -> np.ndarray:
+    """Convert one color or a sequence of colors to a (N, 4) RGBA array."""
+    colors = [color] if _is_single_color(color) else list(color)
+    return np.array([pg.mkColor(value).getRgbF() for value in colors], dtype=float).reshape(-1, 4)
+
+
 def _normalize_marker(marker: str) -> str:
     """Translate common Matplotlib marker codes to PyQtGraph symbols."""
     return {"^": "t1", "D": "d"}.get(marker, marker)
@@ -86,6 +97,21 @@ def _coerce_image(image: np.ndarray) -> np.ndarray:
     return image.T
 
 
+def sample_image_levels(
+    image: np.ndarray,
+    max_samples: int = 65536,
+    percentiles: tuple[float, float] = (0.1, 99.9),
+) -> tuple[float, float]:
+    """Estimate display levels from a strided subsample of the image instead of scanning every pixel."""
+    image = np.asarray(image)
+    step = max(1, int(np.ceil(np.sqrt(image.shape[0] * image.shape[1] / max_samples))))
+    sample = image[::step, ::step]
+    low, high = np.nanpercentile(sample, percentiles)
+    if high <= low:
+        high = low + 1
+    return float(low), float(high)
+
+
 @dataclass
 class RectPatchAdapter:
     """Adapter that gives a rectangle item an MPL-like update surface."""
@@ -120,6 +146,48 @@ class RectPatchAdapter:
         self.item.setRect(QRectF(rect.x(), rect.y(), rect.width(), height))
 
 
+@dataclass
+class DensityScatterAdapter:
+    """Scatter points drawn as a density image while too many of them are visible, and as markers otherwise."""
+
+    aggregator: DensityAggregator
+    image: pg.ImageItem
+    scatter: pg.ScatterPlotItem
+    lut: np.ndarray
+    # color of each point, or a single color
+    colors: list[ty.Any]
+    width: float = 1.0
+
+    def is_dense(self) -> bool:
+        """Return whether the points are drawn as a density image."""
+        return self.image.isVisible()
+
+    def update_view(self, extent: tuple[float, float, float, float], shape: tuple[int, int]) -> None:
+        """Re-aggregate the points within the (x_min, x_max, y_min, y_max) extent at (height, width) resolution."""
+        counts = self.aggregator.aggregate(extent, shape)
+        dense = self.aggregator.is_dense(counts)
+        if dense:
+            x_min, x_max, y_min, y_max = extent
+            self.image.setImage(density_to_rgba(counts, self.lut), autoLevels=False)
+            self.image.setRect(QRectF(x_min, y_min, x_max - x_min, y_max - y_min))
+        else:
+            indices = self.aggregator.visible_indices(extent)
+            colors = self.colors if len(self.colors) == 1 else [self.colors[index] for index in indices.tolist()]
+            if len(colors) == 1:
+                pens, brushes = pg.mkPen(colors[0], width=self.width), pg.mkBrush(colors[0])
+            else:
+                pens = [pg.mkPen(value, width=self.width) for value in colors]
+                brushes = [pg.mkBrush(value) for value in colors]
+            self.scatter.setData(
+                x=self.aggregator.x[indices],
+                y=self.aggregator.y[indices],
+                pen=pens,
+                brush=brushes,
+            )
+        self.image.setVisible(dense)
+        self.scatter.setVisible(not dense)
+
+
 @dataclass(frozen=True)
 class LegendEntry:
     """Describe one backend-independent plot legend entry."""
@@ -152,7 +220,15 @@ class PyQtGraphCanvas(pg.PlotWidget):
         self._plot_items: dict[str, ty.Any] = {}
         self._annotation_items: dict[str, ty.Any] = {}
         self._patch_items: dict[str, RectPatchAdapter] = {}
+        self._patch_groups: dict[str, PatchGroup] = {}
+        self._density_scatters: dict[str, DensityScatterAdapter] = {}
+        # re-aggregation of density scatter plots is delayed until the view stops changing
+        self._density_timer = QTimer(self)
+        self._density_timer.setSingleShot(True)
+        self._density_timer.setInterval(DENSITY_UPDATE_DELAY)
+        self._density_timer.timeout.connect(self.update_density)
         self._legend: pg.LegendItem | None = None
+        self._use_opengl = False
         self._ctrl_origin: QPoint | None = None
         self._ctrl_selector = QRubberBand(QRubberBand.Shape.Rectangle, self)
         self.showGrid(x=True, y=True, alpha=0.15)
@@ -163,12 +239,23 @@ class PyQtGraphCanvas(pg.PlotWidget):
         self._ax.setLabel("bottom", x_label)
         self._ax.setLabel("left", y_label)
         self.getViewBox().sigRangeChanged.connect(self._on_range_changed)
+        self.getViewBox().sigResized.connect(self._on_range_changed)
         CANVAS.evt_theme_changed.connect(self.update_theme)
         self.update_theme()
 
     def _on_range_changed(self, *_args: ty.Any) -> None:
         """Emit the current visible bounds after a range change."""
         self.evt_range_changed.emit(self.get_xy_limits())
+        if self._density_scatters:
+            self._density_timer.start()
+
+    def update_density(self) -> None:
+        """Re-aggregate density scatter plots for the current view."""
+        view_box = self.getViewBox()
+        (x_min, x_max), (y_min, y_max) = view_box.viewRange()
+        shape = (max(int(view_box.height()), 1), max(int(view_box.width()), 1))
+        for adapter in self._density_scatters.values():
+            adapter.update_view((x_min, x_max, y_min, y_max), shape)
 
     def _map_to_data(self, position: QPoint) -> tuple[float, float]:
         """Map a widget position to plot coordinates."""
@@ -252,6 +339,7 @@ class PyQtGraphCanvas(pg.PlotWidget):
     def closeEvent(self, event: QCloseEvent) -> None:
         """Disconnect global theme callbacks before closing."""
         CANVAS.evt_theme_changed.disconnect(self.update_theme)
+        self._density_timer.stop()
         super().closeEvent(event)
 
     @property
@@ -276,6 +364,8 @@ class PyQtGraphCanvas(pg.PlotWidget):
         self._plot_items.clear()
         self._annotation_items.clear()
         self._patch_items.clear()
+        self._patch_groups.clear()
+        self._density_scatters.clear()
         self._legend = None
         self._ax.setTitle(self._title)
 
@@ -323,6 +413,14 @@ class PyQtGraphCanvas(pg.PlotWidget):
         patch = self._patch_items.pop(gid, None)
         if patch is not None:
             self._ax.removeItem(patch.item)
+        self.plot_remove_patch_group(gid)
+        self._remove_density_scatter(gid)
+
+    def _remove_density_scatter(self, gid: str) -> None:
+        """Remove density image of the scatter registered under the gid."""
+        adapter = self._density_scatters.pop(gid, None)
+        if adapter is not None:
+            self._ax.removeItem(adapter.image)
 
     def plot_1d(
         self,
@@ -432,10 +530,33 @@ class PyQtGraphCanvas(pg.PlotWidget):
         color: ty.Any = "w",
         size: float = 5,
         marker: str = "o",
+        density: bool | None = None,
+        density_threshold: int = DENSITY_THRESHOLD,
+        cmap: str = "viridis",
         **kwargs: ty.Any,
     ):
-        """Plot scatter data."""
+        """Plot scatter data.
+
+        When `density` is enabled, or left as None and there are more than `density_threshold` points, the points are
+        drawn as a density image of the visible region using `cmap`, which is re-aggregated whenever the view changes.
+        Once no more than `density_threshold` points are visible, they are drawn as individual markers instead.
+        """
         gid = gid or self._scatter_gid
+        if density is None:
+            density = len(x) > density_threshold
+        if density:
+            return self._plot_density_scatter(
+                x,
+                y,
+                gid=gid,
+                color=color,
+                size=size,
+                marker=marker,
+                threshold=density_threshold,
+                cmap=cmap,
+                **kwargs,
+            )
+        self._remove_density_scatter(gid)
         colors = _expand_colors(color, len(x))
         options = {
             "x": np.asarray(x),
@@ -452,9 +573,58 @@ class PyQtGraphCanvas(pg.PlotWidget):
         item = pg.ScatterPlotItem(**options)
         return self._add_or_replace_item(self._plot_items, gid, item)
 
+    def _plot_density_scatter(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        *,
+        gid: str,
+        color: ty.Any,
+        size: float,
+        marker: str,
+        threshold: int,
+        cmap: str,
+        **kwargs: ty.Any,
+    ) -> pg.ScatterPlotItem:
+        """Plot scatter data as a density image that is re-aggregated whenever the view changes."""
+        self._remove_density_scatter(gid)
+        aggregator = DensityAggregator(x, y, threshold=threshold)
+        scatter = pg.ScatterPlotItem(size=size, symbol=_normalize_marker(marker))
+        self._add_or_replace_item(self._plot_items, gid, scatter)
+        image = pg.ImageItem(axisOrder="row-major")
+        image.setZValue(scatter.zValue() - 1)
+        self._ax.addItem(image)
+        self._density_scatters[gid] = DensityScatterAdapter(
+            aggregator,
+            image,
+            scatter,
+            pg.colormap.get(cmap, source="matplotlib").getLookupTable(nPts=256, alpha=True),
+            [color] if _is_single_color(color) else _expand_colors(color, len(aggregator)),
+            kwargs.get("width", 1.0),
+        )
+        # the view is not fitted to the density image, which changes with every change of the view
+        x_min, x_max, y_min, y_max = aggregator.extent
+        self._ax.setRange(xRange=(x_min, x_max), yRange=(y_min, y_max))
+        self._ax.disableAutoRange()
+        self.update_density()
+        return scatter
+
     def update_scatter(self, x: np.ndarray, y: np.ndarray, *, gid: str | None = None, **kwargs: ty.Any) -> None:
         """Update scatter data."""
         gid = gid or self._scatter_gid
+        adapter = self._density_scatters.get(gid)
+        if adapter is not None:
+            adapter.aggregator = DensityAggregator(x, y, threshold=adapter.aggregator.threshold)
+            if "color" in kwargs:
+                color = kwargs["color"]
+                adapter.colors = [color] if _is_single_color(color) else _expand_colors(color, len(adapter.aggregator))
+            elif len(adapter.colors) not in (1, len(adapter.aggregator)):
+                # per-point colors no longer match the points
+                adapter.colors = adapter.colors[:1]
+            if "size" in kwargs:
+                adapter.scatter.setSize(kwargs["size"])
+            self.update_density()
+            return
         item = self._plot_items.get(gid)
         if item is None:
             raise AttributeError(f"No scatter registered for gid={gid!r}")  # noqa: TRY003
@@ -464,7 +634,8 @@ class PyQtGraphCanvas(pg.PlotWidget):
         """Display image data."""
         gid = gid or self._image_gid
         item = self._plot_items.get(gid)
-        if not isinstance(item, pg.ImageItem):
+        # streamed images use row-major layout so they have to be replaced
+        if not isinstance(item, pg.ImageItem) or item.axisOrder == "row-major":
             item = pg.ImageItem()
             item.setZValue(kwargs.get("zorder", -100))
             self._add_or_replace_item(self._plot_items, gid, item)
@@ -482,6 +653,48 @@ class PyQtGraphCanvas(pg.PlotWidget):
         """Update image data."""
         self.imshow(image, **kwargs)
 
+    def stream_image(
+        self,
+        image: np.ndarray,
+        *,
+        gid: str | None = None,
+        levels: tuple[float, float] | None = None,
+        sample_levels: bool = False,
+        lut: np.ndarray | None = None,
+        use_opengl: bool | None = None,
+    ) -> pg.ImageItem:
+        """Display a frame of a live image stream.
+
+        Unlike `imshow`, frames are displayed in their native row-major layout without transposing, levels are
+        never computed by a full scan and auto-range is only applied when the frame shape changes. Levels are set
+        from `levels`, estimated from a subsample of the frame when `sample_levels` is set (or no levels were set
+        yet) and otherwise kept from the previous frame.
+        """
+        gid = gid or self._image_gid
+        image = np.asarray(image)
+        item = self._plot_items.get(gid)
+        if not isinstance(item, pg.ImageItem) or item.axisOrder != "row-major":
+            item = pg.ImageItem(axisOrder="row-major")
+            item.setZValue(-100)
+            self._add_or_replace_item(self._plot_items, gid, item)
+        reset_range = item.image is None or item.image.shape[:2] != image.shape[:2]
+        if levels is None and (sample_levels or item.levels is None):
+            levels = sample_image_levels(image)
+        if lut is not None:
+            item.setLookupTable(lut, update=False)
+        if levels is not None:
+            item.setImage(image, autoLevels=False, levels=levels)
+        else:
+            item.setImage(image, autoLevels=False)
+        if reset_range:
+            self.getViewBox().setAspectLocked(True)
+            self._ax.autoRange()
+            self._ax.disableAutoRange()
+        if use_opengl is not None and use_opengl != self._use_opengl:
+            self.useOpenGL(use_opengl)
+            self._use_opengl = use_opengl
+        return item
+
     def plot_add_infline(
         self,
         *,
@@ -573,6 +786,87 @@ class PyQtGraphCanvas(pg.PlotWidget):
             if start_with is None or name.startswith(start_with):
                 patch = self._patch_items.pop(name)
                 self._ax.removeItem(patch.item)
+        for gid in list(self._patch_groups):
+            if start_with is None or gid.startswith(start_with):
+                self.plot_remove_patch_group(gid)
+
+    def plot_add_patches(
+        self,
+        x: ty.Any,
+        y: ty.Any,
+        width: ty.Any,
+        height: ty.Any = None,
+        *,
+        color: ty.Any = "r",
+        alpha: float = 0.5,
+        gid: str = "patches",
+        pickable: bool = False,
+        **_kwargs: ty.Any,
+    ) -> PatchGroup:
+        """Add many rectangular patches, rendered by a single bar graph item."""
+        height = width if height is None else height
+        rectangles = coerce_rectangles(x, y, width, height)
+        colors = _colors_to_rgba(color)
+        colors[:, 3] = alpha
+        self.plot_remove_patch_group(gid)
+        item = pg.BarGraphItem(x0=[], y0=[], width=[], height=[], pen=None)
+        if pickable:
+            item.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsSelectable, True)
+        group = PatchGroup(gid, rectangles, colors, item=item)
+        self._set_patch_group_data(group)
+        self._patch_groups[gid] = group
+        self._ax.addItem(item)
+        return group
+
+    def plot_update_patches(
+        self,
+        gid: str = "patches",
+        indices: ty.Any = None,
+        x: ty.Any = None,
+        y: ty.Any = None,
+        width: ty.Any = None,
+        height: ty.Any = None,
+        color: ty.Any = None,
+        visible: ty.Any = None,
+        alpha: float | None = None,
+    ) -> PatchGroup | None:
+        """Update position, size, color and/or visibility of patches at `indices` (or all patches) of a group."""
+        group = self._patch_groups.get(gid)
+        if group is None:
+            return None
+        colors = None if color is None else _colors_to_rgba(color)
+        group.update(indices, x=x, y=y, width=width, height=height, colors=colors, visible=visible, alpha=alpha)
+        self._set_patch_group_data(group)
+        return group
+
+    @staticmethod
+    def _set_patch_group_data(group: PatchGroup) -> None:
+        """Pass visible rectangles to the item, sharing a single brush when all patches have the same color."""
+        rectangles = group.rectangles[group.visible]
+        colors = group.colors[group.visible]
+        if len(colors) == 0 or (colors == colors[0]).all():
+            brush = pg.mkBrush(QColor.fromRgbF(*colors[0])) if len(colors) else _mk_brush(None)
+            brushes = None
+        else:
+            brush, brushes = None, [pg.mkBrush(QColor.fromRgbF(*color)) for color in colors.tolist()]
+        group.item.setOpts(
+            x0=rectangles[:, 0],
+            y0=rectangles[:, 1],
+            width=rectangles[:, 2],
+            height=rectangles[:, 3],
+            brush=brush,
+            brushes=brushes,
+        )
+
+    def get_patch_group(self, gid: str) -> PatchGroup | None:
+        """Get an existing group of patches."""
+        return self._patch_groups.get(gid)
+
+    def plot_remove_patch_group(self, gid: str) -> None:
+        """Remove group of patches."""
+        group = self._patch_groups.pop(gid, None)
+        if group is not None:
+            self._ax.removeItem(group.item)
 
     def get_xlim(self) -> tuple[float, float]:
         """Get x-axis limits."""
@@ -854,6 +1148,35 @@ class ViewPyQtGraphCanvas(_BasePyQtGraphView):
                 width=width,
             )
 
+    def stream_image(
+        self,
+        image: np.ndarray,
+        gid: str = "__image__",
+        levels: tuple[float, float] | None = None,
+        sample_levels: bool = False,
+        lut: np.ndarray | None = None,
+        use_opengl: bool | None = None,
+        repaint: bool = True,
+    ) -> None:
+        """Display a frame of a live image stream without clearing other items.
+
+        See `PyQtGraphCanvas.stream_image` for the meaning of the arguments.
+        """
+        with QMutexLocker(MUTEX):
+            self.figure.stream_image(
+                image,
+                gid=gid,
+                levels=levels,
+                sample_levels=sample_levels,
+                lut=lut,
+                use_opengl=use_opengl,
+            )
+            self.figure.repaint(repaint)
+            state = self._items_state.get(gid)
+            if state is not None and state["kind"] == "image":
+                # keep a reference (not a copy) to the latest frame so the canvas can be rebuilt
+                state["image"] = image
+
     def imshow(self, image: np.ndarray, repaint: bool = True, gid: str = "__image__", **kwargs: ty.Any) -> None:
         """Plot or replace an image item without clearing other items."""
         with QMutexLocker(MUTEX):
@@ -1065,6 +1388,26 @@ class ViewPyQtGraphImage(_BasePyQtGraphView):
             self._data.update(image=np.asarray(image))
             self._plt_kwargs = dict(kwargs)
 
+    def stream(
+        self,
+        image: np.ndarray,
+        levels: tuple[float, float] | None = None,
+        sample_levels: bool = False,
+        lut: np.ndarray | None = None,
+        use_opengl: bool | None = None,
+        repaint: bool = True,
+    ) -> None:
+        """Display a frame of a live camera or acquisition feed.
+
+        This skips label updates, full-frame level scans, transposition and auto-range so frames can be pushed at
+        video rate. See `PyQtGraphCanvas.stream_image` for the meaning of the arguments.
+        """
+        with QMutexLocker(MUTEX):
+            self.figure.stream_image(image, levels=levels, sample_levels=sample_levels, lut=lut, use_opengl=use_opengl)
+            self.figure.repaint(repaint)
+            # keep a reference (not a copy) to the latest frame so the view can be reset
+            self._data["image"] = image
+
     def reset(self):
         """Reset the image from cached data."""
         self.light_clear()
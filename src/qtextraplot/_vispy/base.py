@@ -8,13 +8,25 @@ import typing as ty
 import numpy as np
 from koyo.color import hex_to_rgb
 from koyo.utilities import get_min_max
+from vispy.app import Timer
+from vispy.color import ColorArray, get_colormap
 from vispy.scene import AxisWidget, InfiniteLine, SceneCanvas, ViewBox
-from vispy.scene.visuals import Line as LineNode
+from vispy.scene.visuals import Image as ImageNode
 from vispy.scene.visuals import Markers as MarkersNode
+from vispy.scene.visuals import Mesh as MeshNode
 from vispy.util import keys
+from vispy.visuals.transforms import STTransform
 
 from qtextraplot._vispy.camera import BoxZoomCameraMixin
+from qtextraplot._vispy.line import BufferedLineNode
 from qtextraplot._vispy.models.extents import Extents
+from qtextraplot.utils.density import DENSITY_THRESHOLD, DensityAggregator, density_to_rgba, lookup_table
+from qtextraplot.utils.patches import PatchGroup, coerce_rectangles, rectangle_vertices
+
+# triangles covering a rectangle, indexing its four corners
+RECTANGLE_FACES = np.array([[0, 1, 2], [0, 2, 3]], dtype=np.uint32)
+# delay in seconds between a change of the view and re-aggregation of density scatter plots
+DENSITY_UPDATE_DELAY = 0.03
 
 
 class BasePlot(SceneCanvas, BoxZoomCameraMixin):
@@ -30,6 +42,7 @@ class BasePlot(SceneCanvas, BoxZoomCameraMixin):
         self._send_hover_events = True  # temporary workaround
         self.node = None
         self.nodes = {}
+        self.patch_groups: dict[str, PatchGroup] = {}
         self.rois = []
 
         self.grid = self.central_widget.add_grid(spacing=0, bgcolor=facecolor)
@@ -166,15 +179,85 @@ class BasePlot(SceneCanvas, BoxZoomCameraMixin):
         """Get current zoom level."""
         return self.camera.extent
 
-    def plot_remove_patches(self):
-        pass
+    def plot_remove_patches(self, start_with: str | None = None, _repaint: bool = True):
+        """Remove groups of patches, optionally filtered by prefix."""
+        for gid in list(self.patch_groups):
+            if start_with is None or gid.startswith(start_with):
+                self.plot_remove_patch_group(gid)
 
     def plot_add_patch(self, *args, **kwargs):
         pass
 
+    def plot_add_patches(
+        self,
+        x: ty.Any,
+        y: ty.Any,
+        width: ty.Any,
+        height: ty.Any = None,
+        color: ty.Any = "r",
+        alpha: float = 0.5,
+        gid: str = "patches",
+        **_kwargs: ty.Any,
+    ) -> PatchGroup:
+        """Add many rectangular patches, rendered by a single mesh."""
+        if height is None:
+            height = self._extents.get_y()[1]
+        rectangles = coerce_rectangles(x, y, width, height)
+        colors = ColorArray(color).rgba
+        colors[:, 3] = alpha
+        self.plot_remove_patch_group(gid)
+        node = MeshNode(parent=self.view.scene)
+        group = PatchGroup(gid, rectangles, colors, item=node)
+        self._set_patch_group_data(group)
+        self.patch_groups[gid] = group
+        return group
+
+    def plot_update_patches(
+        self,
+        gid: str = "patches",
+        indices: ty.Any = None,
+        x: ty.Any = None,
+        y: ty.Any = None,
+        width: ty.Any = None,
+        height: ty.Any = None,
+        color: ty.Any = None,
+        visible: ty.Any = None,
+        alpha: float | None = None,
+    ) -> PatchGroup | None:
+        """Update position, size, color and/or visibility of patches at `indices` (or all patches) of a group."""
+        group = self.patch_groups.get(gid)
+        if group is None:
+            return None
+        colors = None if color is None else ColorArray(color).rgba
+        group.update(indices, x=x, y=y, width=width, height=height, colors=colors, visible=visible, alpha=alpha)
+        self._set_patch_group_data(group)
+        return group
+
+    @staticmethod
+    def _set_patch_group_data(group: PatchGroup) -> None:
+        """Upload rectangles as two triangles each, only emitting faces of the visible patches."""
+        n = len(group)
+        vertices = np.zeros((n * 4, 3), dtype=np.float32)
+        vertices[:, :2] = rectangle_vertices(group.rectangles).reshape(-1, 2)
+        shown = np.flatnonzero(group.visible)
+        faces = (RECTANGLE_FACES[None, :, :] + 4 * shown[:, None, None]).reshape(-1, 3)
+        group.item.set_data(vertices=vertices, faces=faces, vertex_colors=np.repeat(group.colors, 4, axis=0))
+        group.item.visible = len(shown) > 0
+
+    def get_patch_group(self, gid: str) -> PatchGroup | None:
+        """Get an existing group of patches."""
+        return self.patch_groups.get(gid)
+
+    def plot_remove_patch_group(self, gid: str) -> None:
+        """Remove group of patches."""
+        group = self.patch_groups.pop(gid, None)
+        if group is not None:
+            group.item.parent = None
+
     def remove_gid(self, gid: str) -> None:
         """Remove any node tracked under the provided gid."""
         self.plot_remove_line(gid)
+        self.plot_remove_patch_group(gid)
 
     def set_xy_line_limits(self, *args, **kwargs):
         pass
@@ -195,6 +278,7 @@ class BasePlot(SceneCanvas, BoxZoomCameraMixin):
         for value in self.nodes.values():
             value.parent = None
         self.nodes.clear()
+        self.plot_remove_patches()
 
 
 class PlotLine(BasePlot):
@@ -213,7 +297,7 @@ class PlotLine(BasePlot):
 
     def init(self):
         """Initialize view."""
-        self.node: LineNode = LineNode(color=(0, 0, 0), parent=self.view.scene, method="gl")
+        self.node: BufferedLineNode = BufferedLineNode(color=(0, 0, 0), parent=self.view.scene)
         self.set_axes(
             "#000000" if self._kwargs["facecolor"] in ["white", "#FFFFFF"] else "#FFFFFF",
             x_label=self._kwargs["x_label"],
@@ -269,7 +353,7 @@ class PlotLine(BasePlot):
         """Plot."""
         if self.node is None:
             self.init()
-        self.node.set_data(np.c_[x, y], color=color, width=width)
+        self.node.set_xy(x, y, color=color, width=width)
         self.node.order = kwargs.pop("zorder", 0)
         self.nodes[gid] = self.node
         self._set_xy_limits_from_array(x, y)
@@ -286,19 +370,28 @@ class PlotLine(BasePlot):
         """Update plot data."""
         if self.node is None:
             self.init()
-        self.node.set_data(np.c_[x, y], width=line_width, color=color)
+        self.node.set_xy(x, y, width=line_width, color=color)
         self.node.order = kwargs.pop("zorder", 0)
         self.nodes[gid] = self.node
         self._set_xy_limits_from_array(x, y)
 
+    def plot_1d_update_y(self, y: np.ndarray, gid: str = "line"):
+        """Update y-values of an existing line, keeping its x-values."""
+        node = self.nodes.get(gid)
+        if not isinstance(node, BufferedLineNode):
+            raise AttributeError(f"No line registered for gid={gid!r}")  # noqa: TRY003, TRY004
+        node.set_y(y)
+        self._set_xy_limits_from_array(node.x, y)
+
     def plot_1d_add(self, x: np.ndarray, y: np.ndarray, color=(0, 1, 0), width: int = 1, gid: str = "line", zorder=0):
         """Add new node."""
-        if gid in self.nodes:
+        if isinstance(self.nodes.get(gid), BufferedLineNode):
             node = self.nodes[gid]
         else:
-            node: LineNode = LineNode(color=color, parent=self.view.scene)
+            self.plot_remove_line(gid)
+            node: BufferedLineNode = BufferedLineNode(color=color, parent=self.view.scene)
         node.order = zorder
-        node.set_data(np.c_[x, y], color=color, width=width)
+        node.set_xy(x, y, color=color, width=width)
         self.nodes[gid] = node
         self._set_xy_limits_from_array(x, y)
 
@@ -389,6 +482,14 @@ class PlotScatter(PlotLine):
         super().__init__(parent, facecolor=facecolor, x_label=x_label, y_label=y_label, **kwargs)
         self.unfreeze()
         self._marker_set_data_supports_scaling: bool | None = None
+        # points drawn as a density image while too many of them are visible
+        self._density: DensityAggregator | None = None
+        self._density_node: ImageNode | None = None
+        self._density_lut = np.empty((0, 4), dtype=np.uint8)
+        self._density_style: dict[str, ty.Any] = {}
+        # re-aggregation is delayed until the view stops changing
+        self._density_timer = Timer(DENSITY_UPDATE_DELAY, connect=self.update_density, iterations=1)
+        self.view.camera.transform.changed.connect(self._on_view_changed)
 
     def init(self):
         """Initialize view."""
@@ -449,8 +550,31 @@ class PlotScatter(PlotLine):
         edge_color: str = "#FF0000",
         zorder: int = 5,
         size: float | np.ndarray = 1,
+        density: bool | None = None,
+        density_threshold: int = DENSITY_THRESHOLD,
+        cmap: str = "viridis",
         **kwargs,
     ):
+        """Plot scatter data.
+
+        When `density` is enabled, or left as None and there are more than `density_threshold` points, the points are
+        drawn as a density image of the visible region using `cmap`, which is re-aggregated whenever the view changes.
+        Once no more than `density_threshold` points are visible, they are drawn as individual markers instead.
+        """
+        self._remove_density()
+        if density is None:
+            density = len(x) > density_threshold
+        if density:
+            self._density = DensityAggregator(x, y, threshold=density_threshold)
+            self._density_style = {"zorder": zorder, "face_color": face_color, "edge_color": edge_color, "size": size}
+            self._density_lut = lookup_table(get_colormap(cmap).map(np.linspace(0, 1, 256)))
+            self._density_node = ImageNode(parent=self.view.scene, interpolation="nearest")
+            self._density_node.transform = STTransform()
+            self._density_node.order = zorder - 1
+            self._ensure_marker_node()
+            self._set_xy_limits_from_array(x, y, True)
+            self.update_density()
+            return
         self._set_marker_data(
             x,
             y,
@@ -461,6 +585,59 @@ class PlotScatter(PlotLine):
         )
         self._set_xy_limits_from_array(x, y, True)
 
+    def _on_view_changed(self, _event: ty.Any = None) -> None:
+        """Schedule re-aggregation of the density image."""
+        if self._density is not None:
+            self._density_timer.stop()
+            self._density_timer.start()
+
+    def _remove_density(self) -> None:
+        """Stop drawing points as a density image."""
+        self._density_timer.stop()
+        self._density = None
+        if self._density_node is not None:
+            self._density_node.parent = None
+            self._density_node = None
+            if self.node is not None:
+                self.node.visible = True
+
+    def is_dense(self) -> bool:
+        """Return whether the points are drawn as a density image."""
+        return self._density_node is not None and self._density_node.visible
+
+    def update_density(self, _event: ty.Any = None) -> None:
+        """Re-aggregate the density image for the current view."""
+        if self._density is None or self._density_node is None:
+            return
+        x_min, x_max, y_min, y_max = self.camera.extent
+        width, height = self.view.size
+        counts = self._density.aggregate((x_min, x_max, y_min, y_max), (height, width))
+        dense = self._density.is_dense(counts)
+        has_markers = False
+        if dense:
+            n_rows, n_cols = counts.shape
+            self._density_node.set_data(density_to_rgba(counts, self._density_lut))
+            self._density_node.transform.scale = ((x_max - x_min) / n_cols, (y_max - y_min) / n_rows)
+            self._density_node.transform.translate = (x_min, y_min)
+        else:
+            indices = self._density.visible_indices((x_min, x_max, y_min, y_max))
+            # per-point colors and sizes are reduced to the visible points
+            style = {
+                key: value[indices] if isinstance(value, np.ndarray) and len(value) == len(self._density) else value
+                for key, value in self._density_style.items()
+            }
+            has_markers = len(indices) > 0
+            if has_markers:
+                self._set_marker_data(self._density.x[indices], self._density.y[indices], **style)
+        self._density_node.visible = dense
+        self._ensure_marker_node().visible = has_markers
+        self.update()
+
+    def clear(self):
+        """Clear plot."""
+        self._remove_density()
+        super().clear()
+
     def update_scatter(
         self,
         x,
@@ -472,6 +649,11 @@ class PlotScatter(PlotLine):
         **kwargs,
     ):
         """Update scatter data."""
+        if self._density is not None:
+            self._density = DensityAggregator(x, y, threshold=self._density.threshold)
+            self._density_style = {"zorder": zorder, "face_color": face_color, "edge_color": edge_color, "size": size}
+            self.update_density()
+            return
         self._set_marker_data(
             x,
             y,
@@ -0,0 +1,72 @@
+"""Line visual with persistent vertex storage."""
+
+from __future__ import annotations
+
+import typing as ty
+
+import numpy as np
+from vispy.scene.visuals import create_visual_node
+from vispy.visuals import LineVisual
+
+from qtextraplot.utils.buffers import LineBuffer
+
+
+class BufferedLineVisual(LineVisual):
+    """Line whose vertices are kept in a :class:`LineBuffer` and updated in place.
+
+    Updates through :meth:`set_xy` and :meth:`set_y` do not allocate new vertex arrays. While the number of vertices
+    stays the same, only the range of vertices that changed is uploaded to the GPU; otherwise the whole line is
+    uploaded the next time it is drawn.
+    """
+
+    def __init__(self, pos: ty.Any = None, color: ty.Any = (0.5, 0.5, 0.5, 1), width: float = 1, **kwargs: ty.Any):
+        kwargs["method"] = "gl"
+        self.buffer = LineBuffer()
+        super().__init__(pos=pos, color=color, width=width, **kwargs)
+
+    @property
+    def x(self) -> np.ndarray:
+        """Return cached x-values."""
+        return self.buffer.x
+
+    @property
+    def y(self) -> np.ndarray:
+        """Return cached y-values."""
+        return self.buffer.y
+
+    def set_xy(self, x: np.ndarray, y: np.ndarray, **kwargs: ty.Any) -> None:
+        """Set x and y-values and optionally the `color` or `width` of the line."""
+        self.buffer.set_data(x, y)
+        self._upload()
+        if kwargs:
+            self.set_data(**kwargs)
+
+    def set_y(self, y: np.ndarray) -> None:
+        """Set y-values of the line, keeping the cached x-values."""
+        self.buffer.set_y(y)
+        self._upload()
+
+    def _upload(self) -> None:
+        """Upload changed vertices, or schedule upload of the whole line when its storage or length changed."""
+        changed = self.buffer.pop_changed()
+        vertices = self.buffer.vertices
+        pos = self._pos
+        # partial uploads rely on private internals of vispy 0.16 (the `_changed` flags of `LineVisual` and the
+        # `_pos_vbo` vertex buffer of its GL line visual); without them, the whole line is uploaded instead
+        pos_vbo = getattr(getattr(self, "_line_visual", None), "_pos_vbo", None)
+        if (
+            pos_vbo is None
+            or getattr(self, "_changed", {}).get("pos", True)
+            or not isinstance(pos, np.ndarray)
+            or pos.base is not self.buffer.data
+            or len(pos) != len(vertices)
+        ):
+            self.set_data(pos=vertices)
+        elif changed is not None:
+            start, stop = changed
+            pos_vbo.set_subdata(vertices[start:stop], offset=start)
+            self._bounds = None
+            self.update()
+
+
+BufferedLineNode = create_visual_node(BufferedLineVisual)
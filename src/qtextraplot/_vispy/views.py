@@ -116,6 +116,13 @@ class ViewVispyLine(_BaseVispyView):
         self.figure.repaint(repaint)
         self._cache_xy(x, y, **kwargs)
 
+    def update_y(self, y, repaint: bool = True):
+        """Update y-values of the line, keeping its x-values."""
+        with QMutexLocker(MUTEX):
+            self.figure.plot_1d_update_y(y)
+            self.figure.repaint(repaint)
+            self._data["y"] = np.asarray(y)
+
 
 class ViewVispyScatter(_BaseVispyView):
     """VisPy-backed scatter view."""
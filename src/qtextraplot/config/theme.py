@@ -44,14 +44,38 @@ class CanvasTheme(EventedModel):
     gridlines: Color
     label: Color
     _canvas_backup: Color | None = PrivateAttr(None)
+    _array_cache: dict[str, np.ndarray] = PrivateAttr(default_factory=dict)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._canvas_backup = self.canvas
+        self.events.connect(self._on_field_changed)
+
+    def _on_field_changed(self, info: ty.Any = None) -> None:
+        """Invalidate cached color array of the field that changed."""
+        name = getattr(getattr(info, "signal", None), "name", None)
+        if name is None:
+            self._array_cache.clear()
+        else:
+            self._array_cache.pop(name, None)
 
     def as_array(self, name: str) -> np.ndarray:
-        """Return color array."""
-        return np.asarray(getattr(self, name))
+        """Return RGBA color array.
+
+        Converted colors are cached until the corresponding field changes so repeated lookups from many views are
+        cheap. A copy is returned so callers cannot modify the cached value.
+        """
+        array = self._array_cache.get(name)
+        if array is None:
+            from napari.utils.colormaps.standardize_color import transform_color
+
+            color = Color(getattr(self, name))
+            array = self._array_cache[name] = transform_color(color.as_hex())[0]
+        return array.copy()
+
+    def as_arrays(self) -> dict[str, np.ndarray]:
+        """Return RGBA color arrays for every field of the theme."""
+        return {name: self.as_array(name) for name in type(self).model_fields}
 
 
 class CanvasThemes(ConfigBase):
@@ -120,10 +144,15 @@ class CanvasThemes(ConfigBase):
 
     def as_array(self, name: str) -> np.ndarray:
         """Return color array."""
-        from napari.utils.colormaps.standardize_color import transform_color
+        return self.active.as_array(name)
 
-        color: Color = getattr(self.active, name)
-        return transform_color(color.as_hex())[0]
+    def as_arrays(self) -> dict[str, np.ndarray]:
+        """Return color arrays of the active theme.
+
+        Views that update several colors in response to `evt_theme_changed` should call this once rather than
+        converting each color separately.
+        """
+        return self.active.as_arrays()
 
     def as_hex(self, name: str) -> str:
         """Return color as hex."""
@@ -134,7 +163,7 @@ class CanvasThemes(ConfigBase):
         """Check whether color clashes with the background color."""
         from napari.utils.colormaps.standardize_color import transform_color
 
-        background = transform_color(self.active.canvas.as_hex())[0]
+        background = self.as_array("canvas")
         color = transform_color(color)[0]
         # check whether color is too similar to background
         if np.linalg.norm(color - background) < 0.3:  # arbitrary threshold; colors are normalized 0-1
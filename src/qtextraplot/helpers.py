@@ -5,7 +5,8 @@ from __future__ import annotations
 import qtextra.helpers as hp
 import qtpy.QtWidgets as Qw
 from qtextra.typing import Callback
-from qtpy.QtGui import QImage, QPixmap
+from qtpy.QtCore import QModelIndex, QRect
+from qtpy.QtGui import QPainter, QPixmap
 
 try:
     try:
@@ -17,6 +18,69 @@ except ImportError:
     Array = None
     QtColormapComboBox = None
 
+# geometry of the entries in the colormap combobox list, matching napari
+COLORMAP_WIDTH = 50
+TEXT_WIDTH = 130
+ENTRY_HEIGHT = 20
+PADDING = 1
+LABEL_SIZE = (100, 18)
+
+
+class ColormapItemDelegate(Qw.QStyledItemDelegate):
+    """Item delegate that paints colormap previews from the shared thumbnail cache.
+
+    Previews are only rendered when an item is painted, i.e. when it first becomes visible in the list.
+    """
+
+    def __init__(self, base_height: int = ENTRY_HEIGHT, parent: Qw.QWidget | None = None):
+        super().__init__(parent)
+        self.base_height = base_height
+
+    def paint(self, painter: QPainter, style: Qw.QStyleOptionViewItem, index: QModelIndex) -> None:
+        """Paint colormap preview followed by its name."""
+        from qtextraplot.utils.colormap import colormap_thumbnail
+
+        text_style = Qw.QStyleOptionViewItem(style)
+        cbar_rect = QRect(
+            style.rect.x(),
+            style.rect.y() + PADDING,
+            style.rect.width() - TEXT_WIDTH,
+            style.rect.height() - 2 * PADDING,
+        )
+        text_style.rect = QRect(
+            style.rect.width() - TEXT_WIDTH,
+            style.rect.y() + PADDING,
+            style.rect.width(),
+            style.rect.height() - 2 * PADDING,
+        )
+        super().paint(painter, text_style, index)
+        if cbar_rect.width() > 0 and cbar_rect.height() > 0:
+            painter.drawImage(cbar_rect, colormap_thumbnail(str(index.data()), cbar_rect.width(), cbar_rect.height()))
+
+    def sizeHint(self, style: Qw.QStyleOptionViewItem, index: QModelIndex):
+        """Return size of each entry."""
+        res = super().sizeHint(style, index)
+        res.setHeight(self.base_height)
+        res.setWidth(max(500, res.width()))
+        return res
+
+
+def _make_colormap_combobox(parent: Qw.QWidget | None) -> QtColormapComboBox:
+    """Create colormap combobox whose previews are rendered lazily from the shared cache."""
+    try:
+        from napari._qt.layer_controls.qt_colormap_combobox import QtColormapComboBox
+    except ImportError:
+        from napari._qt.layer_controls.widgets.qt_colormap_control import QtColormapComboBox
+    from napari.utils.colormaps import AVAILABLE_COLORMAPS
+
+    widget = QtColormapComboBox(parent)
+    widget.view().setItemDelegate(ColormapItemDelegate(ENTRY_HEIGHT, parent=widget))
+    widget.setObjectName("colormapComboBox")
+    with hp.qt_signals_blocked(widget):
+        widget.addItems(AVAILABLE_COLORMAPS)
+    widget._allitems = set(AVAILABLE_COLORMAPS)
+    return widget
+
 
 def make_colormap_combobox(
     parent: Qw.QWidget | None,
@@ -25,34 +89,19 @@ def make_colormap_combobox(
     label_min_width: int = 0,
 ) -> tuple[QtColormapComboBox, Qw.QHBoxLayout]:
     """Make colormap combobox."""
-    try:
-        from napari._qt.layer_controls.qt_colormap_combobox import QtColormapComboBox
-    except ImportError:
-        from napari._qt.layer_controls.widgets.qt_colormap_control import QtColormapComboBox
-    from napari.utils.colormaps import AVAILABLE_COLORMAPS
+    from qtextraplot.utils.colormap import colormap_thumbnail
 
     def _update_colormap(value):
-        colormap = AVAILABLE_COLORMAPS[value]
-        cbar = colormap.colorbar
-        # Note that QImage expects the image width followed by height
-        image = QImage(
-            cbar,
-            cbar.shape[1],
-            cbar.shape[0],
-            QImage.Format.Format_RGBA8888,
-        )
-        widget_label.setPixmap(QPixmap.fromImage(image))
+        widget_label.setPixmap(QPixmap.fromImage(colormap_thumbnail(value, *LABEL_SIZE)))
 
     widget_label = hp.make_label(parent, "", object_name="colorbar")
     widget_label.setScaledContents(True)
     if label_min_width:
         widget_label.setMinimumWidth(label_min_width)
-    widget = QtColormapComboBox(parent)
-    widget.currentTextChanged.connect(_update_colormap)
-    widget.setObjectName("colormapComboBox")
-    widget.addItems(AVAILABLE_COLORMAPS)
-    widget._allitems = set(AVAILABLE_COLORMAPS)
+    widget = _make_colormap_combobox(parent)
     widget.setCurrentText(default)
+    _update_colormap(widget.currentText())
+    widget.currentTextChanged.connect(_update_colormap)
     if func:
         [widget.currentTextChanged.connect(func_) for func_ in hp._validate_func(func)]
     return widget, hp.make_h_layout(widget_label, widget, stretch_id=[1], spacing=0)
@@ -64,16 +113,7 @@ def make_colormap_combobox_alone(
     default: str = "magma",
 ) -> QtColormapComboBox:
     """Make colormap combobox."""
-    try:
-        from napari._qt.layer_controls.qt_colormap_combobox import QtColormapComboBox
-    except ImportError:
-        from napari._qt.layer_controls.widgets.qt_colormap_control import QtColormapComboBox
-    from napari.utils.colormaps import AVAILABLE_COLORMAPS
-
-    widget = QtColormapComboBox(parent)
-    widget.setObjectName("colormapComboBox")
-    widget.addItems(AVAILABLE_COLORMAPS)
-    widget._allitems = set(AVAILABLE_COLORMAPS)
+    widget = _make_colormap_combobox(parent)
     widget.setCurrentText(default)
     if func:
         [widget.currentTextChanged.connect(func_) for func_ in hp._validate_func(func)]
@@ -30,16 +30,9 @@ class NapariMixin:
         """Method is called just after user requested to see this widget.
 
         It is necessary in order to force updates in the vispy canvas which is otherwise not updated when the panel
-        is not visible.
+        is not visible. Refresh requests are coalesced and only views that are exposed and changed while hidden are
+        re-rendered.
         """
-        if self._views_2d:
-            for view_2d in self._views_2d:
-                view_2d.widget.canvas.native.update()
-
-        # try to fix axes issues
-        if self._views_1d:
-            for view_1d in self._views_1d:
-                view_1d.widget.canvas.native.update()
-                xmin, xmax, ymin, ymax = view_1d.viewer.camera.rect
-                view_1d.viewer.camera.rect = xmin + 1, xmax, ymin, ymax
-                view_1d.viewer.camera.rect = xmin, xmax, ymin, ymax
+        from qtextraplot._napari._wrapper import REFRESH_MANAGER
+
+        REFRESH_MANAGER.request(*(self._views_2d or ()), *(self._views_1d or ()))
@@ -1,5 +1,17 @@
-"""Public exports for matplotlib-backed views."""
+"""Public exports for matplotlib-backed views.
 
-from qtextraplot._mpl.views import ViewMplLine
+Attributes are imported on first access so that importing this module does not pull in matplotlib.
+"""
+
+from __future__ import annotations
+
+import typing as ty
+
+from qtextraplot.utils.utilities import lazy_module_attributes
+
+if ty.TYPE_CHECKING:
+    from qtextraplot._mpl.views import ViewMplLine
 
 __all__ = ["ViewMplLine"]
+
+__getattr__, __dir__ = lazy_module_attributes(__name__, {"ViewMplLine": "qtextraplot._mpl.views"})
@@ -1,6 +1,24 @@
-"""Public exports for napari-backed image views."""
+"""Public exports for napari-backed image views.
 
-from qtextraplot._napari._utilities import set_layer_spatial_calibration
-from qtextraplot._napari.image import NapariImageView
+Attributes are imported on first access so that importing this module does not pull in napari.
+"""
+
+from __future__ import annotations
+
+import typing as ty
+
+from qtextraplot.utils.utilities import lazy_module_attributes
+
+if ty.TYPE_CHECKING:
+    from qtextraplot._napari._utilities import set_layer_spatial_calibration
+    from qtextraplot._napari.image import NapariImageView
 
 __all__ = ["NapariImageView", "set_layer_spatial_calibration"]
+
+__getattr__, __dir__ = lazy_module_attributes(
+    __name__,
+    {
+        "NapariImageView": "qtextraplot._napari.image",
+        "set_layer_spatial_calibration": "qtextraplot._napari._utilities",
+    },
+)
@@ -1,5 +1,17 @@
-"""Public exports for napari-plot-backed line views."""
+"""Public exports for napari-plot-backed line views.
 
-from qtextraplot._napari.line import NapariLineView
+Attributes are imported on first access so that importing this module does not pull in napari or napari-plot.
+"""
+
+from __future__ import annotations
+
+import typing as ty
+
+from qtextraplot.utils.utilities import lazy_module_attributes
+
+if ty.TYPE_CHECKING:
+    from qtextraplot._napari.line import NapariLineView
 
 __all__ = ["NapariLineView"]
+
+__getattr__, __dir__ = lazy_module_attributes(__name__, {"NapariLineView": "qtextraplot._napari.line"})
@@ -1,13 +1,23 @@
-"""Public exports for pyqtgraph-backed views."""
+"""Public exports for pyqtgraph-backed views.
 
-from qtextraplot._pyqtgraph import (
-    LegendEntry,
-    PyQtGraphCanvas,
-    ViewPyQtGraphCanvas,
-    ViewPyQtGraphImage,
-    ViewPyQtGraphLine,
-    ViewPyQtGraphScatter,
-)
+Attributes are imported on first access so that importing this module does not pull in pyqtgraph.
+"""
+
+from __future__ import annotations
+
+import typing as ty
+
+from qtextraplot.utils.utilities import lazy_module_attributes
+
+if ty.TYPE_CHECKING:
+    from qtextraplot._pyqtgraph import (
+        LegendEntry,
+        PyQtGraphCanvas,
+        ViewPyQtGraphCanvas,
+        ViewPyQtGraphImage,
+        ViewPyQtGraphLine,
+        ViewPyQtGraphScatter,
+    )
 
 __all__ = [
     "LegendEntry",
@@ -17,3 +27,5 @@ __all__ = [
     "ViewPyQtGraphLine",
     "ViewPyQtGraphScatter",
 ]
+
+__getattr__, __dir__ = lazy_module_attributes(__name__, dict.fromkeys(__all__, "qtextraplot._pyqtgraph"))
@@ -0,0 +1,105 @@
+"""Preallocated vertex storage of lines that are updated in place."""
+
+from __future__ import annotations
+
+import numpy as np
+
+LINE_BUFFER_SHAPE_ERROR = "Line `x` and `y` must be one-dimensional arrays of the same length."
+LINE_BUFFER_SIZE_ERROR = "Expected {} y-values matching the cached x-values, received {}."
+
+# minimum number of vertices allocated for a line
+LINE_BUFFER_MIN_CAPACITY = 1024
+# factor by which the capacity grows when the vertices no longer fit
+LINE_BUFFER_GROWTH = 1.5
+
+
+class LineBuffer:
+    """Float32 (capacity, 2) vertex storage of a line whose values are written in place.
+
+    The capacity grows geometrically, so the storage is only reallocated when a line gets longer than any line before
+    it. Writes only touch values that differ from the stored ones, and the range of vertices changed since the last
+    call to :meth:`pop_changed` is tracked so that only that range has to be uploaded to the GPU.
+    """
+
+    def __init__(self, capacity: int = LINE_BUFFER_MIN_CAPACITY):
+        self.data = np.zeros((max(capacity, 1), 2), dtype=np.float32)
+        self.size = 0
+        self._changed: tuple[int, int] | None = None
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}<size={self.size}, capacity={self.capacity}>"
+
+    @property
+    def capacity(self) -> int:
+        """Return number of vertices that fit into the storage."""
+        return len(self.data)
+
+    @property
+    def vertices(self) -> np.ndarray:
+        """Return (size, 2) view of the vertices."""
+        return self.data[: self.size]
+
+    @property
+    def x(self) -> np.ndarray:
+        """Return view of the x-values."""
+        return self.data[: self.size, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        """Return view of the y-values."""
+        return self.data[: self.size, 1]
+
+    def _reserve(self, size: int) -> None:
+        """Grow the storage so that at least `size` vertices fit, keeping the current vertices."""
+        if size <= self.capacity:
+            return
+        data = np.zeros((max(size, int(self.capacity * LINE_BUFFER_GROWTH)), 2), dtype=np.float32)
+        data[: self.size] = self.vertices
+        self.data = data
+
+    def _mark_changed(self, start: int, stop: int) -> None:
+        if self._changed is not None:
+            start, stop = min(start, self._changed[0]), max(stop, self._changed[1])
+        self._changed = (start, stop)
+
+    def _write(self, column: int, values: np.ndarray) -> None:
+        """Write values into the column, skipping leading and trailing values that did not change."""
+        current = self.data[: len(values), column]
+        differs = current != values
+        # NaN is never equal to itself, but NaN values that were already stored did not change
+        differs &= ~(np.isnan(current) & np.isnan(values))
+        changed = np.flatnonzero(differs)
+        if len(changed):
+            start, stop = int(changed[0]), int(changed[-1]) + 1
+            current[start:stop] = values[start:stop]
+            self._mark_changed(start, stop)
+
+    def set_data(self, x: np.ndarray, y: np.ndarray) -> None:
+        """Set x and y-values of the line."""
+        x, y = np.asarray(x, dtype=np.float32), np.asarray(y, dtype=np.float32)
+        if x.ndim != 1 or x.shape != y.shape:
+            raise ValueError(LINE_BUFFER_SHAPE_ERROR)
+        size = len(x)
+        self._reserve(size)
+        if size > self.size:
+            # values beyond the previous end are stale, so they have to be written and uploaded
+            self.data[self.size : size] = np.nan
+            self._mark_changed(self.size, size)
+        self.size = size
+        self._write(0, x)
+        self._write(1, y)
+
+    def set_y(self, y: np.ndarray) -> None:
+        """Set y-values of the line, keeping the cached x-values."""
+        y = np.asarray(y, dtype=np.float32)
+        if y.ndim != 1 or len(y) != self.size:
+            raise ValueError(LINE_BUFFER_SIZE_ERROR.format(self.size, len(y)))
+        self._write(1, y)
+
+    def pop_changed(self) -> tuple[int, int] | None:
+        """Return start and stop of the range of vertices changed since the last call, or None."""
+        changed, self._changed = self._changed, None
+        return changed
@@ -0,0 +1,191 @@
+"""Classification curves computed from binned scores."""
+
+from __future__ import annotations
+
+import typing as ty
+
+import numpy as np
+
+SCORE_SHAPE_ERROR = "Scores must be a one-dimensional array or a (N, {}) array with one column per class."
+LABEL_COUNT_ERROR = "Number of labels must match the number of scores."
+CALIBRATION_BINS_ERROR = "Number of calibration bins must divide the number of histogram bins ({})."
+
+
+def downsample_curve(x: np.ndarray, y: np.ndarray, resolution: float) -> tuple[np.ndarray, np.ndarray]:
+    """Reduce the number of vertices of a curve in the unit square to the `resolution` of the screen.
+
+    Only the first vertex in each cell of a `resolution` x `resolution` grid is kept, together with the last vertex of
+    the curve, so that the curve does not deviate from the original by more than about one cell.
+    """
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    if len(x) <= 2 or resolution <= 0:
+        return x, y
+    cells = np.floor(np.c_[x, y] * resolution)
+    keep = np.ones(len(x), dtype=bool)
+    keep[1:] = np.any(cells[1:] != cells[:-1], axis=1)
+    keep[-1] = True
+    return x[keep], y[keep]
+
+
+class ScoreHistogram:
+    """Counts of positive and negative predictions in fixed score bins, for each class.
+
+    ROC, precision-recall and calibration curves are computed from the counts, so that scores can be accumulated
+    across batches with :meth:`update` without keeping or sorting them. The curves are exact at the bin edges.
+    """
+
+    def __init__(self, n_classes: int = 1, n_bins: int = 1000):
+        self.n_classes = n_classes
+        self.n_bins = n_bins
+        self.positives = np.zeros((n_classes, n_bins), dtype=np.int64)
+        self.negatives = np.zeros((n_classes, n_bins), dtype=np.int64)
+        # sum of scores in each bin, used to compute the mean predicted probability
+        self.score_sums = np.zeros((n_classes, n_bins))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}<n_classes={self.n_classes}, n_bins={self.n_bins}, n={self.n_samples}>"
+
+    @classmethod
+    def from_scores(cls, y_true: np.ndarray, scores: np.ndarray, n_bins: int = 1000) -> ScoreHistogram:
+        """Create histogram from true labels and scores."""
+        scores = np.asarray(scores)
+        histogram = cls(1 if scores.ndim == 1 else scores.shape[1], n_bins=n_bins)
+        histogram.update(y_true, scores)
+        return histogram
+
+    @property
+    def n_samples(self) -> int:
+        """Return number of accumulated samples."""
+        return int(self.positives[0].sum() + self.negatives[0].sum())
+
+    @property
+    def bin_edges(self) -> np.ndarray:
+        """Return edges of the score bins."""
+        # division is correctly rounded, so edges are equal to scores such as 0.6 that lie on them
+        return np.arange(self.n_bins + 1) / self.n_bins
+
+    def update(self, y_true: np.ndarray, scores: np.ndarray) -> None:
+        """Add batch of predictions.
+
+        Parameters
+        ----------
+        y_true : np.ndarray
+            Boolean labels when there is a single class, otherwise index of the true class of each sample.
+        scores : np.ndarray
+            Probability of the positive class as (N,) array or probability of each class as (N, n_classes) array.
+        """
+        y_true = np.asarray(y_true).ravel()
+        scores = np.asarray(scores, dtype=float)
+        if scores.ndim == 1 and self.n_classes == 1:
+            scores = scores[:, None]
+            y_true = y_true.astype(bool)[:, None]
+        elif scores.ndim == 2 and scores.shape[1] == self.n_classes:
+            y_true = y_true[:, None] == np.arange(self.n_classes)
+        else:
+            raise ValueError(SCORE_SHAPE_ERROR.format(self.n_classes))
+        if len(y_true) != len(scores):
+            raise ValueError(LABEL_COUNT_ERROR)
+
+        edges = self.bin_edges
+        for index in range(self.n_classes):
+            column = scores[:, index]
+            bins = np.clip((column * self.n_bins).astype(np.intp), 0, self.n_bins - 1)
+            # correct rounding errors of scores that lie on the bin edges
+            bins += (column >= edges[bins + 1]) & (bins < self.n_bins - 1)
+            bins -= (column < edges[bins]) & (bins > 0)
+            is_positive = y_true[:, index]
+            positives = np.bincount(bins, weights=is_positive, minlength=self.n_bins)
+            counts = np.bincount(bins, minlength=self.n_bins)
+            self.positives[index] += positives.astype(np.int64)
+            self.negatives[index] += counts - positives.astype(np.int64)
+            self.score_sums[index] += np.bincount(bins, weights=column, minlength=self.n_bins)
+
+    def merge(self, other: ScoreHistogram) -> ScoreHistogram:
+        """Add counts of another histogram with the same bins to this one."""
+        self.positives += other.positives
+        self.negatives += other.negatives
+        self.score_sums += other.score_sums
+        return self
+
+    def _cumulative_counts(self, index: int | None) -> tuple[np.ndarray, np.ndarray]:
+        """Return number of true and false positives at each threshold, starting at the highest threshold.
+
+        When `index` is None, counts of every class are pooled (micro-average).
+        """
+        positives = self.positives.sum(axis=0) if index is None else self.positives[index]
+        negatives = self.negatives.sum(axis=0) if index is None else self.negatives[index]
+        tp = np.r_[0, np.cumsum(positives[::-1])]
+        fp = np.r_[0, np.cumsum(negatives[::-1])]
+        return tp, fp
+
+    def roc_curve(self, index: int | None = 0) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return false positive rate, true positive rate and decreasing thresholds of class at `index`."""
+        tp, fp = self._cumulative_counts(index)
+        thresholds = np.r_[np.inf, self.bin_edges[-2::-1]]
+        fpr = fp / fp[-1] if fp[-1] else np.zeros(len(fp))
+        tpr = tp / tp[-1] if tp[-1] else np.zeros(len(tp))
+        return fpr, tpr, thresholds
+
+    def precision_recall_curve(self, index: int | None = 0) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return precision, recall and decreasing thresholds of class at `index`."""
+        tp, fp = self._cumulative_counts(index)
+        thresholds = np.r_[np.inf, self.bin_edges[-2::-1]]
+        predicted = tp + fp
+        precision = np.divide(tp, predicted, out=np.ones(len(tp)), where=predicted > 0)
+        recall = tp / tp[-1] if tp[-1] else np.zeros(len(tp))
+        return precision, recall, thresholds
+
+    def calibration_curve(self, index: int = 0, n_bins: int = 10) -> tuple[np.ndarray, np.ndarray]:
+        """Return fraction of positives and mean predicted probability in `n_bins` uniform bins, skipping empty bins."""
+        if self.n_bins % n_bins:
+            raise ValueError(CALIBRATION_BINS_ERROR.format(self.n_bins))
+        positives = self.positives[index].reshape(n_bins, -1).sum(axis=1)
+        counts = positives + self.negatives[index].reshape(n_bins, -1).sum(axis=1)
+        score_sums = self.score_sums[index].reshape(n_bins, -1).sum(axis=1)
+        mask = counts > 0
+        return positives[mask] / counts[mask], score_sums[mask] / counts[mask]
+
+    def class_labels(self, labels: ty.Sequence[str]) -> list[str]:
+        """Return labels of the classes in the histogram.
+
+        Histograms of one-dimensional scores only hold the positive class, which is the last of the `labels` of a
+        binary classifier.
+        """
+        if self.n_classes == 1:
+            return list(labels[-1:])
+        return list(labels[: self.n_classes])
+
+    def roc_curves(self, labels: ty.Sequence[str]) -> tuple[dict, dict, dict]:
+        """Return false positive rate, true positive rate and labels of each class, including micro and macro-averages.
+
+        The output matches the input of `PlotBase.plot_roc`.
+        """
+        fpr, tpr, names = {}, {}, {}
+        labels = self.class_labels(labels)
+        for index, label in enumerate(labels):
+            fpr[label], tpr[label], _ = self.roc_curve(index)
+            names[label] = label
+        if self.n_classes > 1:
+            fpr["micro"], tpr["micro"], _ = self.roc_curve(None)
+            names["micro"] = "micro-average"
+            # average true positive rate of each class at every false positive rate
+            all_fpr = np.unique(np.concatenate([fpr[label] for label in labels]))
+            mean_tpr = np.mean([np.interp(all_fpr, fpr[label], tpr[label]) for label in labels], axis=0)
+            fpr["macro"], tpr["macro"] = all_fpr, mean_tpr
+            names["macro"] = "macro-average"
+        return fpr, tpr, names
+
+    def precision_recall_curves(self, labels: ty.Sequence[str]) -> tuple[dict, dict, dict]:
+        """Return precision, recall and labels of each class, including micro-average.
+
+        The output matches the input of `PlotBase.plot_precision_recall`.
+        """
+        precision, recall, names = {}, {}, {}
+        labels = self.class_labels(labels)
+        for index, label in enumerate(labels):
+            precision[label], recall[label], _ = self.precision_recall_curve(index)
+            names[label] = label
+        if self.n_classes > 1:
+            precision["micro"], recall["micro"], _ = self.precision_recall_curve(None)
+            names["micro"] = "micro-average"
+        return precision, recall, names
@@ -1,23 +1,61 @@
 """Colormap."""
 
 import typing as ty
+from functools import lru_cache
 
 import numpy as np
+from qtpy.QtGui import QImage
 from vispy.color import Colormap as VispyColormap
 
 
 def vispy_colormaps(colors: ty.List[np.ndarray]) -> ty.List[VispyColormap]:
     """Return list of colormaps."""
-    return [VispyColormap([np.asarray([0.0, 0.0, 0.0, 1.0]), color]) for color in colors]
+    return [vispy_colormap(color) for color in colors]
+
+
+def _color_key(color) -> ty.Tuple[float, ...]:
+    """Return hashable representation of a color so that colormaps can be cached."""
+    return tuple(np.asarray(color, dtype=float).ravel().tolist())
+
+
+@lru_cache(maxsize=256)
+def _vispy_colormap(color: ty.Tuple[float, ...]) -> VispyColormap:
+    return VispyColormap([np.asarray([0.0, 0.0, 0.0, 1.0]), np.asarray(color)])
 
 
 def vispy_colormap(color, name: str = "") -> VispyColormap:
-    """Return vispy colormap."""
-    return VispyColormap([np.asarray([0.0, 0.0, 0.0, 1.0]), color])
+    """Return vispy colormap.
 
+    Colormaps are cached by color, so callers should not modify the returned object.
+    """
+    return _vispy_colormap(_color_key(color))
 
-def napari_colormap(color, name: str = ""):
-    """Return napari colormap."""
+
+@lru_cache(maxsize=256)
+def _napari_colormap(color: ty.Tuple[float, ...], name: str):
     from napari.utils.colormaps.colormap_utils import convert_vispy_colormap
 
-    return convert_vispy_colormap(vispy_colormap(color), name=name)
+    return convert_vispy_colormap(_vispy_colormap(color), name=name)
+
+
+def napari_colormap(color, name: str = ""):
+    """Return napari colormap.
+
+    Colormaps are cached by color and name, so callers should not modify the returned object.
+    """
+    return _napari_colormap(_color_key(color), name)
+
+
+@lru_cache(maxsize=1024)
+def colormap_thumbnail(name: str, width: int, height: int) -> QImage:
+    """Return horizontal preview of a napari colormap.
+
+    Previews are rendered on first request and shared by all widgets in the process, keyed by colormap name and
+    size. Call `colormap_thumbnail.cache_clear()` if a colormap is re-registered under an existing name.
+    """
+    from napari.utils.colormaps import AVAILABLE_COLORMAPS, ensure_colormap, make_colorbar
+
+    colormap = AVAILABLE_COLORMAPS[name] if name in AVAILABLE_COLORMAPS else ensure_colormap(name)
+    colorbar = make_colorbar(colormap, (height, width))
+    # Note that QImage expects the image width followed by height; copy it so the image owns its buffer
+    return QImage(colorbar, width, height, QImage.Format.Format_RGBA8888).copy()
@@ -0,0 +1,205 @@
+"""Aggregation of large scatter data into screen-resolution density images."""
+
+from __future__ import annotations
+
+import typing as ty
+
+import numpy as np
+
+DENSITY_SHAPE_ERROR = "Scatter `x` and `y` must be one-dimensional arrays of the same length."
+
+# number of visible points above which scatter data is drawn as a density image
+DENSITY_THRESHOLD = 100_000
+# number of bins of the histogram of all points along each axis, used when zoomed out
+DENSITY_GRID_SIZE = 2048
+# number of points binned at a time, limiting the size of temporary arrays
+DENSITY_CHUNK_SIZE = 5_000_000
+
+Extent = tuple[float, float, float, float]
+
+
+def _bin_points(
+    x: np.ndarray,
+    y: np.ndarray,
+    extent: Extent,
+    shape: tuple[int, int],
+    chunk_size: int = DENSITY_CHUNK_SIZE,
+) -> np.ndarray:
+    """Return (height, width) histogram of points within the (x_min, x_max, y_min, y_max) extent."""
+    x_min, x_max, y_min, y_max = extent
+    height, width = shape
+    x_scale = width / (x_max - x_min) if x_max > x_min else 0.0
+    y_scale = height / (y_max - y_min) if y_max > y_min else 0.0
+    counts = np.zeros(height * width, dtype=np.int64)
+    for start in range(0, len(x), chunk_size):
+        x_chunk, y_chunk = x[start : start + chunk_size], y[start : start + chunk_size]
+        mask = (x_chunk >= x_min) & (x_chunk <= x_max) & (y_chunk >= y_min) & (y_chunk <= y_max)
+        if not mask.any():
+            continue
+        columns = np.minimum(((x_chunk[mask] - x_min) * x_scale).astype(np.intp), width - 1)
+        rows = np.minimum(((y_chunk[mask] - y_min) * y_scale).astype(np.intp), height - 1)
+        counts += np.bincount(rows * width + columns, minlength=height * width)
+    return counts.reshape(height, width)
+
+
+def density_to_rgba(counts: np.ndarray, lut: np.ndarray) -> np.ndarray:
+    """Map counts to RGBA image using logarithmic scale, with empty bins fully transparent.
+
+    Parameters
+    ----------
+    counts : np.ndarray
+        (height, width) array of counts.
+    lut : np.ndarray
+        (N, 4) lookup table of uint8 RGBA colors, from the lowest to the highest density.
+    """
+    n_colors = len(lut)
+    maximum = np.log1p(counts.max()) if counts.size else 0.0
+    indices = np.zeros(counts.shape, dtype=np.intp)
+    if maximum > 0:
+        scaled = np.log1p(counts, dtype=np.float32) * ((n_colors - 1) / maximum)
+        indices = np.maximum(np.rint(scaled).astype(np.intp), 1)
+    rgba = lut[indices]
+    rgba[counts == 0] = 0
+    return rgba
+
+
+class DensityAggregator:
+    """Scatter points that are binned into a histogram of the visible region instead of being drawn one by one.
+
+    Points are binned once into a histogram covering all data, whose bins are summed when zoomed out. When zoomed in
+    beyond its resolution, points within the view are binned directly. When only few points are visible, they
+    should be drawn as individual markers instead, see :meth:`is_dense`.
+    """
+
+    def __init__(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        threshold: int = DENSITY_THRESHOLD,
+        grid_size: int = DENSITY_GRID_SIZE,
+    ):
+        x, y = np.asarray(x), np.asarray(y)
+        if x.ndim != 1 or x.shape != y.shape:
+            raise ValueError(DENSITY_SHAPE_ERROR)
+        self.x, self.y = x, y
+        self.threshold = threshold
+        self.grid_size = grid_size
+        finite = np.isfinite(x) & np.isfinite(y) if len(x) else np.zeros(0, dtype=bool)
+        if finite.any():
+            self.extent: Extent = (
+                float(x[finite].min()),
+                float(x[finite].max()),
+                float(y[finite].min()),
+                float(y[finite].max()),
+            )
+        else:
+            self.extent = (0.0, 1.0, 0.0, 1.0)
+        self._grid: np.ndarray | None = None
+        # extent, shape and result of the last aggregation
+        self._last: tuple[Extent, tuple[int, int], np.ndarray] | None = None
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}<n={len(self)}, threshold={self.threshold}>"
+
+    @property
+    def grid(self) -> np.ndarray:
+        """Return histogram of all points, computed on first use."""
+        if self._grid is None:
+            self._grid = _bin_points(self.x, self.y, self.extent, (self.grid_size, self.grid_size))
+        return self._grid
+
+    def _grid_weights(
+        self,
+        low: float,
+        high: float,
+        data_low: float,
+        data_high: float,
+        n_bins: int,
+    ) -> tuple[np.ndarray, np.ndarray] | None:
+        """Return how bins of the histogram of all points are split between `n_bins` output bins along one axis.
+
+        Returns the index of the output bin containing the start of each histogram bin and the fraction of each
+        histogram bin that falls into the following output bin, or None when the histogram is too coarse.
+        """
+        if data_high <= data_low or (high - low) * self.grid_size / (data_high - data_low) < n_bins:
+            return None
+        # position and width of each histogram bin in units of output bins, with width of at most one
+        scale = n_bins / (high - low)
+        step = (data_high - data_low) / self.grid_size
+        starts = (data_low + np.arange(self.grid_size) * step - low) * scale
+        width = step * scale
+        indices = np.floor(starts).astype(np.intp)
+        fractions = np.clip(starts + width - (indices + 1), 0, None) / width
+        return indices, fractions
+
+    @staticmethod
+    def _split_sum(
+        grid: np.ndarray,
+        indices: np.ndarray,
+        fractions: np.ndarray,
+        n_bins: int,
+        axis: int,
+    ) -> np.ndarray:
+        """Sum histogram bins along `axis` into `n_bins` output bins, splitting each between two adjacent bins."""
+        shape = list(grid.shape)
+        shape[axis] = n_bins
+        counts = np.zeros(shape)
+        for target, weights in ((indices, 1 - fractions), (indices + 1, fractions)):
+            selected = np.flatnonzero((target >= 0) & (target < n_bins) & (weights > 0))
+            if len(selected) == 0:
+                continue
+            target = target[selected]
+            weights = weights[selected] if axis == 1 else weights[selected, None]
+            part = np.take(grid, selected, axis=axis) * weights
+            # target bins are increasing, so consecutive histogram bins with the same target can be summed together
+            starts = np.flatnonzero(np.r_[True, np.diff(target) > 0])
+            summed = np.add.reduceat(part, starts, axis=axis)
+            if axis == 0:
+                counts[target[starts]] += summed
+            else:
+                counts[:, target[starts]] += summed
+        return counts
+
+    def aggregate(self, extent: Extent, shape: tuple[int, int]) -> np.ndarray:
+        """Return (height, width) histogram of points within the (x_min, x_max, y_min, y_max) extent.
+
+        When zoomed out, counts are estimated from the histogram of all points and are not necessarily integers.
+        """
+        extent = tuple(float(value) for value in extent)
+        shape = (max(int(shape[0]), 1), max(int(shape[1]), 1))
+        if self._last is not None and self._last[:2] == (extent, shape):
+            return self._last[2]
+
+        x_min, x_max, y_min, y_max = extent
+        data_x_min, data_x_max, data_y_min, data_y_max = self.extent
+        x_weights = self._grid_weights(x_min, x_max, data_x_min, data_x_max, shape[1])
+        y_weights = self._grid_weights(y_min, y_max, data_y_min, data_y_max, shape[0])
+        if x_weights is not None and y_weights is not None:
+            # view is zoomed out far enough to sum bins of the histogram of all points
+            counts = self._split_sum(self.grid, *y_weights, shape[0], axis=0)
+            counts = self._split_sum(counts, *x_weights, shape[1], axis=1)
+        else:
+            counts = _bin_points(self.x, self.y, extent, shape)
+        self._last = (extent, shape, counts)
+        return counts
+
+    def is_dense(self, counts: np.ndarray) -> bool:
+        """Return whether the aggregated points should be drawn as a density image rather than as markers."""
+        return int(counts.sum()) > self.threshold
+
+    def visible_indices(self, extent: Extent) -> np.ndarray:
+        """Return indices of points within the (x_min, x_max, y_min, y_max) extent."""
+        x_min, x_max, y_min, y_max = extent
+        return np.flatnonzero((self.x >= x_min) & (self.x <= x_max) & (self.y >= y_min) & (self.y <= y_max))
+
+
+def lookup_table(colors: ty.Any, n_colors: int = 256) -> np.ndarray:
+    """Return (n_colors, 4) uint8 lookup table interpolated from (N, 4) RGBA colors with values between 0 and 1."""
+    colors = np.asarray(colors, dtype=float)
+    positions = np.linspace(0, 1, len(colors))
+    samples = np.linspace(0, 1, n_colors)
+    lut = np.stack([np.interp(samples, positions, colors[:, channel]) for channel in range(4)], axis=1)
+    return np.rint(lut * 255).astype(np.uint8)
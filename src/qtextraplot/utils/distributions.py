@@ -0,0 +1,239 @@
+"""Per-group summaries of large distributions, used instead of passing every sample to the plotting library."""
+
+from __future__ import annotations
+
+import hashlib
+import typing as ty
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+import numpy as np
+
+if ty.TYPE_CHECKING:
+    import pandas as pd
+
+DISTRIBUTION_KIND_ERROR = "Distribution kind must be one of: {}."
+DISTRIBUTION_COLUMN_ERROR = "Both `x` and `y` must be specified for long-form data."
+
+# maximum number of cached summaries
+DISTRIBUTION_CACHE_SIZE = 16
+# number of points of the density grid
+KDE_GRID_SIZE = 512
+# maximum number of points drawn per group by strip plots and as outliers
+MAX_POINTS_PER_GROUP = 2_000
+# maximum number of points in each value bin of strip plots
+MAX_POINTS_PER_BIN = 50
+
+_SUMMARY_CACHE: OrderedDict[tuple, list[GroupDistribution]] = OrderedDict()
+
+
+@dataclass
+class GroupDistribution:
+    """Summary of the values of a single group."""
+
+    name: str
+    count: int
+    q1: float
+    median: float
+    q3: float
+    # most extreme values within 1.5 inter-quartile range of the quartiles
+    whislo: float
+    whishi: float
+    # subsample of values outside of the whiskers
+    fliers: np.ndarray = field(default_factory=lambda: np.empty(0))
+    # density evaluated on a regular grid
+    grid: np.ndarray = field(default_factory=lambda: np.empty(0))
+    density: np.ndarray = field(default_factory=lambda: np.empty(0))
+    # (k, 2) lower and upper letter values, from the widest to the narrowest box
+    letter_values: np.ndarray = field(default_factory=lambda: np.empty((0, 2)))
+    # density-capped subsample of values
+    sample: np.ndarray = field(default_factory=lambda: np.empty(0))
+
+    def to_bxp(self) -> dict:
+        """Return statistics in the format expected by `matplotlib.axes.Axes.bxp`."""
+        return {
+            "label": self.name,
+            "med": self.median,
+            "q1": self.q1,
+            "q3": self.q3,
+            "whislo": self.whislo,
+            "whishi": self.whishi,
+            "fliers": self.fliers,
+        }
+
+
+def dataframe_fingerprint(df: pd.DataFrame) -> str:
+    """Return hash of the values, index and columns of the DataFrame."""
+    import pandas as pd
+
+    digest = hashlib.sha1(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())  # noqa: S324
+    digest.update(repr(tuple(df.columns)).encode())
+    return digest.hexdigest()
+
+
+def subsample(values: np.ndarray, n: int, seed: int = 0) -> np.ndarray:
+    """Return at most `n` randomly selected values, keeping their order."""
+    if len(values) <= n:
+        return values
+    indices = np.random.default_rng(seed).choice(len(values), n, replace=False)
+    return values[np.sort(indices)]
+
+
+def density_capped_subsample(
+    values: np.ndarray,
+    max_points: int = MAX_POINTS_PER_GROUP,
+    max_per_bin: int = MAX_POINTS_PER_BIN,
+    n_bins: int = 200,
+    seed: int = 0,
+) -> np.ndarray:
+    """Return subsample of values with at most `max_per_bin` values in each of `n_bins` value bins.
+
+    Dense regions are thinned out while sparse tails are kept, and the total number of values is limited to
+    `max_points`.
+    """
+    if len(values) <= max_per_bin:
+        return values
+    lo, hi = values.min(), values.max()
+    bins = (
+        np.zeros(len(values), dtype=np.intp) if hi == lo else ((values - lo) / (hi - lo) * (n_bins - 1)).astype(np.intp)
+    )
+    # random order, then rank of each value within its bin
+    order = np.random.default_rng(seed).permutation(len(values))
+    order = order[np.argsort(bins[order], kind="stable")]
+    sorted_bins = bins[order]
+    counts = np.bincount(sorted_bins)
+    rank = np.arange(len(values)) - (np.cumsum(counts) - counts)[sorted_bins]
+    selected = values[order[rank < max_per_bin]]
+    return subsample(selected, max_points, seed)
+
+
+def binned_kde(
+    values: np.ndarray,
+    grid_size: int = KDE_GRID_SIZE,
+    bw_adjust: float = 1.0,
+    cut: float = 2.0,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return regular grid and Gaussian kernel density estimate of the values evaluated on it.
+
+    Values are linearly binned onto the grid and convolved with the kernel using FFT, so the cost depends on the
+    number of values only through the binning. The bandwidth follows Scott's rule.
+    """
+    values = np.asarray(values, dtype=float)
+    n = len(values)
+    std = values.std() if n > 1 else 0.0
+    bandwidth = bw_adjust * std * n ** (-1 / 5) if std > 0 else 1e-3 * max(abs(values[0]), 1.0)
+    lo, hi = values.min() - cut * bandwidth, values.max() + cut * bandwidth
+    grid = np.linspace(lo, hi, grid_size)
+    step = grid[1] - grid[0]
+
+    # linear binning: split each value between the two nearest grid points
+    position = (values - lo) / step
+    left = np.clip(np.floor(position).astype(np.intp), 0, grid_size - 2)
+    weight = position - left
+    counts = np.bincount(left, weights=1 - weight, minlength=grid_size)
+    counts += np.bincount(left + 1, weights=weight, minlength=grid_size)
+
+    # kernel is evaluated up to 4 bandwidths; zero-padding avoids wrap-around of the circular convolution
+    half_width = min(int(np.ceil(4 * bandwidth / step)), grid_size)
+    offsets = np.arange(-half_width, half_width + 1) * step
+    kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2)
+    kernel /= kernel.sum() * step
+    size = grid_size + len(kernel) - 1
+    density = np.fft.irfft(np.fft.rfft(counts, size) * np.fft.rfft(kernel, size), size)
+    density = density[half_width : half_width + grid_size] / n
+    return grid, np.clip(density, 0, None)
+
+
+def letter_values(values: np.ndarray, k: int | None = None) -> np.ndarray:
+    """Return (k, 2) array of lower and upper letter values, starting with the quartiles.
+
+    By default, the number of levels is chosen so that each of the narrowest boxes still contains a few values.
+    """
+    n = len(values)
+    if k is None:
+        k = max(int(np.log2(n)) - 3, 1) if n > 1 else 1
+    tails = 0.5 ** np.arange(2, k + 2)
+    quantiles = np.quantile(values, np.r_[tails, 1 - tails])
+    return np.c_[quantiles[:k], quantiles[k:]]
+
+
+def _summarize_group(name: str, values: np.ndarray, kind: str) -> GroupDistribution:
+    q1, median, q3 = np.quantile(values, [0.25, 0.5, 0.75])
+    iqr = q3 - q1
+    inside = values[(values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)]
+    whislo, whishi = (inside.min(), inside.max()) if len(inside) else (q1, q3)
+    distribution = GroupDistribution(
+        str(name),
+        len(values),
+        float(q1),
+        float(median),
+        float(q3),
+        float(whislo),
+        float(whishi),
+    )
+    if kind == "box":
+        distribution.fliers = subsample(values[(values < whislo) | (values > whishi)], MAX_POINTS_PER_GROUP)
+    elif kind == "violin":
+        distribution.grid, distribution.density = binned_kde(values)
+    elif kind == "boxen":
+        distribution.letter_values = lv = letter_values(values)
+        distribution.fliers = subsample(values[(values < lv[-1, 0]) | (values > lv[-1, 1])], MAX_POINTS_PER_GROUP)
+    elif kind == "strip":
+        distribution.sample = density_capped_subsample(values)
+    return distribution
+
+
+def _iter_groups(
+    df: pd.DataFrame,
+    x: str | None,
+    y: str | None,
+    order: ty.Sequence | None,
+) -> ty.Iterator[tuple[ty.Any, np.ndarray]]:
+    if x is None and y is None:
+        # wide-form data: each numeric column is a group
+        groups = dict(df.select_dtypes("number").items())
+    elif x is None or y is None:
+        raise ValueError(DISTRIBUTION_COLUMN_ERROR)
+    else:
+        groups = dict(iter(df.groupby(x, sort=False, observed=True)[y]))
+    for name in order if order is not None else groups:
+        if name in groups:
+            values = groups[name].to_numpy(dtype=float, na_value=np.nan)
+            values = values[np.isfinite(values)]
+            if len(values):
+                yield name, values
+
+
+def summarize_distributions(
+    df: pd.DataFrame,
+    kind: str,
+    x: str | None = None,
+    y: str | None = None,
+    order: ty.Sequence | None = None,
+) -> list[GroupDistribution]:
+    """Return summary of each group of the DataFrame, re-using results computed for identical data.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Wide-form data where each numeric column is a group or long-form data with `x` and `y` columns.
+    kind : str
+        Type of plot the summary is used for; one of `box`, `boxen`, `violin` or `strip`.
+    x : str, optional
+        Column with group names of long-form data.
+    y : str, optional
+        Column with values of long-form data.
+    order : Sequence, optional
+        Order of the groups; groups that are not listed are omitted.
+    """
+    if kind not in ("box", "boxen", "violin", "strip"):
+        raise ValueError(DISTRIBUTION_KIND_ERROR.format("box, boxen, violin, strip"))
+    key = (dataframe_fingerprint(df), kind, x, y, None if order is None else tuple(order))
+    if key in _SUMMARY_CACHE:
+        _SUMMARY_CACHE.move_to_end(key)
+        return _SUMMARY_CACHE[key]
+    summaries = [_summarize_group(name, values, kind) for name, values in _iter_groups(df, x, y, order)]
+    _SUMMARY_CACHE[key] = summaries
+    while len(_SUMMARY_CACHE) > DISTRIBUTION_CACHE_SIZE:
+        _SUMMARY_CACHE.popitem(last=False)
+    return summaries
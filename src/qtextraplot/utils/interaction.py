@@ -6,83 +6,121 @@ from dataclasses import dataclass
 from typing import Union
 
 import numpy as np
-
-# from imspy_core.reader import SingleReader
 from koyo.utilities import check_value_order
 from qtpy.QtCore import QObject, QPointF, Signal
 
 
 class Polygon(QObject):
-    """Class responsible for collecting points."""
+    """Class responsible for collecting points.
+
+    Points are stored in a preallocated (N, 2) array of (x, y) coordinates, with a set of points used for the
+    duplicate check and a cache of rasterized masks keyed by image shape.
+    """
 
     evt_n_changed = Signal(int)
 
     def __init__(self):
         super().__init__()
-        self.points = []
-        self._last_idx = -1
+        self._array = np.empty((16, 2), dtype=np.float64)
+        self._n_points = 0
+        self._point_set: set[tuple[float, float]] = set()
+        self._masks: dict[tuple[int, int], np.ndarray] = {}
+
+    @property
+    def points(self) -> list[list[float]]:
+        """Return points as list of [x, y] pairs."""
+        return self.array.tolist()
+
+    @property
+    def array(self) -> np.ndarray:
+        """Return view of the points as (N, 2) array of (x, y) coordinates."""
+        return self._array[: self._n_points]
 
     @property
     def n_points(self) -> int:
         """Return the number of points in the container."""
-        return len(self.points)
+        return self._n_points
+
+    def _on_changed(self) -> None:
+        """Invalidate cached masks and notify listeners."""
+        self._masks.clear()
+        self.evt_n_changed.emit(self._n_points)
 
     def reset(self):
         """Reset polygon."""
-        self.points.clear()
-        self._last_idx = -1
-        self.evt_n_changed.emit(0)
+        self._n_points = 0
+        self._point_set.clear()
+        self._on_changed()
 
     def add_point(self, x: float, y: float):
         """Add point to the polygon container."""
-        if [x, y] in self.points:
+        key = (float(x), float(y))
+        if key in self._point_set:
             return
-        self.points.append([x, y])
-        self._last_idx += 1
-        self.evt_n_changed.emit(self.n_points)
+        if self._n_points == len(self._array):
+            self._array = np.resize(self._array, (2 * len(self._array), 2))
+        self._array[self._n_points] = key
+        self._n_points += 1
+        self._point_set.add(key)
+        self._on_changed()
+
+    def _remove_index(self, index: int) -> None:
+        """Remove point at the specified index."""
+        x, y = self._array[index]
+        self._point_set.discard((float(x), float(y)))
+        self._array[index : self._n_points - 1] = self._array[index + 1 : self._n_points]
+        self._n_points -= 1
+        self._on_changed()
 
     def remove_point(self, x: float, y: float):
         """Remove point (x, y) from the list."""
-        remove_id = -1
-        for i, (_x, _y) in enumerate(self.points):
-            if _x == x and _y == y:
-                remove_id = i
-                break
-        if remove_id != -1:
-            del self.points[remove_id]
-            self.evt_n_changed.emit(self.n_points)
+        if (float(x), float(y)) not in self._point_set:
+            return
+        points = self.array
+        index = np.flatnonzero((points[:, 0] == x) & (points[:, 1] == y))
+        if index.size:
+            self._remove_index(int(index[0]))
 
     def remove_last(self):
         """Remove last point from polygon."""
-        if self._last_idx != -1:
-            del self.points[self._last_idx]
-            self._last_idx -= 1
-            self.evt_n_changed.emit(self.n_points)
+        if self._n_points:
+            self._remove_index(self._n_points - 1)
 
     def get_polygon(self, ax, dpi_ratio: float, height: float) -> list[QPointF]:
         """Render currently present points as polygon."""
-        points = []
-        for x, y in self.points:
-            (_x, _y) = ax.transData.transform([x, y])
-            _y = height - _y
-            points.append(QPointF(_x / dpi_ratio, _y / dpi_ratio))
-        return points
+        if not self._n_points:
+            return []
+        points = ax.transData.transform(self.array)
+        points[:, 1] = height - points[:, 1]
+        points /= dpi_ratio
+        return [QPointF(x, y) for x, y in points.tolist()]
 
     def get_polygon_mpl(self) -> np.ndarray:
         """Get polygon data."""
-        return np.asarray([[y, x] for (x, y) in self.points])
+        return self.array[:, ::-1].copy()
 
     def get_polygon_vispy(self) -> np.ndarray:
         """Get polygon data."""
-        return np.asarray([[x, y] for (x, y) in self.points])
+        return self.array.copy()
 
     def get_zoom_rect(self) -> tuple:
         """Get zoom-in rectangle."""
-        points = self.get_polygon_mpl()
-        y_min, y_max = points[:, 0].min(), points[:, 0].max()
-        x_min, x_max = points[:, 1].min(), points[:, 1].max()
+        points = self.array
+        x_min, y_min = points.min(axis=0)
+        x_max, y_max = points.max(axis=0)
         return x_min, x_max, y_min, y_max
 
+    def get_mask(self, shape: tuple[int, ...]) -> np.ndarray:
+        """Get boolean mask of the polygon for an image of the specified shape.
+
+        The mask is cached per image shape until the points change, so it should not be modified in-place.
+        """
+        key = (int(shape[0]), int(shape[1]))
+        mask = self._masks.get(key)
+        if mask is None:
+            mask = self._masks[key] = polygon_mask(self.get_polygon_mpl(), key)
+        return mask
+
 
 @dataclass
 class ExtractEvent:
@@ -99,6 +137,7 @@ class ExtractEvent:
 
     # cacheable properties
     _mask: np.ndarray = None
+    _mask_key: tuple = None
     _framelist: np.ndarray = None
 
     @property
@@ -198,70 +237,64 @@ class ExtractEvent:
             xmin, xmax, ymin, ymax = self.unpack(as_int)
         return xmin - pad, xmax + pad, ymin - pad, ymax + pad
 
-    # def get_framelist(self, m_obj: SingleReader, flipud: bool = False) -> np.ndarray:
-    #     """Get list of frames based on the extraction parameters.
-    #
-    #     Parameters
-    #     ----------
-    #     m_obj : SingleReader
-    #         SingleReader object
-    #     flipud : bool
-    #         if ``True``, the original mask will be flipped
-    #
-    #     Returns
-    #     -------
-    #     framelist : np.ndarray
-    #         array of sorted frames that should be consumed by some extraction function
-    #     """
-    #     if self.is_point():
-    #         self.round_point()
-    #     if self._framelist is not None:
-    #         return self._framelist
-    #     if self.roi_shape == "rect":
-    #         framelist = m_obj.get_framelist_from_rect(*self.unpack(True), flipud=flipud)
-    #     elif self.roi_shape == "circle":
-    #         center, r_radius, c_radius = self.get_ellipse()
-    #         framelist = m_obj.get_framelist_from_circle(center, r_radius, c_radius, flipud=flipud)
-    #     elif self.roi_shape == "poly":
-    #         assert self.polygon is not None, "Missing polygon data"
-    #         polygons = self.polygon.get_polygon_mpl()
-    #         framelist = m_obj.get_framelist_from_poly(polygons, flipud=flipud)
-    #     else:
-    #         raise ValueError("Cannot parse this type of ROI yet")
-    #
-    #     self._framelist = np.sort(framelist)  # cache in cased its needed again
-    #     return self._framelist
-    #
-    # def get_mask(self, m_obj: SingleReader, flipud: bool = False) -> np.ndarray:
-    #     """Get mask of the same shape as the default image.
-    #
-    #     Parameters
-    #     ----------
-    #     m_obj : SingleReader
-    #         SingleReader object
-    #     flipud : bool
-    #         if ``True``, the original mask will be flipped
-    #
-    #     Returns
-    #     -------
-    #     mask : np.ndarray
-    #         2d image mask for this particular event / roi
-    #     """
-    #     if self._mask is not None:
-    #         return self._mask
-    #     if self.roi_shape == "rect":
-    #         mask = m_obj.get_mask_from_rect(*self.unpack(True), flipud=flipud)
-    #     elif self.roi_shape == "circle":
-    #         center, r_radius, c_radius = self.get_ellipse()
-    #         mask = m_obj.get_mask_from_circle(center, r_radius, c_radius, flipud=flipud)
-    #     elif self.roi_shape == "poly":
-    #         assert self.polygon is not None, "Missing polygon data"
-    #         polygons = self.polygon.get_polygon_mpl()
-    #         mask = m_obj.get_mask_from_poly(polygons, flipud=flipud)
-    #     else:
-    #         raise ValueError("Cannot parse this type of ROI yet")
-    #     self._mask = mask
-    #     return mask
+    def get_mask(self, shape: tuple[int, ...], flipud: bool = False) -> np.ndarray:
+        """Get mask of the same shape as the image.
+
+        The mask is cached on the event, so repeated extraction from images of the same shape does not need to
+        rasterize the region of interest again.
+
+        Parameters
+        ----------
+        shape : tuple[int, ...]
+            shape of the image; only the first two dimensions are used
+        flipud : bool
+            if ``True``, the mask will be flipped
+
+        Returns
+        -------
+        mask : np.ndarray
+            2d boolean image mask for this particular event / roi
+        """
+        key = (int(shape[0]), int(shape[1]), flipud)
+        if self._mask is not None and self._mask_key == key:
+            return self._mask
+        if self.roi_shape == "rect":
+            xmin, xmax, ymin, ymax = self.unpack(True)
+            mask = np.zeros(key[:2], dtype=bool)
+            mask[max(ymin, 0) : max(ymax, 0), max(xmin, 0) : max(xmax, 0)] = True
+        elif self.roi_shape == "circle":
+            (r, c), r_radius, c_radius = self.get_ellipse()
+            rows, cols = np.ogrid[: key[0], : key[1]]
+            mask = ((rows - r) / r_radius) ** 2 + ((cols - c) / c_radius) ** 2 <= 1
+        elif self.roi_shape == "poly":
+            assert self.polygon is not None, "Missing polygon data"
+            mask = self.polygon.get_mask(key[:2])
+        else:
+            raise ValueError("Cannot parse this type of ROI yet")  # noqa: TRY003
+        if flipud:
+            mask = np.flipud(mask)
+        self._mask, self._mask_key, self._framelist = mask, key, None
+        return mask
+
+    def get_framelist(self, shape: tuple[int, ...], flipud: bool = False) -> np.ndarray:
+        """Get sorted list of flat pixel indices that are within the region of interest.
+
+        Parameters
+        ----------
+        shape : tuple[int, ...]
+            shape of the image; only the first two dimensions are used
+        flipud : bool
+            if ``True``, the mask will be flipped
+
+        Returns
+        -------
+        framelist : np.ndarray
+            array of sorted indices that should be consumed by some extraction function
+        """
+        mask = self.get_mask(shape, flipud)
+        if self._framelist is None:
+            self._framelist = np.flatnonzero(mask)
+        return self._framelist
 
     def get_line_mask(self, as_int: bool = True):
         """Get 1d mask that can be used to extract part of the data."""
@@ -274,3 +307,57 @@ def get_center(x1: float, x2: float) -> float:
     mod = abs(x1 - x2) / 2
     x1, x2 = check_value_order(x1, x2)
     return x1 + mod
+
+
+def polygon_mask(vertices: np.ndarray, shape: tuple[int, int]) -> np.ndarray:
+    """Rasterize polygon into a boolean mask.
+
+    Pixels are included when their center lies within the polygon using the even-odd rule. Each image row is
+    filled between pairs of sorted edge crossings, so the cost scales with the number of rows and edges rather
+    than with the number of pixels times the number of edges.
+
+    Parameters
+    ----------
+    vertices : np.ndarray
+        (N, 2) array of (row, column) vertices
+    shape : tuple[int, int]
+        shape of the output mask
+    """
+    n_rows, n_cols = shape
+    mask = np.zeros((n_rows, n_cols), dtype=bool)
+    vertices = np.asarray(vertices, dtype=np.float64)
+    if len(vertices) < 3 or n_rows == 0 or n_cols == 0:
+        return mask
+
+    r0, c0 = vertices[:, 0], vertices[:, 1]
+    r1, c1 = np.roll(r0, -1), np.roll(c0, -1)
+    row_min = max(int(np.ceil(r0.min())), 0)
+    row_max = min(int(np.floor(r0.max())), n_rows - 1)
+    col_min = max(int(np.ceil(c0.min())), 0)
+    col_max = min(int(np.floor(c0.max())), n_cols - 1)
+    if row_max < row_min or col_max < col_min:
+        return mask
+
+    # find where each row crosses each edge; horizontal edges never cross
+    rows = np.arange(row_min, row_max + 1, dtype=np.float64)[:, None]
+    crosses = (rows >= np.minimum(r0, r1)) & (rows < np.maximum(r0, r1))
+    slope = np.divide(c1 - c0, r1 - r0, out=np.zeros_like(c0), where=r1 != r0)
+    crossings = np.where(crosses, c0 + (rows - r0) * slope, np.inf)
+    crossings.sort(axis=1)
+    n_pairs = int(crosses.sum(axis=1).max()) // 2
+    if n_pairs == 0:
+        return mask
+
+    # fill columns between each pair of crossings using a difference array limited to the bounding box; the
+    # intervals in each row are disjoint so the running sum is always 0 or 1
+    n_box_cols = col_max - col_min + 1
+    starts, ends = crossings[:, 0 : 2 * n_pairs : 2], crossings[:, 1 : 2 * n_pairs : 2]
+    valid = np.isfinite(ends)
+    row_index = np.broadcast_to(np.arange(len(rows))[:, None], starts.shape)[valid]
+    start_index = np.clip(np.ceil(starts[valid]) - col_min, 0, n_box_cols).astype(np.int64)
+    end_index = np.clip(np.ceil(ends[valid]) - col_min, 0, n_box_cols).astype(np.int64)
+    diff = np.zeros((len(rows), n_box_cols + 1), dtype=np.int8)
+    np.add.at(diff, (row_index, start_index), 1)
+    np.add.at(diff, (row_index, end_index), -1)
+    mask[row_min : row_max + 1, col_min : col_max + 1] = np.cumsum(diff[:, :-1], axis=1, dtype=np.int8) > 0
+    return mask
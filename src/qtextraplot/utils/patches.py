@@ -0,0 +1,123 @@
+"""Backend-independent storage of rectangular patch groups."""
+
+from __future__ import annotations
+
+import typing as ty
+
+import numpy as np
+
+RECTANGLE_COUNT_ERROR = "Patch `x`, `y`, `width` and `height` must be scalars or arrays of the same length."
+COLOR_COUNT_ERROR = "Expected one color or {} colors, received {}."
+INDEX_COUNT_ERROR = "Number of values must be one or match the number of indices."
+
+# rectangle columns
+RECT_X, RECT_Y, RECT_WIDTH, RECT_HEIGHT = range(4)
+
+
+def coerce_rectangles(x: ty.Any, y: ty.Any, width: ty.Any, height: ty.Any) -> np.ndarray:
+    """Return rectangles as a (N, 4) array of (x, y, width, height), broadcasting scalar values."""
+    columns = [np.atleast_1d(np.asarray(value, dtype=float)) for value in (x, y, width, height)]
+    if any(column.ndim != 1 for column in columns):
+        raise ValueError(RECTANGLE_COUNT_ERROR)
+    try:
+        columns = np.broadcast_arrays(*columns)
+    except ValueError:
+        raise ValueError(RECTANGLE_COUNT_ERROR) from None
+    return np.stack(columns, axis=1)
+
+
+def coerce_rgba(colors: np.ndarray, n: int) -> np.ndarray:
+    """Broadcast (1, 4) or (N, 4) RGBA colors to (N, 4)."""
+    colors = np.atleast_2d(np.asarray(colors, dtype=float))
+    if len(colors) == 1:
+        return np.repeat(colors, n, axis=0)
+    if len(colors) != n:
+        raise ValueError(COLOR_COUNT_ERROR.format(n, len(colors)))
+    return colors.copy()
+
+
+def coerce_indices(indices: ty.Any, n: int) -> np.ndarray:
+    """Return indices as an array of non-negative positions, where `None` selects every item."""
+    if indices is None:
+        return np.arange(n)
+    indices = np.atleast_1d(np.asarray(indices))
+    if indices.dtype == bool:
+        return np.flatnonzero(indices)
+    indices = indices.astype(np.intp)
+    return np.where(indices < 0, indices + n, indices)
+
+
+def _broadcast_values(values: ty.Any, n: int) -> np.ndarray:
+    values = np.atleast_1d(np.asarray(values))
+    if len(values) not in (1, n):
+        raise ValueError(INDEX_COUNT_ERROR)
+    return values
+
+
+def rectangle_vertices(rectangles: np.ndarray) -> np.ndarray:
+    """Return (N, 4, 2) array with the corners of each rectangle, in counter-clockwise order."""
+    x, y, width, height = rectangles.T
+    vertices = np.empty((len(rectangles), 4, 2))
+    vertices[:, [0, 3], 0] = x[:, None]
+    vertices[:, [1, 2], 0] = (x + width)[:, None]
+    vertices[:, [0, 1], 1] = y[:, None]
+    vertices[:, [2, 3], 1] = (y + height)[:, None]
+    return vertices
+
+
+class PatchGroup:
+    """Rectangles that are drawn by a single artist, stored as arrays.
+
+    Geometry, colors and visibility can be updated for any subset of rectangles without creating new objects, which
+    allows backends to render hundreds of highlighted regions with one artist.
+    """
+
+    __slots__ = ("colors", "gid", "item", "rectangles", "visible")
+
+    def __init__(self, gid: str, rectangles: np.ndarray, colors: np.ndarray, item: ty.Any = None):
+        self.gid = gid
+        self.rectangles = rectangles
+        self.colors = coerce_rgba(colors, len(rectangles))
+        self.visible = np.ones(len(rectangles), dtype=bool)
+        # backend specific artist that renders the group
+        self.item = item
+
+    def __len__(self) -> int:
+        return len(self.rectangles)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}<gid={self.gid!r}, n={len(self)}>"
+
+    @property
+    def display_colors(self) -> np.ndarray:
+        """Return colors with hidden rectangles made fully transparent."""
+        colors = self.colors.copy()
+        colors[~self.visible, 3] = 0
+        return colors
+
+    def update(
+        self,
+        indices: ty.Any = None,
+        x: ty.Any = None,
+        y: ty.Any = None,
+        width: ty.Any = None,
+        height: ty.Any = None,
+        colors: np.ndarray | None = None,
+        visible: ty.Any = None,
+        alpha: float | None = None,
+    ) -> np.ndarray:
+        """Update rectangles at `indices` in-place and return the updated indices.
+
+        New `colors` keep the current transparency of the rectangles unless `alpha` is specified.
+        """
+        indices = coerce_indices(indices, len(self))
+        for column, values in ((RECT_X, x), (RECT_Y, y), (RECT_WIDTH, width), (RECT_HEIGHT, height)):
+            if values is not None:
+                self.rectangles[indices, column] = _broadcast_values(values, len(indices)).astype(float)
+        if colors is not None or alpha is not None:
+            rgba = self.colors[indices] if colors is None else coerce_rgba(colors, len(indices))
+            rgba[:, 3] = self.colors[indices, 3] if alpha is None else alpha
+            self.colors[indices] = rgba
+        if visible is not None:
+            self.visible[indices] = _broadcast_values(visible, len(indices)).astype(bool)
+        return indices
@@ -1,3 +1,8 @@
+from __future__ import annotations
+
+import typing as ty
+
+
 def running_under_pytest() -> bool:
     """Return True if currently running under pytest.
 
@@ -7,3 +12,33 @@ def running_under_pytest() -> bool:
     import os
 
     return bool(os.environ.get("QTEXTRAPLOT_PYTEST"))
+
+
+def lazy_module_attributes(
+    module_name: str,
+    attributes: dict[str, str],
+) -> tuple[ty.Callable[[str], ty.Any], ty.Callable[[], list[str]]]:
+    """Return PEP 562 ``__getattr__`` and ``__dir__`` functions that import attributes on first access.
+
+    Parameters
+    ----------
+    module_name : str
+        name of the module that exposes the attributes, used in error messages and to cache resolved values
+    attributes : dict[str, str]
+        mapping of public attribute name to the module that defines it
+    """
+    import importlib
+    import sys
+
+    def __getattr__(name: str) -> ty.Any:
+        if name not in attributes:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")  # noqa: TRY003
+        value = getattr(importlib.import_module(attributes[name]), name)
+        # cache on the module so subsequent lookups bypass __getattr__
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[module_name])) | set(attributes))
+
+    return __getattr__, __dir__
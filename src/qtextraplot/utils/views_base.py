@@ -5,6 +5,7 @@ from __future__ import annotations
 import time
 import typing as ty
 
+from koyo.secret import get_short_hash
 from koyo.timer import report_time
 from loguru import logger
 from qtextra.helpers import get_save_filename
@@ -243,7 +244,7 @@ class ViewBase:
                     patch.set_width(width)
                 if height is not None:
                     patch.set_height(height)
-                self.figure.repaint(repaint)
+                self._repaint_patch(patch, repaint)
 
     def move_patch(
         self,
@@ -263,7 +264,7 @@ class ViewBase:
                     patch.set_width(width)
                 if height is not None:
                     patch.set_height(height)
-                self.figure.repaint(repaint)
+                self._repaint_patch(patch, repaint)
 
     def show_patch(
         self,
@@ -284,18 +285,101 @@ class ViewBase:
         return patch
 
     def add_patches(self, x, y, width, height, obj_name=None, color=None, pickable: bool = True, repaint: bool = True):
-        """Add rectangular patches to the plot."""
+        """Add rectangular patches to the plot.
+
+        When patches are not named and the backend supports it, they are added as a single group of patches (see
+        `add_patch_group`) and the identifier of the group is returned.
+        """
         if not (len(x) == len(y) == len(width)):
             raise ValueError(  # noqa: TRY003
                 "Incorrect shape of the data. `x`, `y` and `width` must have the same length.",
             )
+        if color is None:
+            color = "r"
+        if obj_name is None and hasattr(self.figure, "plot_add_patches"):
+            gid = f"patches_{get_short_hash()}"
+            self.add_patch_group(x, y, width, height, color=color, gid=gid, pickable=pickable, repaint=repaint)
+            return gid
         if obj_name is None:
             obj_name = [None] * len(x)
-        if color is None:
-            color = ["r"] * len(x)
+        if isinstance(color, str):
+            color = [color] * len(x)
         for _x, _y, _width, _height, _obj_name, _color in zip(x, y, width, height, obj_name, color):
             self.figure.plot_add_patch(_x, _y, _width, _height, obj_name=_obj_name, color=_color, pickable=pickable)
         self.figure.repaint(repaint)
+        return None
+
+    def add_patch_group(
+        self,
+        x: ty.Any,
+        y: ty.Any,
+        width: ty.Any,
+        height: ty.Any = None,
+        color: ty.Any = "r",
+        gid: str = "patches",
+        repaint: bool = True,
+        **kwargs: ty.Any,
+    ):
+        """Add many rectangular patches that are rendered by a single artist and can be updated by index.
+
+        Parameters
+        ----------
+        x, y, width, height : array-like
+            Position and size of each patch. Scalars are broadcast to all patches.
+        color : color or list of colors
+            Single color or one color per patch.
+        gid : str
+            Identifier of the group, which replaces any existing group with the same identifier.
+        repaint : bool
+            flag to repaint (or not) the plot
+        **kwargs
+            styling, e.g. `alpha` (transparency of all patches, 0.5 by default) or `pickable`; styling that a
+            backend does not support is ignored
+        """
+        with QMutexLocker(MUTEX):
+            group = self.figure.plot_add_patches(x, y, width, height, color=color, gid=gid, **kwargs)
+            self.figure.repaint(repaint)
+        return group
+
+    def update_patch_group(
+        self,
+        indices: ty.Any = None,
+        x: ty.Any = None,
+        y: ty.Any = None,
+        width: ty.Any = None,
+        height: ty.Any = None,
+        color: ty.Any = None,
+        visible: ty.Any = None,
+        gid: str = "patches",
+        repaint: bool = True,
+        alpha: float | None = None,
+    ):
+        """Update position, size, color and/or visibility of patches at `indices` (or all patches) of a group.
+
+        New colors keep the transparency of the patches unless `alpha` is specified.
+        """
+        with QMutexLocker(MUTEX):
+            group = self.figure.plot_update_patches(
+                gid,
+                indices,
+                x=x,
+                y=y,
+                width=width,
+                height=height,
+                color=color,
+                visible=visible,
+                alpha=alpha,
+            )
+            self.figure.repaint(repaint)
+        return group
+
+    def _repaint_patch(self, patch: ty.Any, repaint: bool = True) -> None:
+        """Repaint the plot after patch was changed, only blitting the patch when the backend supports it."""
+        animated = hasattr(patch, "get_animated") and patch.get_animated()
+        if repaint and animated and hasattr(self.figure, "update_animated"):
+            self.figure.update_animated()
+        else:
+            self.figure.repaint(repaint)
 
     def remove_patches(self, start_with: str | None = None, repaint: bool = True):
         """Remove rectangular patches from the plot.
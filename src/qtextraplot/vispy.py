@@ -1,6 +1,26 @@
-"""Public exports for VisPy-backed views."""
+"""Public exports for VisPy-backed views.
 
-from qtextraplot._vispy.base import PlotLine, PlotScatter
-from qtextraplot._vispy.views import ViewVispyLine, ViewVispyScatter
+Attributes are imported on first access so that importing this module does not pull in VisPy.
+"""
+
+from __future__ import annotations
+
+import typing as ty
+
+from qtextraplot.utils.utilities import lazy_module_attributes
+
+if ty.TYPE_CHECKING:
+    from qtextraplot._vispy.base import PlotLine, PlotScatter
+    from qtextraplot._vispy.views import ViewVispyLine, ViewVispyScatter
 
 __all__ = ["PlotLine", "PlotScatter", "ViewVispyLine", "ViewVispyScatter"]
+
+__getattr__, __dir__ = lazy_module_attributes(
+    __name__,
+    {
+        "PlotLine": "qtextraplot._vispy.base",
+        "PlotScatter": "qtextraplot._vispy.base",
+        "ViewVispyLine": "qtextraplot._vispy.views",
+        "ViewVispyScatter": "qtextraplot._vispy.views",
+    },
+)
@@ -7,7 +7,7 @@ import typing as ty
 import numpy as np
 import qtextra.helpers as hp
 from qtpy.QtCore import Qt, QTimer, Signal
-from qtpy.QtGui import QColor, QIcon, QImage, QMouseEvent, QPixmap
+from qtpy.QtGui import QColor, QIcon, QMouseEvent, QPixmap
 from qtpy.QtWidgets import QPushButton, QVBoxLayout, QWidget
 
 
@@ -81,20 +81,9 @@ class QtColormapButton(QPushButton):
 
     def _update_icon(self) -> None:
         """Update the button icon from the colormap colorbar."""
-        colormap = _available_colormaps()[self._colormap]
-        colorbar = colormap.colorbar
-        image = QImage(
-            colorbar,
-            colorbar.shape[1],
-            colorbar.shape[0],
-            QImage.Format.Format_RGBA8888,
-        )
-        pixmap = QPixmap.fromImage(image).scaled(
-            22,
-            14,
-            Qt.AspectRatioMode.IgnoreAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
-        )
+        from qtextraplot.utils.colormap import colormap_thumbnail
+
+        pixmap = QPixmap.fromImage(colormap_thumbnail(self._colormap, 22, 14))
         self.setIcon(QIcon(pixmap))
         self.setIconSize(pixmap.size())
 
@@ -1,8 +1,17 @@
 """Test interaction"""
 
+from types import SimpleNamespace
+
 import numpy as np
+import pytest
 
-from qtextraplot._mpl.interaction import ExtractEvent, Polygon
+from qtextraplot._mpl.interaction import (
+    ExtractEvent,
+    Polygon,
+    get_aspect_ratio,
+    get_min_height_for_aspect_ratio,
+    get_min_width_for_aspect_ratio,
+)
 
 
 class TestPolygon:
@@ -77,3 +86,44 @@ class TestExtractEvent:
 
         label = event.get_x_with_width_label(1)
         assert isinstance(label, str)
+
+
+@pytest.mark.parametrize("aspect_ratio", [0.5, 1.0, 3 / 7, 768 / 1024, 2.0])
+def test_aspect_ratio_limits_match_incremental_search(aspect_ratio):
+    for height in range(1, 60):
+        for width in range(1, 60):
+            if get_aspect_ratio([height, width]) > aspect_ratio:
+                expected = width
+                while get_aspect_ratio([height, expected]) > aspect_ratio:
+                    expected += 1
+                assert get_min_width_for_aspect_ratio(height, aspect_ratio) == expected
+            elif get_aspect_ratio([height, width]) < aspect_ratio:
+                expected = height
+                while get_aspect_ratio([expected, width]) < aspect_ratio:
+                    expected += 1
+                assert get_min_height_for_aspect_ratio(width, aspect_ratio) == expected
+
+
+def test_aspect_ratio_limits_large_image():
+    assert get_min_width_for_aspect_ratio(10, 1 / 10_000) == 100_000
+    assert get_min_height_for_aspect_ratio(10, 10_000) == 100_000
+
+
+def test_image_motion_msg_samples_value_under_cursor(qtbot):
+    from qtextraplot._mpl.plot_base import PlotBase, get_extent
+
+    widget = PlotBase(None)
+    qtbot.addWidget(widget)
+    image = np.arange(12).reshape(3, 4)
+    widget.ax.imshow(image)
+    widget.setup_new_zoom([widget.ax], data_limits=[get_extent(widget.ax)], arrays=[image])
+
+    zoom = widget.zoom
+    assert zoom.get_motion_msg(SimpleNamespace(xdata=2.2, ydata=1.7)) == "x=2 y=1 6"
+    assert zoom._sample_key == (2, 1)
+    # values outside of the image should not wrap around
+    assert zoom.get_motion_msg(SimpleNamespace(xdata=-1.0, ydata=0.0)) == "x=-1 y=0 "
+
+    image2 = image * 10
+    zoom.update_handler(data_limits=[get_extent(widget.ax)], arrays=[image2])
+    assert zoom.get_motion_msg(SimpleNamespace(xdata=2.2, ydata=1.7)) == "x=2 y=1 60"
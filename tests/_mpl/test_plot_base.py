@@ -8,7 +8,9 @@ import pytest
 pytest.importorskip("matplotlib", reason="matplotlib is not installed")
 
 
-from qtextraplot._mpl.plot_base import PlotBase
+from qtextraplot._mpl.cell_text import find_text_colors, format_cell_text
+from qtextraplot._mpl.plot_base import PlotBase, UnderCurveCollection, make_under_curve_vertices
+from qtextraplot.utils.classification import ScoreHistogram
 
 
 class _ConcretePlot(PlotBase):
@@ -156,6 +158,27 @@ class TestPlotBasePatches:
         assert plot_widget.patch == []
 
 
+class TestPlotBasePatchGroups:
+    def test_patch_group_uses_single_collection(self, plot_widget):
+        _ = plot_widget.ax
+        n_collections = len(plot_widget.ax.collections)
+        group = plot_widget.plot_add_patches(np.arange(100), 0, 0.5, 1, color="r", alpha=0.5, gid="peaks")
+        assert len(plot_widget.ax.collections) == n_collections + 1
+        assert len(group.item.get_paths()) == 100
+        np.testing.assert_allclose(group.item.get_facecolor()[0], [1, 0, 0, 0.5])
+
+        plot_widget.plot_update_patches("peaks", [1, 2], color="b", visible=[True, False], x=[50, 60])
+        facecolors = group.item.get_facecolor()
+        np.testing.assert_allclose(facecolors[1], [0, 0, 1, 0.5])
+        assert facecolors[2, 3] == 0
+        np.testing.assert_array_equal(group.item.get_paths()[1].vertices[0], [50, 0])
+
+        assert plot_widget.get_patch_group("peaks") is group
+        plot_widget.plot_remove_patches(start_with="pe", repaint=False)
+        assert plot_widget.patch_groups == {}
+        assert group.item not in plot_widget.ax.collections
+
+
 class TestPlotBaseRepaint:
     def test_repaint_no_error(self, plot_widget):
         _ = plot_widget.ax
@@ -171,6 +194,332 @@ class TestPlotBaseRepaint:
         plot_widget.canvas.draw = original
         assert called == []
 
+    def test_repaints_are_coalesced(self, qtbot, plot_widget):
+        _ = plot_widget.ax
+        plot_widget.flush_repaint()
+        draws = []
+        plot_widget.canvas.mpl_connect("draw_event", draws.append)
+
+        for _ in range(10):
+            plot_widget.ax.plot([0, 1], [0, 1])
+            plot_widget.repaint()
+        assert draws == []
+        assert plot_widget._repaint
+
+        qtbot.waitUntil(lambda: len(draws) == 1)
+        qtbot.wait(10)
+        assert len(draws) == 1
+        assert not plot_widget._repaint
+
+    def test_delayed_repaint_defers_until_exit(self, qtbot, plot_widget):
+        _ = plot_widget.ax
+        plot_widget.flush_repaint()
+        draws = []
+        plot_widget.canvas.mpl_connect("draw_event", draws.append)
+
+        with plot_widget.delayed_repaint():
+            plot_widget.repaint()
+            plot_widget.flush_repaint()
+        assert len(draws) == 1
+
+    def test_tight_layout_is_cached(self, plot_widget):
+        plot_widget.ax.set_xlabel("x")
+        calls = []
+        original = plot_widget.figure.tight_layout
+
+        def _tight_layout(*args, **kwargs):
+            calls.append(1)
+            original(*args, **kwargs)
+
+        plot_widget.figure.tight_layout = _tight_layout
+        plot_widget.tight()
+        left = plot_widget.figure.subplotpars.left
+        plot_widget.tight()
+        assert len(calls) == 1
+        assert plot_widget.figure.subplotpars.left == left
+
+        plot_widget.ax.set_ylabel("a much longer label\nspanning two lines")
+        plot_widget.tight()
+        assert len(calls) == 2
+
+        plot_widget.figure.set_size_inches(4, 4)
+        plot_widget.tight()
+        assert len(calls) == 3
+
+
+class TestPlotBaseUnderCurve:
+    def test_make_under_curve_vertices(self):
+        vertices = make_under_curve_vertices([0, 1, 2], [1, np.nan, 3], baseline=-1)
+        np.testing.assert_array_equal(vertices, [[0, -1], [0, 1], [1, -1], [2, 3], [2, -1]])
+        assert make_under_curve_vertices([], []).shape == (0, 2)
+
+    def test_under_curve_is_updated_in_place(self, plot_widget):
+        x = np.linspace(0, 10, 100)
+        plot_widget.plot_1d(x, np.sin(x) + 1, spectrum_line_fill_under=True, spectrum_fill_color="r")
+        (fill,) = plot_widget.ax.collections
+        assert isinstance(fill, UnderCurveCollection)
+        vertices = fill.get_paths()[0].vertices
+
+        plot_widget.plot_1d_update_data(x, np.cos(x) + 1)
+        assert plot_widget.ax.collections[0] is fill
+        assert fill.get_paths()[0].vertices is vertices
+        np.testing.assert_allclose(vertices[1:-2, 1], np.cos(x) + 1)
+        np.testing.assert_array_equal(vertices[-1], vertices[0])
+        np.testing.assert_allclose(fill.get_facecolor()[0, :3], [1, 0, 0])
+
+        x = np.linspace(0, 5, 10)
+        plot_widget.plot_1d_update_data(x, x, spectrum_fill_color="b")
+        path = fill.get_paths()[0]
+        assert len(path.vertices) == 13
+        np.testing.assert_array_equal(path.vertices[[0, -2]], [[0, 0], [5, 0]])
+        np.testing.assert_allclose(fill.get_facecolor()[0, :3], [0, 0, 1])
+
+
+class TestPlotBaseAnimated:
+    def test_animated_vline_is_blitted(self, plot_widget):
+        plot_widget.ax.plot([0, 10], [0, 1])
+        line = plot_widget.plot_add_vline(xpos=2.0, gid="marker", animated=True)
+        assert line.get_animated()
+        plot_widget.flush_repaint()
+        assert plot_widget._animated_background is not None
+
+        draws, blits = [], []
+        plot_widget.canvas.mpl_connect("draw_event", draws.append)
+        original = plot_widget.canvas.blit
+        plot_widget.canvas.blit = lambda bbox=None: (blits.append(bbox), original(bbox))
+        plot_widget.plot_add_vline(xpos=5.0, gid="marker")
+        assert len(blits) == 1
+        assert draws == []
+        assert not plot_widget._repaint
+        np.testing.assert_array_equal(line.get_xdata(), [5.0, 5.0])
+
+    def test_limit_change_invalidates_background(self, qtbot, plot_widget):
+        plot_widget.ax.plot([0, 10], [0, 1])
+        plot_widget.plot_add_patch(1, 0, 2, 1, obj_name="roi", animated=True)
+        plot_widget.flush_repaint()
+        assert plot_widget._animated_background is not None
+
+        plot_widget.ax.set_xlim(0, 5)
+        assert plot_widget._animated_background is None
+        plot_widget.update_animated()
+        assert plot_widget._repaint
+        qtbot.waitUntil(lambda: plot_widget._animated_background is not None)
+
+    def test_removed_artists_are_dropped(self, plot_widget):
+        plot_widget.ax.plot([0, 10], [0, 1])
+        plot_widget.plot_add_vline(xpos=2.0, gid="marker", animated=True)
+        plot_widget.flush_repaint()
+        plot_widget.plot_remove_line("marker")
+        plot_widget.update_animated()
+        assert plot_widget._animated_artists == []
+
+    def test_savefig_includes_animated_artists(self, plot_widget, tmp_path):
+        plot_widget.ax.plot([0, 10], [0, 1])
+        line = plot_widget.plot_add_vline(xpos=2.0, gid="marker", animated=True)
+        drawn = []
+        original = line.draw
+        line.draw = lambda renderer: (drawn.append(line.get_animated()), original(renderer))
+        plot_widget.savefig(tmp_path / "figure.png", tight=False)
+        assert False in drawn
+        assert line.get_animated()
+        assert plot_widget._animated_artists == [line]
+
+
+class TestPlotBaseCellText:
+    def test_find_text_colors(self):
+        colors = find_text_colors(np.array([[1.0, 1.0, 1.0, 1.0], [0.0, 0.0, 0.0, 1.0]]))
+        np.testing.assert_array_equal(colors, [[0, 0, 0, 1], [1, 1, 1, 1]])
+
+    def test_format_cell_text(self):
+        text = format_cell_text(np.array([[1, 20], [3, 4]]), "d")
+        assert text.shape == (2, 2)
+        assert text[0, 1] == "20"
+        assert format_cell_text(np.array([[0.5]]), ".1%")[0, 0] == "50.0%"
+
+    def test_report_uses_single_cached_artist(self, plot_widget):
+        labels = ["a", "b", "c"]
+        scores = {metric: dict(zip(labels, [0.1, 0.5, 0.9])) for metric in ("precision", "recall", "f1-score")}
+        plot_widget.plot_precision_recall_fscore_support(scores, labels)
+        assert len(plot_widget.ax.texts) == 0
+        (artist,) = plot_widget.get_cell_text()
+        assert artist.shape == (3, 3)
+        assert artist.get_text()[2, 0] == "0.900"
+
+        plot_widget.canvas.draw()
+        image = artist._cache[2]
+        assert image[..., 3].max() > 0
+        plot_widget.canvas.draw()
+        assert artist._cache[2] is image
+
+        artist.set_data(artist.get_text())
+        plot_widget.canvas.draw()
+        assert artist._cache[2] is not image
+
+    def test_raster_and_vector_text_match(self, plot_widget):
+        artist = plot_widget.plot_add_cell_text(np.array([["1", "2"], ["3", "4"]], dtype=object), "k")
+        plot_widget.ax.set(xlim=(0, 2), ylim=(0, 2))
+        plot_widget.canvas.draw()
+        raster = np.asarray(plot_widget.canvas.buffer_rgba()).copy()
+        artist.set_vector(True)
+        plot_widget.canvas.draw()
+        np.testing.assert_array_equal(raster, np.asarray(plot_widget.canvas.buffer_rgba()))
+
+    def test_small_cells_are_not_annotated(self, plot_widget):
+        artist = plot_widget.plot_add_cell_text(format_cell_text(np.zeros((500, 2)), ".1f"))
+        plot_widget.ax.set(xlim=(0, 2), ylim=(0, 500))
+        plot_widget.canvas.draw()
+        assert artist._cache[2][..., 3].max() == 0
+
+    def test_vector_export(self, plot_widget, tmp_path):
+        artist = plot_widget.plot_add_cell_text(np.array([["1", "2"]], dtype=object))
+        drawn = []
+        original = artist._draw_cells
+        artist._draw_cells = lambda *args: (drawn.append(artist.vector), original(*args))
+        plot_widget.savefig(tmp_path / "figure.svg", tight=False, image_fmt="svg")
+        assert drawn == [True]
+        assert not artist.vector
+
+
+class TestPlotBaseClassification:
+    def test_confusion_matrix_uses_image(self, plot_widget):
+        plot_widget.plot_confusion_matrix(np.array([[5, 1], [2, 8]]), labels=["a", "b"], which="both")
+        (image,) = plot_widget.ax.images
+        np.testing.assert_array_equal(image.get_array(), [[5, 1], [2, 8]])
+        (artist,) = plot_widget.get_cell_text()
+        assert artist.get_text()[1, 1] == "8\n50.00%"
+        assert plot_widget.ax.get_ylim() == (2, 0)
+
+    def test_confusion_matrix_accepts_heatmap_arguments(self, plot_widget):
+        plot_widget.plot_confusion_matrix(
+            np.array([[5, 1], [2, 8]]),
+            labels=["a", "b"],
+            cbar=False,
+            linewidths=0.5,
+            linecolor="k",
+            center=5,
+            mask=np.eye(2, dtype=bool),
+            fmt="d",
+            annot=True,
+        )
+        (image,) = plot_widget.ax.images
+        assert image.get_clim() == (1, 9)
+        assert image.get_array().mask.tolist() == [[True, False], [False, True]]
+        # no colorbar axes
+        assert plot_widget.figure.axes == [plot_widget.ax]
+        (lines,) = plot_widget.ax.collections
+        assert len(lines.get_segments()) == 6
+        (artist,) = plot_widget.get_cell_text()
+        assert artist.get_text().tolist() == [["", "1"], ["2", ""]]
+        plot_widget.canvas.draw()
+
+    def test_roc_histogram(self, plot_widget):
+        rng = np.random.default_rng(0)
+        y_true = rng.integers(0, 2, 10_000)
+        histogram = ScoreHistogram.from_scores(y_true, rng.dirichlet([1, 1], 10_000), n_bins=10_000)
+        plot_widget.plot_roc_histogram(histogram, ["a", "b"], plot_macro=False)
+        labels = [line.get_label() for line in plot_widget.ax.get_lines()]
+        assert labels[:3] == ["a", "b", "micro-average"]
+        assert "macro-average" not in labels
+        # curves are reduced to the resolution of the axes
+        assert len(plot_widget.ax.get_lines()[0].get_xdata()) < 2 * max(plot_widget.ax.bbox.size)
+
+    def test_calibration_without_sklearn(self, plot_widget):
+        y_true = np.array([0, 1, 1, 0])
+        plot_widget.plot_calibration(y_true, np.array([[0.9, 0.1], [0.2, 0.8], [0.4, 0.6], [0.7, 0.3]]), ["a", "b"])
+        assert [line.get_label() for line in plot_widget.ax.get_lines()] == ["a", "b"]
+
+    def test_binary_calibration_is_labelled_with_positive_class(self, plot_widget):
+        y_true = np.array([0, 0, 1, 1, 1])
+        plot_widget.plot_calibration(y_true, np.array([0.05, 0.15, 0.85, 0.95, 0.15]), ["neg", "pos"])
+        (line,) = plot_widget.ax.get_lines()
+        assert line.get_label() == "pos"
+        # fraction of positives in the non-empty bins [0, 0.1), [0.1, 0.2), [0.8, 0.9) and [0.9, 1]
+        np.testing.assert_allclose(line.get_ydata(), [0, 0.5, 1, 1])
+
+
+class TestPlotBaseDistributions:
+    @pytest.fixture
+    def df(self):
+        pd = pytest.importorskip("pandas")
+        rng = np.random.default_rng(0)
+        return pd.DataFrame({"group": np.repeat(["a", "b", "c"], 10_000), "value": rng.normal(size=30_000)})
+
+    @pytest.mark.parametrize("method", ["plot_violin", "plot_boxplot", "plot_boxenplot", "plot_stripplot"])
+    def test_aggregated_distribution_plots(self, plot_widget, df, method):
+        getattr(plot_widget, method)(df, x="group", y="value")
+        ax = plot_widget.ax
+        assert [label.get_text() for label in ax.get_xticklabels()] == ["a", "b", "c"]
+        assert ax.get_xlim() == (-0.5, 2.5)
+        assert ax.get_ylabel() == "value"
+        plot_widget.canvas.draw()
+
+    @pytest.mark.parametrize("method", ["plot_violin", "plot_boxplot", "plot_boxenplot", "plot_stripplot"])
+    def test_aggregated_distribution_plots_without_data(self, plot_widget, df, method):
+        getattr(plot_widget, method)(df.iloc[:0], x="group", y="value")
+        ax = plot_widget.ax
+        assert not ax.get_xticklabels()
+        assert not ax.collections
+        assert ax.get_ylabel() == "value"
+        plot_widget.canvas.draw()
+
+    def test_strip_plot_is_single_capped_collection(self, plot_widget, df):
+        plot_widget.plot_stripplot(df, x="group", y="value")
+        (collection,) = plot_widget.ax.collections
+        assert 0 < len(collection.get_offsets()) < len(df)
+
+    def test_unsupported_arguments_use_seaborn(self, plot_widget, df, monkeypatch):
+        calls = []
+        monkeypatch.setattr(plot_widget, "_plot_seaborn_distribution", lambda *args, **kwargs: calls.append(args))
+        plot_widget.plot_violin(df, x="group", y="value", hue="group")
+        plot_widget.plot_violin(df, aggregate=False)
+        assert [args[0] for args in calls] == ["violinplot", "violinplot"]
+
+
+class TestPlotBaseDensityScatter:
+    def test_many_points_are_drawn_as_density_image(self, plot_widget):
+        rng = np.random.default_rng(0)
+        x, y = rng.normal(size=(2, 50_000))
+        plot_widget.plot_scatter(x, y, density_threshold=1_000)
+        (artist,) = plot_widget.get_density_scatter()
+        plot_widget.canvas.draw()
+        assert artist.is_dense()
+        assert not artist.markers.get_visible()
+
+    def test_zooming_in_switches_to_markers(self, plot_widget):
+        rng = np.random.default_rng(0)
+        x, y = rng.normal(size=(2, 50_000))
+        plot_widget.plot_scatter(x, y, density_threshold=1_000)
+        (artist,) = plot_widget.get_density_scatter()
+        plot_widget.ax.set_xlim(0, 0.1)
+        plot_widget.ax.set_ylim(0, 0.1)
+        plot_widget.canvas.draw()
+        assert not artist.is_dense()
+        offsets = artist.markers.get_offsets()
+        assert artist.markers.get_visible()
+        assert len(offsets) == np.sum((x >= 0) & (x <= 0.1) & (y >= 0) & (y <= 0.1))
+
+    def test_per_point_colors_are_assigned_to_visible_markers(self, plot_widget):
+        rng = np.random.default_rng(0)
+        x, y = rng.normal(size=(2, 5_000))
+        colors = np.where((x > 0)[:, None], [1.0, 0.0, 0.0, 1.0], [0.0, 0.0, 1.0, 1.0])
+        plot_widget.plot_scatter(x, y, color=colors, density_threshold=1_000)
+        (artist,) = plot_widget.get_density_scatter()
+        plot_widget.canvas.draw()
+        assert artist.is_dense()
+
+        plot_widget.ax.set_xlim(-0.1, 0.1)
+        plot_widget.ax.set_ylim(-0.1, 0.1)
+        plot_widget.canvas.draw()
+        assert not artist.is_dense()
+        offsets = artist.markers.get_offsets()
+        expected = np.where((offsets[:, 0] > 0)[:, None], [1.0, 0.0, 0.0, 1.0], [0.0, 0.0, 1.0, 1.0])
+        np.testing.assert_array_equal(artist.markers.get_facecolor(), expected)
+
+    def test_few_points_are_drawn_as_markers(self, plot_widget):
+        plot_widget.plot_scatter(np.arange(10), np.arange(10))
+        assert plot_widget.get_density_scatter() == []
+        assert len(plot_widget.ax.collections[0].get_offsets()) == 10
+
 
 class TestPlotBaseLegend:
     def test_set_legend_visible_updates_axes_and_figure_legends(self, plot_widget: PlotBase) -> None:
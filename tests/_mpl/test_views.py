@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import numpy as np
+from qtpy import sip
 
 from qtextraplot.mpl import ViewMplLine
 
@@ -45,3 +46,21 @@ def test_mpl_line_view_exposes_legend_visibility(qtbot) -> None:
 
     assert view.legend_visible is False
     assert legend.get_visible() is False
+
+
+def test_mpl_line_view_drops_pending_repaint_when_closed_or_deleted(qtbot, monkeypatch):
+    view = ViewMplLine(None)
+    view.plot(np.arange(5), np.arange(5))
+    draws = []
+    monkeypatch.setattr(view.figure.canvas, "draw", lambda: draws.append(True))
+
+    view.figure.repaint()
+    view.figure.close()
+    qtbot.wait(10)
+    assert not draws
+
+    # deleting the widget before the event loop runs must not draw on the deleted canvas
+    view.figure.repaint()
+    sip.delete(view.widget)
+    qtbot.wait(10)
+    assert not draws
@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import math
 
+import numpy as np
 import pytest
 
-from qtextraplot._napari.line._vispy.overrides.axis import tick_formatter
+from qtextraplot._napari.line._vispy.overrides.axis import _format_tick, tick_formatter
 
 
 @pytest.mark.parametrize(
@@ -55,3 +56,10 @@ def test_tick_formatter_adds_precision_for_narrow_ranges() -> None:
 )
 def test_tick_formatter_handles_non_finite_values(value: float, expected: str) -> None:
     assert tick_formatter(value) == expected
+
+
+def test_tick_formatter_reuses_cached_labels() -> None:
+    tick_formatter(250, tick_spacing=250)
+    hits = _format_tick.cache_info().hits
+    assert tick_formatter(np.float64(250), tick_spacing=250.0) == "250"
+    assert _format_tick.cache_info().hits == hits + 1
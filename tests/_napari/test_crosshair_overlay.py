@@ -0,0 +1,66 @@
+"""Tests for the crosshair overlay."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from napari._vispy.utils.qt_font import FontInfo
+
+from qtextraplot._napari._vispy.overlays.crosshair import (
+    MAX,
+    VispyCrosshairOverlay,
+    position_to_box,
+    position_to_cross,
+)
+from qtextraplot._napari.components.overlays.crosshair import Shape
+from qtextraplot._napari.image.components.viewer_model import Viewer
+
+
+def test_position_to_cross_matches_expected_vertices():
+    data = position_to_cross((10.4, 20.6), 4.0)
+    expected = [[19, 10, 0], [23, 10, 0], [21, 8, 0], [21, 12, 0], [21, 10, -2], [21, 10, 2]]
+    np.testing.assert_array_equal(data, expected)
+
+
+def test_position_to_box_matches_expected_vertices():
+    data = position_to_box((1.0, 2.0), 2.0)
+    assert data.shape == (12, 3)
+    np.testing.assert_array_equal(data[:2], [[1, 0, 0], [3, 0, 0]])
+    size = float(MAX)
+    np.testing.assert_array_equal(data[-4:], [[2 - size, 1, 0], [2 + size, 1, 0], [2, 1 - size, 0], [2, 1 + size, 0]])
+
+
+@pytest.mark.parametrize("func", [position_to_box, position_to_cross])
+def test_position_functions_write_in_place(func):
+    expected = func((5, 7), 3)
+    out = np.zeros_like(expected)
+    assert func((5, 7), 3, out=out) is out
+    np.testing.assert_array_equal(out, expected)
+
+
+def test_crosshair_overlay_coalesces_and_skips_unchanged_positions(qtbot, monkeypatch):
+    viewer = Viewer()
+    visual = VispyCrosshairOverlay(viewer, viewer.cross_hair, FontInfo())
+    calls = []
+    original = visual.node.set_data
+
+    def _set_data(*args, **kwargs):
+        calls.append(args)
+        original(*args, **kwargs)
+
+    monkeypatch.setattr(visual.node, "set_data", _set_data)
+
+    for position in ((1.0, 1.0), (2.0, 2.0), (3.0, 3.0)):
+        viewer.cross_hair.position = position
+    qtbot.waitUntil(lambda: not visual._position_timer.isActive())
+    assert len(calls) == 1
+    assert calls[0][0] is visual._buffers[Shape.BOX]
+
+    # sub-pixel movement does not require new vertices
+    viewer.cross_hair.position = (3.2, 2.9)
+    qtbot.waitUntil(lambda: not visual._position_timer.isActive())
+    assert len(calls) == 1
+
+    viewer.cross_hair.shape = Shape.CROSSHAIR
+    assert len(calls) == 2
+    assert calls[-1][0] is visual._buffers[Shape.CROSSHAIR]
@@ -0,0 +1,93 @@
+"""Tests for bulk region and infinite line helpers."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+napari = pytest.importorskip("napari", reason="napari is not installed")
+pytest.importorskip("napari_plot", reason="napari-plot is not installed")
+
+from napari_plot.layers import InfLine, Region  # noqa: E402
+from napari_plot.viewer import ViewerModel  # noqa: E402
+
+from qtextraplot._napari.line._bulk import (  # noqa: E402
+    coerce_windows,
+    set_inf_line_data,
+    set_region_data,
+    update_inf_line_data,
+    update_region_data,
+)
+from qtextraplot._napari.line.wrapper import NapariLineView  # noqa: E402
+
+
+def _make_view() -> NapariLineView:
+    # avoid creating the Qt widget, which requires system fonts
+    view = NapariLineView.__new__(NapariLineView)
+    view.viewer = ViewerModel()
+    return view
+
+
+def test_coerce_windows():
+    np.testing.assert_array_equal(coerce_windows([0, 1]), [[0, 1]])
+    np.testing.assert_array_equal(coerce_windows([0, 2], [1, 3]), [[0, 1], [2, 3]])
+    assert coerce_windows([]).shape == (0, 2)
+    with pytest.raises(ValueError, match="Region windows"):
+        coerce_windows(np.zeros((3, 3)))
+
+
+def test_set_region_data_matches_layer_data():
+    windows = np.c_[np.arange(100.0), np.arange(100.0) + 0.5]
+    layer = Region(None)
+    events = []
+    layer.events.data.connect(events.append)
+
+    set_region_data(layer, windows, orientation=["vertical", "horizontal"] * 50, color="red")
+
+    assert len(events) == 1
+    np.testing.assert_array_equal(layer.data, windows)
+    assert layer.orientation[1] == "horizontal"
+    np.testing.assert_allclose(layer.color, np.tile([1, 0, 0, 1], (100, 1)))
+
+
+def test_update_region_data_by_index():
+    layer = Region(None)
+    set_region_data(layer, coerce_windows(np.arange(10.0), np.arange(10.0) + 1), color="red")
+
+    update_region_data(layer, [0, -1], windows=np.array([[50, 60], [70, 80]]), color="blue")
+
+    np.testing.assert_array_equal(layer.data[[0, 9]], [[50, 60], [70, 80]])
+    np.testing.assert_array_equal(layer.data[1], [1, 2])
+    np.testing.assert_allclose(layer.color[9], [0, 0, 1, 1])
+    np.testing.assert_allclose(layer.color[1], [1, 0, 0, 1])
+    with pytest.raises(ValueError, match="indices"):
+        update_region_data(layer, [0, 1], windows=np.array([[0, 1]]))
+
+
+def test_set_and_update_inf_line_data():
+    layer = InfLine(None)
+
+    set_inf_line_data(layer, np.arange(1000.0), color=np.tile([0, 1, 0, 1], (1000, 1)))
+    update_inf_line_data(layer, [5], positions=np.array([-5.0]))
+
+    assert layer.n_inflines == 1000
+    assert layer.data[5] == -5.0
+    assert layer.data[6] == 6.0
+    np.testing.assert_allclose(layer.color[0], [0, 1, 0, 1])
+
+
+def test_line_view_bulk_regions_and_inf_lines():
+    view = _make_view()
+
+    layer = view.set_regions(np.arange(5.0), np.arange(5.0) + 0.5, name="Peaks", editable=False)
+    assert view.set_regions(np.zeros((2, 2)), name="Peaks") is layer
+    assert len(layer.data) == 2
+
+    view.update_regions([1], [[3, 4]], name="Peaks")
+    np.testing.assert_array_equal(layer.data[1], [3, 4])
+    assert view.update_regions([0], [[0, 1]], name="Missing") is None
+
+    lines = view.set_inf_lines([1.0, 2.0, 3.0], orientation="horizontal", name="Lines")
+    view.update_inf_lines([2], [30.0], color="red", name="Lines")
+    np.testing.assert_array_equal(lines.data, [1, 2, 30])
+    assert list(lines.orientation) == ["horizontal"] * 3
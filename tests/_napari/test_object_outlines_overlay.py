@@ -15,13 +15,17 @@ from napari.layers import Image  # noqa: E402
 from qtpy.QtWidgets import QWidget  # noqa: E402
 
 from qtextraplot._napari._vispy.overlays.object_outlines import (  # noqa: E402
+    OutlineSpatialIndex,
     VispyObjectOutlinesOverlay,
     outline_data_to_scene,
+    outlines_to_segments,
     points_to_segments,
+    simplify_outlines,
 )
 from qtextraplot._napari.component_controls.qt_object_outline_controls import QtObjectOutlineControls  # noqa: E402
 from qtextraplot._napari.components.overlays.object_outlines import (  # noqa: E402
     ObjectOutlinesOverlay,
+    OutlineStore,
     normalize_object_outlines,
 )
 from qtextraplot._napari.image.component_controls.qt_view_toolbar import QtViewToolbar  # noqa: E402
@@ -109,6 +113,119 @@ def test_overlay_constructor_accepts_outlines_color_and_width():
     np.testing.assert_allclose(overlay.outlines[1].color, [0, 0, 1, 1])
 
 
+def test_outline_store_packs_ragged_outlines():
+    first = np.array([[0, 0], [1, 1], [2, 0]])
+    second = np.array([[3, 3], [4, 4]])
+
+    store = OutlineStore.from_outlines([first, second], color=["red", "blue"], width=[1, 3])
+
+    assert len(store) == 2
+    np.testing.assert_array_equal(store.offsets, [0, 3, 5])
+    np.testing.assert_array_equal(store.outline_data(1), second)
+    np.testing.assert_array_equal(store.bounds[0], [[0, 0], [2, 1]])
+    assert store[1].width == 3
+    np.testing.assert_allclose(store[1].color, [0, 0, 1, 1])
+
+
+def test_outline_store_items_are_read_only():
+    store = OutlineStore.from_outlines([np.array([[0, 0], [1, 1], [2, 0]])], width=2)
+    outline = store[0]
+
+    with pytest.raises(ValueError, match="frozen"):
+        outline.width = 5
+    with pytest.raises(ValueError, match="read-only"):
+        outline.data[0] = 10
+    assert store.widths[0] == 2
+    np.testing.assert_array_equal(store.vertices[0], [0, 0])
+    # snapshots can still be used to build new outlines
+    restored = OutlineStore.from_outlines(list(store))
+    np.testing.assert_array_equal(restored.vertices, store.vertices)
+
+
+def test_outline_store_packs_array_and_restyles_without_copying():
+    data = np.zeros((100, 4, 2))
+
+    store = OutlineStore.from_outlines(data, color="green", width=2)
+    restyled = store.with_style(width=5)
+
+    assert len(store) == 100
+    np.testing.assert_array_equal(store.lengths, np.full(100, 4))
+    assert restyled.vertices is store.vertices
+    np.testing.assert_array_equal(restyled.widths, np.full(100, 5.0))
+    np.testing.assert_allclose(restyled.colors, store.colors)
+
+
+def test_outline_store_validation():
+    with pytest.raises(ValueError, match="at least two points"):
+        OutlineStore.from_outlines([np.zeros((1, 2)), np.zeros((3, 2))])
+    with pytest.raises(ValueError, match="same number of columns"):
+        OutlineStore.from_outlines([np.zeros((2, 2)), np.zeros((3, 3))])
+    with pytest.raises(ValueError, match="Width count"):
+        OutlineStore.from_outlines([np.zeros((2, 2)), np.zeros((3, 2))], width=[1, 2, 3])
+
+
+def test_outlines_to_segments_matches_points_to_segments():
+    store = OutlineStore.from_outlines([np.array([[0, 0], [1, 0], [1, 1]]), np.array([[5, 5], [6, 6]])])
+
+    for closed in (True, False):
+        positions, owners = outlines_to_segments(store.vertices, store.offsets, np.array([0, 1]), closed=closed)
+        expected = np.concatenate([points_to_segments(outline.data, closed=closed) for outline in store])
+        np.testing.assert_array_equal(positions, expected)
+        assert len(owners) == len(positions) // 2
+    positions, owners = outlines_to_segments(store.vertices, store.offsets, np.array([1]), closed=False)
+    np.testing.assert_array_equal(positions, [[5, 5], [6, 6]])
+    np.testing.assert_array_equal(owners, [1])
+
+
+def test_simplify_outlines_merges_nearby_vertices():
+    vertices = np.array([[0.0, 0.0], [0.1, 0.1], [5.0, 0.0], [5.0, 5.0], [10.0, 10.0], [10.2, 10.2]])
+    offsets = np.array([0, 4, 6])
+
+    simplified, simplified_offsets = simplify_outlines(vertices, offsets, tolerance=1.0)
+
+    np.testing.assert_array_equal(simplified, [[0, 0], [5, 0], [5, 5], [10, 10]])
+    np.testing.assert_array_equal(simplified_offsets, [0, 3, 4])
+    positions, _ = outlines_to_segments(simplified, simplified_offsets, np.array([0, 1]), closed=True)
+    assert len(positions) == 6
+
+
+def test_outline_spatial_index_query():
+    bounds = np.array([[[0, 0], [1, 1]], [[10, 10], [20, 20]], [[-50, 5], [50, 6]]], dtype=float)
+    index = OutlineSpatialIndex(bounds)
+
+    np.testing.assert_array_equal(index.query(0, 0, 2, 2), [0])
+    np.testing.assert_array_equal(index.query(15, 0, 16, 100), [1, 2])
+    np.testing.assert_array_equal(index.query(100, 100, 200, 200), [])
+
+
+def test_vispy_object_outlines_cull_and_simplify_with_camera():
+    viewer = Viewer()
+    image = viewer.add_image(np.zeros((1000, 1000)), name="Target")
+    theta = np.linspace(0, 2 * np.pi, 16, endpoint=False)
+    circle = np.stack([np.sin(theta), np.cos(theta)], axis=1) * 2
+    centers = np.array([[10, 10], [500, 500], [990, 990]])
+    overlay = viewer.set_object_outlines(circle + centers[:, None], target_layer=image)
+    visual = VispyObjectOutlinesOverlay(viewer, overlay, FontInfo())
+
+    viewer.camera.center = (10, 10)
+    viewer.camera.zoom = 10.0
+    (line,) = visual._line_nodes
+    assert len(line.pos) == 32
+    np.testing.assert_allclose(line.pos.mean(axis=0)[:2], [10, 10], atol=0.5)
+
+    viewer.camera.center = (990, 990)
+    np.testing.assert_allclose(visual._line_nodes[0].pos.mean(axis=0)[:2], [990, 990], atol=0.5)
+
+    # zoomed out, all outlines are in view but are drawn with fewer vertices
+    viewer.camera.center = (500, 500)
+    viewer.camera.zoom = 0.2
+    assert 0 < len(visual._line_nodes[0].pos) < 3 * 32
+
+    overlay.set_style(width=3)
+    assert overlay.outlines.widths.tolist() == [3, 3, 3]
+    visual.close()
+
+
 def test_points_to_open_and_closed_segments():
     points = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0]])
 
@@ -205,6 +322,27 @@ def test_image_view_grid_mode_does_not_reparent_object_outlines(qtbot, _mock_ope
     assert visual.node.visible
 
 
+def test_image_view_culls_object_outlines_on_resize(qtbot, _mock_opengl_capabilities):
+    view = NapariImageView(add_dims=False, add_toolbars=False, allow_extraction=False)
+    qtbot.addWidget(view.widget)
+    image = view.viewer.add_image(np.zeros((1000, 1000)), name="Target")
+    theta = np.linspace(0, 2 * np.pi, 16, endpoint=False)
+    circle = np.stack([np.sin(theta), np.cos(theta)], axis=1) * 2
+    overlay = view.set_object_outlines(circle + np.array([[[10, 10]], [[10, 400]]]), target_layer=image)
+    (visual,) = view.widget.canvas._overlay_to_visual[overlay]
+    scene_canvas = view.widget.canvas._scene_canvas
+
+    scene_canvas.size = (200, 200)
+    scene_canvas.events.resize(size=scene_canvas.size)
+    view.viewer.camera.center = (10, 10)
+    view.viewer.camera.zoom = 2.0
+    assert len(visual._line_nodes[0].pos) == 32
+
+    scene_canvas.size = (1600, 200)
+    scene_canvas.events.resize(size=scene_canvas.size)
+    assert len(visual._line_nodes[0].pos) == 64
+
+
 def test_viewer_clear_canvas_removes_object_outline_overlays():
     viewer = Viewer()
     image = viewer.add_image(np.zeros((10, 10)), name="Target")
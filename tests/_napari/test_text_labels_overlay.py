@@ -0,0 +1,137 @@
+"""Tests for text label overlays."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+napari = pytest.importorskip("napari", reason="napari is not installed")
+vispy = pytest.importorskip("vispy", reason="vispy is not installed")
+
+from napari._vispy.utils.qt_font import FontInfo  # noqa: E402
+
+from qtextraplot._napari._vispy.overlays.text_labels import (  # noqa: E402
+    VispyTextLabelsOverlay,
+    get_visible_label_indices,
+)
+from qtextraplot._napari.components.overlays.text_labels import TextLabelsOverlay  # noqa: E402
+from qtextraplot._napari.image.components.viewer_model import Viewer  # noqa: E402
+from qtextraplot._napari.image.wrapper import NapariImageView  # noqa: E402
+
+
+def test_overlay_validation():
+    overlay = TextLabelsOverlay()
+    overlay.set_labels(["a", "b"], [[0, 0], [1, 1]])
+    assert overlay.text == ("a", "b")
+    assert overlay.positions.shape == (2, 2)
+
+    with pytest.raises(ValueError, match="must match"):
+        overlay.set_labels(["a"], [[0, 0], [1, 1]])
+    with pytest.raises(ValueError, match="two columns"):
+        overlay.positions = np.zeros((2, 3))
+    with pytest.raises(ValueError, match="anchor"):
+        overlay.anchor = "middle"
+    with pytest.raises(ValueError, match="positive"):
+        overlay.font_size = 0
+
+
+def test_overlay_set_labels_emits_single_event():
+    overlay = TextLabelsOverlay()
+    calls = []
+    overlay.events.positions.connect(calls.append)
+    overlay.events.text.connect(calls.append)
+
+    overlay.set_labels(["a", "b"], [[0, 0], [1, 1]])
+    assert len(calls) == 1
+
+
+def test_get_visible_label_indices_culls_outside_view():
+    positions = np.array([[0, 0], [10, 10], [100, 100], [-100, 0]], dtype=float)
+    indices = get_visible_label_indices(positions, (0, 0), zoom=10.0, canvas_size=(400, 400))
+    np.testing.assert_array_equal(indices, [0, 1])
+
+    indices = get_visible_label_indices(positions, (100, 100), zoom=10.0, canvas_size=(400, 400))
+    np.testing.assert_array_equal(indices, [2])
+
+
+def test_get_visible_label_indices_level_of_detail():
+    positions = np.zeros((100, 2))
+    assert len(get_visible_label_indices(positions, (0, 0), 0.5, (400, 400), min_zoom=1.0)) == 0
+
+    indices = get_visible_label_indices(positions, (0, 0), 2.0, (400, 400), max_visible=10)
+    assert len(indices) == 10
+    np.testing.assert_array_equal(indices, np.arange(0, 100, 10))
+
+
+def test_vispy_text_labels_follow_camera():
+    viewer = Viewer()
+    overlay = viewer.set_text_labels(["a", "b", "c"], [[0, 0], [50, 50], [1000, 1000]])
+    visual = VispyTextLabelsOverlay(viewer, overlay, FontInfo())
+
+    viewer.camera.zoom = 1.0
+    viewer.camera.center = (0, 0)
+    assert visual.node.visible
+    assert list(visual.node.text) == ["a", "b"]
+    np.testing.assert_array_equal(visual.node.pos[1, :2], [50, 50])
+
+    viewer.camera.center = (1000, 1000)
+    assert list(visual.node.text) == ["c"]
+
+    overlay.min_zoom = 2.0
+    assert not visual.node.visible
+
+    overlay.min_zoom = 0.0
+    overlay.set_labels([], None)
+    assert not visual.node.visible
+    visual.close()
+
+
+def test_image_view_text_labels(qtbot, _mock_opengl_capabilities):
+    view = NapariImageView(add_dims=False, add_toolbars=False, allow_extraction=False)
+    qtbot.addWidget(view.widget)
+    overlay = view.set_text_labels(["a"], [[0, 0]], name="labels", font_size=8)
+    assert overlay.font_size == 8
+    assert view.viewer.text_label_overlays() == {"labels": overlay}
+    assert overlay in view.widget.canvas._overlay_to_visual
+
+    view.clear_text_labels()
+    assert view.viewer.text_label_overlays() == {}
+
+
+def test_vispy_text_labels_cull_translated_labels_when_shown():
+    viewer = Viewer()
+    overlay = viewer.set_text_labels(["a", "b"], [[0, 0], [1000, 1000]])
+    visual = VispyTextLabelsOverlay(viewer, overlay, FontInfo())
+    viewer.camera.zoom = 1.0
+    viewer.camera.center = (1000, 1000)
+    assert list(visual.node.text) == ["b"]
+
+    overlay.translation = (1000, 1000)
+    assert list(visual.node.text) == ["a"]
+    np.testing.assert_array_equal(visual.node.pos[0, :2], [1000, 1000])
+
+    # labels are not culled while hidden, but as soon as they are shown
+    overlay.visible = False
+    viewer.camera.center = (2000, 2000)
+    assert not visual.node.visible
+    overlay.visible = True
+    assert visual.node.visible
+    assert list(visual.node.text) == ["b"]
+    visual.close()
+
+
+def test_image_view_text_labels_culled_on_resize(qtbot, _mock_opengl_capabilities):
+    view = NapariImageView(add_dims=False, add_toolbars=False, allow_extraction=False)
+    qtbot.addWidget(view.widget)
+    overlay = view.set_text_labels(["a", "b"], [[0, 0], [0, 300]], name="labels")
+    view.viewer.camera.zoom = 1.0
+    view.viewer.camera.center = (0, 0)
+    (visual,) = view.widget.canvas._overlay_to_visual[overlay]
+
+    scene_canvas = view.widget.canvas._scene_canvas
+    scene_canvas.size = (200, 200)
+    scene_canvas.events.resize(size=scene_canvas.size)
+    assert list(visual.node.text) == ["a"]
+    scene_canvas.size = (800, 800)
+    scene_canvas.events.resize(size=scene_canvas.size)
+    assert list(visual.node.text) == ["a", "b"]
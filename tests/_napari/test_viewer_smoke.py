@@ -39,3 +39,83 @@ def test_extract_shapes_layer_uses_image_scale(qtbot, _mock_opengl_capabilities)
     shapes_layer = view.add_extract_shapes_layer()
 
     np.testing.assert_array_equal(shapes_layer.scale, image_layer.scale)
+
+
+def test_image_view_reuses_pooled_layers_when_switching_rgb(qtbot, _mock_opengl_capabilities) -> None:
+    """Switching between RGB and scalar data should reuse hidden layers rather than re-creating them."""
+    view = NapariImageView(
+        add_dims=False,
+        add_toolbars=False,
+        allow_extraction=False,
+    )
+    qtbot.addWidget(view.widget)
+    rng = np.random.default_rng(0)
+    scalar = view.plot(rng.random((8, 8)), clip=False)
+    view.viewer.camera.zoom = 3.0
+
+    rgb = view.plot(rng.random((8, 8, 3)), clip=False)
+    assert rgb is not scalar
+    assert rgb.rgb
+    assert rgb.name == "Image"
+    assert scalar not in view.viewer.layers
+    assert scalar.data.shape == (1, 1)
+    assert view.viewer.camera.zoom == 3.0
+
+    view.add_image(rng.random((8, 8)), name="Mask")
+    data = rng.random((8, 8))
+    assert view.plot(data, clip=False) is scalar
+    assert view.image_layer is scalar
+    assert scalar.name == "Image"
+    assert rgb not in view.viewer.layers
+    assert rgb.data.shape == (1, 1, 3)
+    assert [layer.name for layer in view.viewer.layers] == ["Image", "Mask"]
+    np.testing.assert_array_equal(scalar.data, data)
+    assert view.plot(rng.random((8, 8, 4)), clip=False) is rgb
+    assert len(view.viewer.layers) == 2
+
+    view.remove_layer(rgb)
+    assert not view._image_pool
+
+
+def test_refresh_manager_only_refreshes_exposed_dirty_views(qtbot, _mock_opengl_capabilities) -> None:
+    """Refresh requests should be coalesced and skip views that are hidden or unchanged."""
+    from qtextraplot._napari._wrapper import REFRESH_MANAGER
+
+    view = NapariImageView(
+        add_dims=False,
+        add_toolbars=False,
+        allow_extraction=False,
+    )
+    qtbot.addWidget(view.widget)
+    layer = view.plot(np.zeros((4, 4)), clip=False)
+    refreshed = []
+    original = view.refresh
+
+    def _refresh() -> None:
+        refreshed.append(1)
+        original()
+
+    view.refresh = _refresh
+
+    # hidden view is not refreshed and stays dirty
+    REFRESH_MANAGER.request(view, view)
+    REFRESH_MANAGER.flush()
+    assert not refreshed
+    assert view._needs_refresh
+
+    view.widget.show()
+    qtbot.waitExposed(view.widget)
+    REFRESH_MANAGER.request(view, view)
+    qtbot.waitUntil(lambda: not REFRESH_MANAGER._scheduled)
+    assert refreshed == [1]
+    assert not view._needs_refresh
+
+    # exposed and unchanged view does not need to be refreshed
+    REFRESH_MANAGER.request(view)
+    REFRESH_MANAGER.flush()
+    assert refreshed == [1]
+
+    # changes made while the view is hidden mark it as dirty
+    view.widget.hide()
+    layer.data = np.ones((4, 4))
+    assert view._needs_refresh
@@ -0,0 +1,65 @@
+"""Tests for the vispy camera model sync."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("napari", reason="napari is not installed")
+
+from napari.components import Camera, Dims
+
+from qtextraplot._napari.image._vispy.vispy_camera import VispyCamera
+
+
+def _make_camera(**kwargs) -> tuple[VispyCamera, Camera, list]:
+    view = SimpleNamespace(camera=None, canvas=SimpleNamespace(size=(200, 100)))
+    camera = Camera()
+    vispy_camera = VispyCamera(view, camera, Dims(ndisplay=2), **kwargs)
+    events = []
+    camera.events.center.connect(lambda evt: events.append(("center", evt.value)))
+    camera.events.zoom.connect(lambda evt: events.append(("zoom", evt.value)))
+    return vispy_camera, camera, events
+
+
+def test_on_draw_skips_sync_when_camera_did_not_move():
+    vispy_camera, camera, events = _make_camera()
+    vispy_camera.on_draw(None)
+    n_events = len(events)
+    assert vispy_camera._last_synced is not None
+
+    for _ in range(10):
+        vispy_camera.on_draw(None)
+    assert len(events) == n_events
+
+    vispy_camera._view.camera.center = (10.0, 20.0)
+    vispy_camera.on_draw(None)
+    assert camera.center[-2:] == pytest.approx((20.0, 10.0))
+    assert len(events) > n_events
+
+
+def test_on_draw_ignores_changes_within_tolerance():
+    vispy_camera, _camera, events = _make_camera(sync_tolerance=1e-3)
+    vispy_camera.on_draw(None)
+    n_events = len(events)
+
+    x, y = vispy_camera._view.camera.center[:2]
+    vispy_camera._view.camera.center = (x + 1e-6, y)
+    vispy_camera.on_draw(None)
+    assert len(events) == n_events
+
+
+def test_on_draw_rate_limits_sync(monkeypatch):
+    vispy_camera, camera, _events = _make_camera(sync_interval=10.0)
+    scheduled = []
+    monkeypatch.setattr(vispy_camera, "_schedule_sync", lambda delay: scheduled.append(delay))
+    vispy_camera.on_draw(None)
+
+    vispy_camera._view.camera.center = (5.0, 6.0)
+    vispy_camera.on_draw(None)
+    assert len(scheduled) == 1
+    assert camera.center[-2:] != pytest.approx((6.0, 5.0))
+
+    vispy_camera._on_sync_timer()
+    assert camera.center[-2:] == pytest.approx((6.0, 5.0))
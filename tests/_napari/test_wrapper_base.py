@@ -47,3 +47,157 @@ def test_reset_text_overlay_is_tolerant_when_missing():
 
     del view.viewer.text_overlay
     view._reset_text_overlay()
+
+
+def _make_indexed_view() -> _DummyViewerBase:
+    from napari.components.layerlist import LayerList
+
+    view = _DummyViewerBase()
+    view.viewer.layers = LayerList()
+    return view
+
+
+def test_layer_index_tracks_insert_remove_and_rename():
+    import numpy as np
+    from napari.layers import Image, Points
+
+    view = _make_indexed_view()
+    assert view.layer_index is not None
+    image = Image(np.zeros((4, 4)), name="image")
+    points = Points(name="points")
+    view.viewer.layers.append(image)
+    view.viewer.layers.append(points)
+
+    assert view.get_layer("image") is image
+    assert view.try_reuse("points", Points) is points
+    assert view.try_reuse("points", Image) is None
+    assert view.get_layers_of_type(Image) == [image]
+
+    image.name = "renamed"
+    assert view.get_layer("image") is None
+    assert view.get_layer("renamed") is image
+
+    view.viewer.layers.remove(points)
+    assert view.get_layer("points") is None
+    assert view.get_layers_of_type(Points) == []
+    assert len(view.layer_index) == 1
+
+
+def test_layer_index_preserves_layer_order():
+    import numpy as np
+    from napari.layers import Image, Layer, Points
+
+    view = _make_indexed_view()
+    layers = [Image(np.zeros((4, 4)), name="a"), Points(name="b"), Image(np.zeros((4, 4)), name="c")]
+    for layer in layers:
+        view.viewer.layers.append(layer)
+    assert view.get_layers_of_type(Layer) == layers
+
+    view.viewer.layers.move(0, 3)
+    assert view.get_layers_of_type(Layer) == list(view.viewer.layers)
+
+    new = Points(name="d")
+    view.viewer.layers.insert(0, new)
+    assert view.get_layers_of_type(Points) == [new, layers[1]]
+
+
+def test_get_layers_with_prefix():
+    import numpy as np
+    from napari.layers import Image, Points
+
+    view = _make_indexed_view()
+    for name in ("line-1", "line-2", "other", "line-3"):
+        view.viewer.layers.append(Image(np.zeros((4, 4)), name=name))
+    view.viewer.layers.append(Points(name="line-points"))
+
+    assert [layer.name for layer in view.get_layers_with_prefix("line-")] == [
+        "line-1",
+        "line-2",
+        "line-3",
+        "line-points",
+    ]
+    assert [layer.name for layer in view.get_layers_with_prefix("line-", Points)] == ["line-points"]
+    assert view.get_layers_with_prefix("missing") == []
+
+    view.clear_and_exclude("other")
+    assert [layer.name for layer in view.viewer.layers] == ["other"]
+    assert view.get_layers_with_prefix("line") == []
+
+
+def test_layer_index_unavailable_without_layer_list():
+    view = _DummyViewerBase()
+    assert view.layer_index is None
+    assert view.get_layers_of_type(object) == []
+    assert view.get_layers_with_prefix("a") == []
+
+
+def test_batched_update_defers_layers_change_until_exit():
+    import numpy as np
+    from napari.layers import Image
+
+    from qtextraplot._napari.image.components.viewer_model import Viewer
+
+    view = _DummyViewerBase()
+    view.viewer = Viewer()
+    for index in range(3):
+        view.viewer.add_image(np.zeros((4, 4)), name=f"image-{index}")
+    ranges = []
+    view.viewer.dims.events.range.connect(lambda evt: ranges.append(evt.value))
+
+    with view.batched_update():
+        with view.batched_update():
+            view.viewer.add_image(np.zeros((4, 4)), name="image-3")
+        for size in (8, 16):
+            for layer in view.get_layers_of_type(Image):
+                layer.data = np.zeros((size, size))
+        assert ranges == []
+        assert view.viewer.dims.range[0].stop == 3
+    assert view._batch_depth == 0
+    assert len(ranges) == 1
+    assert view.viewer.dims.range[0].stop == 15
+
+    # callbacks are no longer blocked after the batch
+    view.viewer.layers[0].data = np.zeros((32, 32))
+    assert view.viewer.dims.range[0].stop == 31
+
+
+def test_batched_update_defers_layer_inserts_and_removals(monkeypatch):
+    import numpy as np
+    from napari.components.layerlist import LayerList
+
+    from qtextraplot._napari.image.components.viewer_model import Viewer
+
+    view = _DummyViewerBase()
+    view.viewer = Viewer()
+    for index in range(10):
+        view.viewer.add_image(np.zeros((4 + index, 4)), name=f"image-{index}")
+    ranges = LayerList._ranges
+    recomputes = []
+
+    def _ranges(self):
+        recomputes.append(True)
+        return ranges.fget(self)
+
+    monkeypatch.setattr(LayerList, "_ranges", property(_ranges))
+    with view.batched_update():
+        view.viewer.add_image(np.zeros((32, 8)), name="large")
+        view.viewer.add_image(np.zeros((2, 64)), name="wide")
+        view.remove_layers([f"image-{index}" for index in range(5)])
+    assert len(recomputes) == 1
+    assert view.viewer.dims.range[0].stop == 31
+    assert view.viewer.dims.range[1].stop == 63
+
+    recomputes.clear()
+    view.remove_layers([f"image-{index}" for index in range(5, 10)])
+    assert len(recomputes) == 1
+    view.clear_and_exclude("large")
+    assert len(recomputes) == 2
+    assert view.viewer.dims.range[1].stop == 7
+    assert not view.viewer._layers_change_deferred
+
+
+def test_batched_update_without_layer_list():
+    view = _DummyViewerBase()
+    with view.batched_update():
+        assert view._batch_depth == 1
+    assert view._batch_depth == 0
@@ -42,6 +42,41 @@ def test_line_view_supports_lines_and_annotations(qtbot):
     assert view.figure.get_existing_patch("roi").item.rect().width() == 4
 
 
+def test_line_view_adds_patches_as_single_item(qtbot):
+    parent = QWidget()
+    qtbot.addWidget(parent)
+    view = ViewPyQtGraphLine(parent)
+    qtbot.addWidget(view.widget)
+
+    gid = view.add_patches(np.arange(50), np.zeros(50), np.ones(50) * 0.5, np.ones(50))
+    group = view.figure.get_patch_group(gid)
+    assert isinstance(group.item, pg.BarGraphItem)
+    assert group.item.opts["brushes"] is None
+    assert len(group.item.opts["x0"]) == 50
+
+    view.update_patch_group([0, 1], color=["g", "b"], gid=gid)
+    assert len(group.item.opts["brushes"]) == 50
+    view.update_patch_group([2], visible=False, gid=gid)
+    assert len(group.item.opts["x0"]) == 49
+
+    view.remove_patches()
+    assert view.figure.get_patch_group(gid) is None
+
+
+def test_line_view_patch_group_alpha(qtbot):
+    parent = QWidget()
+    qtbot.addWidget(parent)
+    view = ViewPyQtGraphLine(parent)
+    qtbot.addWidget(view.widget)
+
+    group = view.add_patch_group(np.arange(3), 0, 0.5, 1, color="r", alpha=0.3, edgecolor="k")
+    np.testing.assert_allclose(group.colors[:, 3], 0.3)
+    view.update_patch_group([0], color="b")
+    np.testing.assert_allclose(group.colors[0], [0, 0, 1, 0.3])
+    view.update_patch_group([1], alpha=1)
+    np.testing.assert_allclose(group.colors[:, 3], [0.3, 1, 0.3])
+
+
 def test_scatter_view_updates_data(qtbot):
     parent = QWidget()
     qtbot.addWidget(parent)
@@ -57,6 +92,52 @@ def test_scatter_view_updates_data(qtbot):
     assert len(data[0]) == 4
 
 
+def test_scatter_view_switches_between_density_image_and_markers(qtbot):
+    parent = QWidget()
+    qtbot.addWidget(parent)
+    view = ViewPyQtGraphScatter(parent)
+    qtbot.addWidget(view.widget)
+    x, y = np.random.default_rng(0).normal(size=(2, 50_000))
+
+    view.plot(x, y, density_threshold=1_000)
+    adapter = view.figure._density_scatters["__scatter__"]
+    assert adapter.is_dense()
+    assert not adapter.scatter.isVisible()
+    assert adapter.image.image.dtype == np.uint8
+
+    view.figure.setRange(xRange=(0, 0.1), yRange=(0, 0.1), padding=0)
+    view.figure.update_density()
+    (x_min, x_max), (y_min, y_max) = view.figure.getViewBox().viewRange()
+    assert not adapter.is_dense()
+    assert len(adapter.scatter.getData()[0]) == np.sum((x >= x_min) & (x <= x_max) & (y >= y_min) & (y <= y_max))
+
+    view.figure.plot_scatter(np.arange(3), np.arange(3), density=False)
+    assert "__scatter__" not in view.figure._density_scatters
+    assert adapter.image.scene() is None
+
+
+def test_scatter_view_update_keeps_per_point_colors_of_density_scatter(qtbot):
+    parent = QWidget()
+    qtbot.addWidget(parent)
+    view = ViewPyQtGraphScatter(parent)
+    qtbot.addWidget(view.widget)
+    colors = ["r", "g", "b", "y"]
+
+    view.plot(np.arange(4), np.arange(4), color=colors, density=True)
+    adapter = view.figure._density_scatters["__scatter__"]
+    view.figure.update_scatter(np.arange(4), np.arange(4)[::-1])
+    assert adapter.colors == colors
+    assert not adapter.is_dense()
+    assert [brush.color().name() for brush in adapter.scatter.data["brush"]] == [
+        pg.mkColor(color).name() for color in colors
+    ]
+
+    view.figure.update_scatter(np.arange(3), np.arange(3), color=["b", "g", "r"])
+    assert adapter.colors == ["b", "g", "r"]
+    view.figure.update_scatter(np.arange(5), np.arange(5))
+    assert adapter.colors == ["b"]
+
+
 def test_image_view_supports_image_and_overlaid_annotation(qtbot):
     parent = QWidget()
     qtbot.addWidget(parent)
@@ -183,3 +264,40 @@ def test_canvas_emits_range_changes_and_updates_theme(qtbot):
         assert view.figure.backgroundBrush().color().name() == "#000000"
     finally:
         CANVAS.theme = previous_theme
+
+
+def test_image_view_streams_frames_without_copies_or_level_scans(qtbot):
+    parent = QWidget()
+    qtbot.addWidget(parent)
+    view = ViewPyQtGraphImage(parent)
+    qtbot.addWidget(view.widget)
+
+    frame = np.arange(48, dtype=np.uint16).reshape(6, 8)
+    view.stream(frame, levels=(0, 100))
+    item = view.figure._plot_items["__image__"]
+
+    assert item.axisOrder == "row-major"
+    assert np.shares_memory(item.image, frame)
+    assert view.figure._ax.getViewBox().state["autoRange"] == [False, False]
+
+    # levels are kept unless explicitly sampled
+    view.stream(frame * 10)
+    np.testing.assert_allclose(item.levels, (0, 100))
+    view.stream(frame * 10, sample_levels=True)
+    assert item.levels[1] > 100
+    assert view.figure._plot_items["__image__"] is item
+    assert view._data["image"] is not frame
+
+    # regular updates switch back to the transposed layout
+    view.update(frame)
+    assert view.figure._plot_items["__image__"].image.shape == frame.T.shape
+
+
+def test_sample_image_levels():
+    from qtextraplot._pyqtgraph.views import sample_image_levels
+
+    image = np.zeros((1000, 1000))
+    image[:, 500:] = 10.0
+    low, high = sample_image_levels(image, max_samples=1000)
+    assert (low, high) == (0.0, 10.0)
+    assert sample_image_levels(np.ones((4, 4))) == (1.0, 2.0)
@@ -130,6 +130,61 @@ class TestPlotLine:
     def test_repaint_no_error(self, line_plot):
         line_plot.repaint()
 
+    def test_line_updates_vertices_in_place(self, line_plot, monkeypatch):
+        x = np.arange(100, dtype=float)
+        line_plot.plot_1d(x, np.zeros(100))
+        node = line_plot.node
+        data = node.buffer.data
+        # pretend the line was drawn, which uploads the whole line
+        node._changed["pos"] = False
+        uploads = []
+        monkeypatch.setattr(node._line_visual._pos_vbo, "set_subdata", lambda *args, **kw: uploads.append(kw["offset"]))
+
+        y = np.zeros(100)
+        y[10:20] = 1
+        line_plot.plot_1d_update_y(y)
+        line_plot.plot_1d_update_data(x, y)
+        assert node.buffer.data is data
+        assert uploads == [10]
+        np.testing.assert_array_equal(node.y, y)
+
+        line_plot.plot_1d_update_data(np.arange(50, dtype=float), np.ones(50))
+        assert node._changed["pos"]
+        assert len(node._pos) == 50
+        with pytest.raises(ValueError, match="Expected 50 y-values"):
+            line_plot.plot_1d_update_y(y)
+
+    def test_line_uploads_whole_line_without_vertex_buffer(self, line_plot, monkeypatch):
+        x = np.arange(100, dtype=float)
+        line_plot.plot_1d(x, np.zeros(100))
+        node = line_plot.node
+        node._changed["pos"] = False
+        # vispy versions that do not keep the vertices in `_pos_vbo`
+        monkeypatch.setattr(node._line_visual, "_pos_vbo", None)
+
+        line_plot.plot_1d_update_y(np.ones(100))
+        assert node._changed["pos"]
+        np.testing.assert_array_equal(node._pos[:, 1], np.ones(100))
+
+    def test_patch_group_uses_single_mesh(self, line_plot):
+        x = np.arange(10, dtype=float)
+        line_plot.plot_1d(x, x)
+        group = line_plot.plot_add_patches(x, 0, 0.5, 1, color="red", gid="peaks")
+        mesh_data = group.item.mesh_data
+        assert len(mesh_data.get_faces()) == 20
+
+        np.testing.assert_allclose(group.colors[0], [1, 0, 0, 0.5])
+
+        line_plot.plot_update_patches("peaks", [0, 1], visible=False, color="blue")
+        assert len(group.item.mesh_data.get_faces()) == 16
+        np.testing.assert_allclose(group.colors[0], [0, 0, 1, 0.5])
+        line_plot.plot_update_patches("peaks", [0], alpha=1)
+        np.testing.assert_allclose(group.colors[0], [0, 0, 1, 1])
+
+        line_plot.remove_gid("peaks")
+        assert line_plot.patch_groups == {}
+        assert group.item.parent is None
+
 
 # ---------------------------------------------------------------------------
 # PlotScatter
@@ -197,3 +252,16 @@ class TestPlotScatter:
         scatter_plot.plot_scatter(x, x)
         scatter_plot.clear()
         assert scatter_plot.node is None
+
+    def test_plot_scatter_switches_between_density_image_and_markers(self, scatter_plot, qtbot):
+        x, y = np.random.default_rng(0).normal(size=(2, 50_000))
+        scatter_plot.plot_scatter(x, y, density_threshold=1_000)
+        assert scatter_plot.is_dense()
+        assert not scatter_plot.node.visible
+
+        scatter_plot.on_zoom_xy_axis(0, 0.1, 0, 0.1)
+        qtbot.waitUntil(lambda: not scatter_plot.is_dense())
+        assert scatter_plot.node.visible
+
+        scatter_plot.clear()
+        assert scatter_plot._density_node is None
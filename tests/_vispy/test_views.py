@@ -28,6 +28,19 @@ def test_vispy_line_view_caches_and_resets(qtbot):
     assert np.array_equal(view._data["y"], y)
 
 
+def test_vispy_line_view_updates_y_values(qtbot):
+    view = ViewVispyLine(None)
+    qtbot.addWidget(view.widget)
+
+    x = np.linspace(0, 1, 10)
+    view.plot(x, np.sin(x))
+    view.update_y(np.cos(x))
+
+    np.testing.assert_allclose(view.figure.node.x, x, rtol=1e-6)
+    np.testing.assert_allclose(view.figure.node.y, np.cos(x), rtol=1e-6)
+    assert np.array_equal(view._data["y"], np.cos(x))
+
+
 def test_vispy_line_view_supports_viewbase_annotations(qtbot):
     view = ViewVispyLine(None)
     qtbot.addWidget(view.widget)
@@ -21,6 +21,27 @@ class TestCanvasTheme:
         arr = theme.as_array("canvas")
         assert isinstance(arr, np.ndarray)
 
+    def test_as_array_is_cached_until_field_changes(self):
+        theme = CanvasTheme(**LIGHT_THEME)
+        np.testing.assert_array_equal(theme.as_array("canvas"), [1, 1, 1, 1])
+        assert "canvas" in theme._array_cache
+
+        theme.canvas = "red"
+        assert "canvas" not in theme._array_cache
+        np.testing.assert_array_equal(theme.as_array("canvas"), [1, 0, 0, 1])
+
+    def test_as_array_returns_copy_of_cached_value(self):
+        theme = CanvasTheme(**LIGHT_THEME)
+        arr = theme.as_array("line")
+        arr[:] = 0.5
+        np.testing.assert_array_equal(theme.as_array("line"), [0, 0, 0, 1])
+
+    def test_as_arrays_contains_every_field(self):
+        theme = CanvasTheme(**DARK_THEME)
+        colors = theme.as_arrays()
+        assert set(colors) == set(DARK_THEME)
+        np.testing.assert_array_equal(colors["canvas"], [0, 0, 0, 1])
+
 
 class TestCanvasThemes:
     def test_default_theme_is_light(self):
@@ -56,6 +77,12 @@ class TestCanvasThemes:
         themes.theme = "nonexistent"
         assert themes.theme == original
 
+    def test_as_array_follows_active_theme(self):
+        themes = CanvasThemes()
+        np.testing.assert_array_equal(themes.as_array("canvas"), [1, 1, 1, 1])
+        themes.theme = "dark"
+        np.testing.assert_array_equal(themes.as_arrays()["canvas"], [0, 0, 0, 1])
+
     def test_as_hex_returns_string(self):
         themes = CanvasThemes()
         hex_color = themes.as_hex("canvas")
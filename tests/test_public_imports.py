@@ -1,5 +1,8 @@
 """Public import surface tests."""
 
+import subprocess
+import sys
+
 import pytest
 
 from qtextraplot.mpl import ViewMplLine
@@ -24,3 +27,65 @@ def test_public_backend_imports():
     assert PlotScatter is not None
     assert ViewVispyLine is not None
     assert ViewVispyScatter is not None
+
+
+def _imported_modules(statement: str) -> set[str]:
+    """Return the modules imported by running `statement` in a fresh interpreter with `-X importtime`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = set()
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            name = line.rsplit("|", 1)[-1].strip()
+            if name != "imported package":
+                modules.add(name)
+    return modules
+
+
+@pytest.mark.parametrize(
+    "module",
+    ["qtextraplot.mpl", "qtextraplot.napari", "qtextraplot.napari_plot", "qtextraplot.pyqtgraph", "qtextraplot.vispy"],
+)
+def test_public_module_import_is_lazy(module):
+    modules = _imported_modules(f"import {module}")
+    assert module in modules
+    for heavy in ("matplotlib", "napari", "napari_plot", "pyqtgraph", "vispy", "seaborn"):
+        assert heavy not in modules, f"importing {module} eagerly imported {heavy}"
+
+
+@pytest.mark.parametrize(
+    ("statement", "unused"),
+    [
+        (
+            "from qtextraplot.mpl import ViewMplLine",
+            ("seaborn", "pyqtgraph", "qtextraplot._vispy", "qtextraplot._napari"),
+        ),
+        (
+            "from qtextraplot.pyqtgraph import ViewPyQtGraphLine",
+            ("matplotlib.pyplot", "qtextraplot._vispy", "qtextraplot._napari"),
+        ),
+        ("from qtextraplot.vispy import ViewVispyLine", ("matplotlib.pyplot", "pyqtgraph", "qtextraplot._napari")),
+        ("from qtextraplot.napari import NapariImageView", ("qtextraplot._napari.line", "qtextraplot._mpl")),
+        (
+            "from qtextraplot.napari_plot import NapariLineView",
+            ("qtextraplot._napari.image.wrapper", "qtextraplot._mpl"),
+        ),
+    ],
+)
+def test_backend_import_does_not_pull_other_backends(statement, unused):
+    modules = _imported_modules(statement)
+    for name in unused:
+        assert name not in modules, f"{statement!r} imported {name}"
+
+
+def test_lazy_attributes_are_listed_and_cached():
+    import qtextraplot.pyqtgraph as module
+
+    assert set(module.__all__) <= set(dir(module))
+    assert "ViewPyQtGraphLine" in vars(module)
+    with pytest.raises(AttributeError):
+        module.DoesNotExist  # noqa: B018
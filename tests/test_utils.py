@@ -5,8 +5,13 @@ from __future__ import annotations
 import numpy as np
 import pytest
 
+from qtextraplot.utils.buffers import LineBuffer
+from qtextraplot.utils.classification import ScoreHistogram, downsample_curve
 from qtextraplot.utils.colormap import vispy_colormap, vispy_colormaps
+from qtextraplot.utils.density import DensityAggregator, density_to_rgba, lookup_table
+from qtextraplot.utils.distributions import binned_kde, density_capped_subsample, summarize_distributions
 from qtextraplot.utils.interaction import ExtractEvent, Polygon, get_center
+from qtextraplot.utils.patches import PatchGroup, coerce_rectangles, rectangle_vertices
 from qtextraplot.utils.utilities import running_under_pytest
 from qtextraplot.utils.views_base import build_wildcard
 
@@ -123,6 +128,49 @@ class TestPolygon:
         with qtbot.waitSignal(poly.evt_n_changed, timeout=1000):
             poly.add_point(1, 2)
 
+    def test_points_grow_beyond_initial_capacity(self):
+        poly = Polygon()
+        for i in range(100):
+            poly.add_point(i, 2 * i)
+        assert poly.n_points == 100
+        np.testing.assert_array_equal(poly.array[-1], [99, 198])
+        poly.add_point(99, 198)
+        assert poly.n_points == 100
+
+    def test_removed_point_can_be_added_again(self):
+        poly = Polygon()
+        poly.add_point(1, 2)
+        poly.add_point(3, 4)
+        poly.remove_last()
+        poly.add_point(3, 4)
+        assert poly.points == [[1, 2], [3, 4]]
+
+    def test_get_polygon_transforms_all_points(self):
+        from matplotlib.transforms import Affine2D
+
+        class _Axes:
+            transData = Affine2D().scale(2.0, 3.0)
+
+        poly = Polygon()
+        poly.add_point(1, 2)
+        poly.add_point(3, 4)
+        points = poly.get_polygon(_Axes(), 2.0, 20.0)
+        assert [(p.x(), p.y()) for p in points] == [(1.0, 7.0), (3.0, 4.0)]
+
+    def test_get_mask_is_cached_per_shape(self):
+        poly = Polygon()
+        for x, y in [(2, 2), (8, 2), (8, 6), (2, 6)]:
+            poly.add_point(x, y)
+        mask = poly.get_mask((10, 12))
+        assert mask.shape == (10, 12)
+        assert mask[2:6, 2:8].all()
+        assert mask.sum() == 24
+        assert poly.get_mask((10, 12)) is mask
+        assert poly.get_mask((20, 12)) is not mask
+
+        poly.add_point(5, 9)
+        assert poly.get_mask((10, 12)) is not mask
+
 
 # ---------------------------------------------------------------------------
 # ExtractEvent
@@ -197,6 +245,30 @@ class TestExtractEvent:
         assert isinstance(label, str)
         assert "±" in label
 
+    def test_get_mask_rect(self):
+        evt = ExtractEvent("rect", 2, 5, 1, 3)
+        mask = evt.get_mask((6, 8))
+        assert mask.sum() == 6
+        assert mask[1:3, 2:5].all()
+        assert evt.get_mask((6, 8)) is mask
+        np.testing.assert_array_equal(evt.get_framelist((6, 8)), np.flatnonzero(mask))
+
+    def test_get_mask_circle(self):
+        evt = ExtractEvent("circle", 2, 7, 2, 7)
+        mask = evt.get_mask((10, 10))
+        (r, c), _, _ = evt.get_ellipse()
+        assert mask[round(r), round(c)]
+        assert not mask[0, 0]
+
+    def test_get_mask_poly_uses_polygon_cache(self):
+        poly = Polygon()
+        for x, y in [(1, 1), (5, 1), (5, 5)]:
+            poly.add_point(x, y)
+        evt = ExtractEvent("poly", 0, 0, 0, 0, polygon=poly)
+        mask = evt.get_mask((8, 8))
+        assert mask is poly.get_mask((8, 8))
+        assert evt.get_mask((8, 8), flipud=True)[7 - 4, 4]
+
     def test_get_line_mask(self):
         evt = ExtractEvent("rect", 2, 6, 0, 0)
         mask = evt.get_line_mask(as_int=True)
@@ -240,3 +312,234 @@ def test_vispy_colormaps_returns_list():
     color2 = np.array([0.0, 1.0, 0.0, 1.0])
     cmaps = vispy_colormaps([color1, color2])
     assert len(cmaps) == 2
+
+
+# ---------------------------------------------------------------------------
+# patch groups
+# ---------------------------------------------------------------------------
+
+
+def test_coerce_rectangles_broadcasts_scalars():
+    rectangles = coerce_rectangles([0, 1, 2], 0, [1, 2, 3], 5)
+    np.testing.assert_array_equal(rectangles[:, 1], [0, 0, 0])
+    np.testing.assert_array_equal(rectangles[:, 3], [5, 5, 5])
+    with pytest.raises(ValueError, match="same length"):
+        coerce_rectangles([0, 1], [0, 1, 2], 1, 1)
+
+
+def test_rectangle_vertices():
+    vertices = rectangle_vertices(np.array([[1.0, 2.0, 3.0, 4.0]]))
+    np.testing.assert_array_equal(vertices[0], [[1, 2], [4, 2], [4, 6], [1, 6]])
+
+
+def test_patch_group_updates_by_index():
+    group = PatchGroup("g", coerce_rectangles(np.arange(5), 0, 1, 1), np.array([[1.0, 0, 0, 1]]))
+    assert len(group) == 5
+
+    indices = group.update([0, -1], x=[10, 20], colors=np.array([[0.0, 0, 1, 1]]), visible=False)
+    np.testing.assert_array_equal(indices, [0, 4])
+    np.testing.assert_array_equal(group.rectangles[:, 0], [10, 1, 2, 3, 20])
+    np.testing.assert_array_equal(group.colors[4], [0, 0, 1, 1])
+    np.testing.assert_array_equal(group.display_colors[:, 3], [0, 1, 1, 1, 0])
+    with pytest.raises(ValueError, match="indices"):
+        group.update([0, 1, 2], y=[1, 2])
+
+
+def test_patch_group_update_keeps_alpha_unless_specified():
+    group = PatchGroup("g", coerce_rectangles(np.arange(3), 0, 1, 1), np.array([[1.0, 0, 0, 0.5]]))
+
+    group.update([0], colors=np.array([[0.0, 0, 1, 1]]))
+    np.testing.assert_array_equal(group.colors[0], [0, 0, 1, 0.5])
+    group.update([1, 2], alpha=0.2)
+    np.testing.assert_array_equal(group.colors[1:, 3], [0.2, 0.2])
+    np.testing.assert_array_equal(group.colors[1, :3], [1, 0, 0])
+
+
+# ---------------------------------------------------------------------------
+# classification curves
+# ---------------------------------------------------------------------------
+
+
+def _brute_force_rates(y_true: np.ndarray, scores: np.ndarray, threshold: float) -> tuple[float, float]:
+    predicted = scores >= threshold
+    return (predicted & ~y_true).sum() / (~y_true).sum(), (predicted & y_true).sum() / y_true.sum()
+
+
+def test_score_histogram_roc_matches_thresholding():
+    rng = np.random.default_rng(0)
+    y_true = rng.random(2000) > 0.5
+    scores = np.round(np.clip(y_true * 0.3 + rng.random(2000) * 0.7, 0, 1), 2)
+    histogram = ScoreHistogram.from_scores(y_true, scores, n_bins=100)
+
+    fpr, tpr, thresholds = histogram.roc_curve()
+    assert (fpr[0], tpr[0], fpr[-1], tpr[-1]) == (0, 0, 1, 1)
+    for threshold in (0.29, 0.5, 0.57):
+        index = np.flatnonzero(np.isclose(thresholds, threshold))[0]
+        np.testing.assert_allclose((fpr[index], tpr[index]), _brute_force_rates(y_true, scores, threshold))
+
+    precision, recall, _ = histogram.precision_recall_curve()
+    np.testing.assert_array_equal(recall, tpr)
+    assert precision[0] == 1
+    np.testing.assert_allclose(precision[-1], y_true.mean())
+
+
+def test_score_histogram_accumulates_batches():
+    rng = np.random.default_rng(1)
+    y_true = rng.integers(0, 3, 1000)
+    scores = rng.dirichlet([1, 1, 1], 1000)
+
+    histogram = ScoreHistogram(n_classes=3)
+    histogram.update(y_true[:400], scores[:400])
+    histogram.update(y_true[400:], scores[400:])
+    expected = ScoreHistogram.from_scores(y_true, scores)
+    np.testing.assert_array_equal(histogram.positives, expected.positives)
+    assert histogram.n_samples == 1000
+    with pytest.raises(ValueError, match="one column per class"):
+        histogram.update(y_true, scores[:, :2])
+
+    fpr, tpr, labels = histogram.roc_curves(["a", "b", "c"])
+    assert list(labels) == ["a", "b", "c", "micro", "macro"]
+    assert fpr["macro"][-1] == tpr["macro"][-1] == 1
+
+
+def test_score_histogram_labels_binary_scores_with_positive_class():
+    histogram = ScoreHistogram.from_scores(np.array([0, 1, 1]), np.array([0.2, 0.7, 0.9]), n_bins=10)
+    assert histogram.class_labels(["neg", "pos"]) == ["pos"]
+    fpr, _, names = histogram.roc_curves(["neg", "pos"])
+    assert list(fpr) == list(names) == ["pos"]
+
+
+def test_score_histogram_calibration_curve():
+    y_true = np.array([0, 0, 1, 1, 1, 0])
+    scores = np.array([0.05, 0.15, 0.12, 0.95, 0.91, 0.99])
+    fraction_positive, mean_predicted = ScoreHistogram.from_scores(y_true, scores).calibration_curve(n_bins=10)
+    np.testing.assert_allclose(fraction_positive, [0, 0.5, 2 / 3])
+    np.testing.assert_allclose(mean_predicted, [0.05, 0.135, 0.95])
+    with pytest.raises(ValueError, match="divide"):
+        ScoreHistogram().calibration_curve(n_bins=7)
+
+
+def test_downsample_curve_keeps_endpoints():
+    x = np.r_[np.zeros(1000), np.linspace(0, 1, 1000)]
+    y = np.r_[np.linspace(0, 1, 1000), np.ones(1000)]
+    x_, y_ = downsample_curve(x, y, 10)
+    assert len(x_) < 25
+    np.testing.assert_array_equal(np.c_[x_, y_][[0, -1]], [[0, 0], [1, 1]])
+    assert [0, 1] in np.c_[x_, y_].tolist()
+
+
+# ---------------------------------------------------------------------------
+# distributions
+# ---------------------------------------------------------------------------
+
+
+def test_binned_kde_integrates_to_one():
+    values = np.random.default_rng(0).normal(size=100_000)
+    grid, density = binned_kde(values)
+    assert len(grid) == len(density) == 512
+    np.testing.assert_allclose(np.trapezoid(density, grid), 1, atol=1e-3)
+    np.testing.assert_allclose(density.max(), 1 / np.sqrt(2 * np.pi), rtol=0.02)
+    assert abs(grid[np.argmax(density)]) < 0.1
+
+
+def test_density_capped_subsample():
+    values = np.r_[np.zeros(10_000), np.linspace(1, 2, 20)]
+    sample = density_capped_subsample(values, max_points=1000, max_per_bin=10)
+    assert (sample == 0).sum() == 10
+    assert (sample > 0).sum() == 20
+
+
+def test_summarize_distributions_is_cached():
+    pd = pytest.importorskip("pandas")
+
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"group": np.repeat(["a", "b"], 500), "value": rng.normal(size=1000)})
+    summaries = summarize_distributions(df, "box", x="group", y="value", order=["b", "a"])
+    assert [summary.name for summary in summaries] == ["b", "a"]
+    np.testing.assert_allclose(summaries[1].median, np.median(df["value"][:500]))
+    assert summarize_distributions(df.copy(), "box", x="group", y="value", order=["b", "a"]) is summaries
+
+    df.loc[0, "value"] = 100.0
+    assert summarize_distributions(df, "box", x="group", y="value", order=["b", "a"]) is not summaries
+
+    letter_values = summarize_distributions(df, "boxen", x="group", y="value")[0].letter_values
+    np.testing.assert_allclose(letter_values[0], np.quantile(df["value"][:500], [0.25, 0.75]))
+    assert np.all(np.diff(letter_values[:, 0]) < 0)
+    with pytest.raises(ValueError, match="Distribution kind"):
+        summarize_distributions(df, "swarm")
+
+
+# ---------------------------------------------------------------------------
+# density
+# ---------------------------------------------------------------------------
+
+
+def test_density_aggregator_matches_histogram():
+    x, y = np.random.default_rng(0).normal(size=(2, 200_000))
+    aggregator = DensityAggregator(x, y, grid_size=512)
+    # zoomed in beyond the resolution of the histogram of all points, so the points are binned directly
+    extent = (-0.5, 0.5, -0.25, 0.25)
+    expected, _, _ = np.histogram2d(y, x, bins=(40, 80), range=(extent[2:], extent[:2]))
+    np.testing.assert_array_equal(aggregator.aggregate(extent, (40, 80)), expected)
+
+    # zoomed out, so bins of the histogram of all points are split between pixels
+    extent = (-6.0, 6.0, -6.0, 6.0)
+    counts = aggregator.aggregate(extent, (60, 60))
+    expected, _, _ = np.histogram2d(y, x, bins=(60, 60), range=(extent[2:], extent[:2]))
+    np.testing.assert_allclose(counts.sum(), len(x))
+    assert np.abs(counts - expected).sum() / len(x) < 0.05
+    assert aggregator.aggregate(extent, (60, 60)) is counts
+
+
+def test_density_aggregator_switches_to_markers():
+    x, y = np.random.default_rng(0).normal(size=(2, 10_000))
+    aggregator = DensityAggregator(x, y, threshold=1_000)
+    assert aggregator.is_dense(aggregator.aggregate(aggregator.extent, (100, 100)))
+    extent = (0.0, 0.2, 0.0, 0.2)
+    assert not aggregator.is_dense(aggregator.aggregate(extent, (100, 100)))
+    indices = aggregator.visible_indices(extent)
+    assert np.all((x[indices] >= 0) & (x[indices] <= 0.2) & (y[indices] >= 0) & (y[indices] <= 0.2))
+
+    with pytest.raises(ValueError, match="same length"):
+        DensityAggregator(x, y[:10])
+
+
+def test_density_to_rgba_hides_empty_bins():
+    lut = lookup_table([[0, 0, 0, 1], [1, 1, 1, 1]])
+    rgba = density_to_rgba(np.array([[0, 1], [10, 100]]), lut)
+    assert rgba.dtype == np.uint8
+    assert rgba[0, 0, 3] == 0
+    assert np.all(rgba[[0, 1, 1], [1, 0, 1], 3] == 255)
+    assert rgba[0, 1, 0] < rgba[1, 0, 0] < rgba[1, 1, 0] == 255
+
+
+# ---------------------------------------------------------------------------
+# buffers
+# ---------------------------------------------------------------------------
+
+
+def test_line_buffer_tracks_changed_range():
+    buffer = LineBuffer(capacity=4)
+    buffer.set_data(np.arange(3), np.zeros(3))
+    assert buffer.pop_changed() == (0, 3)
+    assert buffer.pop_changed() is None
+
+    buffer.set_y([0, 5, 0])
+    assert buffer.pop_changed() == (1, 2)
+    buffer.set_data(np.arange(3), [0, 5, 0])
+    assert buffer.pop_changed() is None
+
+    data = buffer.data
+    buffer.set_data(np.arange(4), np.arange(4))
+    assert buffer.data is data
+    assert buffer.pop_changed() == (1, 4)
+
+    y = np.r_[np.arange(4), np.full(6, np.nan)]
+    buffer.set_data(np.arange(10), y)
+    assert buffer.capacity == 10
+    assert buffer.pop_changed() == (4, 10)
+    buffer.set_y(y)
+    assert buffer.pop_changed() is None
+    np.testing.assert_array_equal(buffer.x, np.arange(10))
+    with pytest.raises(ValueError, match="same length"):
+        buffer.set_data(np.arange(3), np.arange(4))
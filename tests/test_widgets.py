@@ -77,3 +77,36 @@ def test_colormap_button_popup_opens_combobox_list(qtbot, monkeypatch) -> None:
     assert button._popup.was_moved
     assert button._popup.was_shown
     assert button._popup.was_raised
+
+
+def test_colormap_thumbnail_is_cached_by_name_and_size(qtbot) -> None:
+    """Previews should be rendered once per colormap and size."""
+    from qtextraplot.utils.colormap import colormap_thumbnail
+
+    image = colormap_thumbnail("viridis", 40, 10)
+    assert (image.width(), image.height()) == (40, 10)
+    assert colormap_thumbnail("viridis", 40, 10) is image
+    assert colormap_thumbnail("viridis", 20, 10) is not image
+
+
+def test_colormap_combobox_renders_previews_lazily(qtbot, monkeypatch) -> None:
+    """Creating a combobox should only render the preview of the selected colormap."""
+    from qtextraplot import helpers
+    from qtextraplot.utils import colormap
+
+    rendered: list[str] = []
+    original = colormap.colormap_thumbnail
+
+    def _thumbnail(name: str, width: int, height: int):
+        rendered.append(name)
+        return original(name, width, height)
+
+    monkeypatch.setattr(colormap, "colormap_thumbnail", _thumbnail)
+
+    widget, _ = helpers.make_colormap_combobox(None, default="viridis")
+    qtbot.addWidget(widget)
+
+    assert widget.currentText() == "viridis"
+    assert rendered == ["viridis"]
+    assert widget.count() == len(AVAILABLE_COLORMAPS)
+    assert isinstance(widget.view().itemDelegate(), helpers.ColormapItemDelegate)